@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: analyse_csv_data Python vs NumPy backend
+Times both backends over growing row counts, for CSV-style string cells and for JSON-style
+numbers, to locate the crossover used by backend='auto' (VECTORIZE_MIN_ROWS).
+
+Usage: python benchmarks/bench_analyzer_backends.py [max_rows]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from analyzers.csv_analyzer import analyse_csv_data, VECTORIZE_MIN_ROWS
+
+def make_rows(rows: int, kind: str):
+    generator = random.Random(0)
+    if kind == "strings":
+        cells = lambda: generator.choice(["", "NA", str(generator.randint(1, 10**6)), f"{generator.random() * 1e5:.2f}"])
+    else:
+        cells = lambda: generator.choice([None, generator.randint(1, 10**6), generator.random() * 1e5])
+    return [{"name": f"Employee {i}", "salary": cells()} for i in range(rows)]
+
+def best_time(func, repeats: int) -> float:
+    """Best-of-3 seconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            func()
+        best = min(best, (time.perf_counter() - start) / repeats)
+    return best
+
+def main():
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sizes = [size for size in (10, 30, 100, 300, 1_000, 10_000, 100_000, 1_000_000) if size <= max_rows]
+    for kind in ("strings", "numbers"):
+        print("="*60)
+        print(f"🔢 analyse_csv_data backends, {kind} cells (auto switches at {VECTORIZE_MIN_ROWS} rows)")
+        print("="*60)
+        for rows in sizes:
+            data = make_rows(rows, kind)
+            repeats = max(1, 200_000 // rows)
+            assert analyse_csv_data(data, "salary", backend="python") == analyse_csv_data(data, "salary", backend="numpy")
+            python_time = best_time(lambda: analyse_csv_data(data, "salary", backend="python"), repeats)
+            numpy_time = best_time(lambda: analyse_csv_data(data, "salary", backend="numpy"), repeats)
+            label = f"{rows:,} rows"
+            print(f"{label:<26} python {python_time * 1e6:10.1f} µs  numpy {numpy_time * 1e6:10.1f} µs  "
+                  f"speedup {python_time / numpy_time:5.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compressed CSV/JSON throughput per codec
+Times write_csv_from_dicts/read_csv_as_dicts and write_json_file/read_json_file for
+plain, gzip, bz2 and xz files at a few compression levels.
+
+Usage: python benchmarks/bench_compression.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts, write_csv_from_dicts
+from file_handlers.json_handler import read_json_file, write_json_file
+
+ROLES = ["Backend Developer", "AI Engineer", "Data Scientist", "DevOps Engineer"]
+LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Hyderabad", "Pune"]
+CODECS = [("plain", "", None), ("gzip", ".gz", 1), ("gzip", ".gz", 6), ("gzip", ".gz", 9),
+          ("bz2", ".bz2", 1), ("bz2", ".bz2", 9), ("xz", ".xz", 0), ("xz", ".xz", 6)]
+
+def make_rows(rows: int):
+    return [{"name": f"Employee {i}", "role": ROLES[i % 4], "experience": str(i % 20),
+             "salary": str(50000 + i % 50000), "location": LOCATIONS[i % 5]} for i in range(rows)]
+
+def bench(label, writer, reader, data, path, level, raw_mb):
+    start = time.perf_counter()
+    writer(data, path, compression_level=level)
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reader(path)
+    read_time = time.perf_counter() - start
+
+    size_mb = path.stat().st_size / 1e6
+    print(f"{label:<12} {size_mb:8.2f} MB  ratio {raw_mb / size_mb:5.1f}x  "
+          f"write {raw_mb / write_time:7.1f} MB/s  read {raw_mb / read_time:7.1f} MB/s")
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    data = make_rows(rows)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        for kind, writer, reader in (("csv", write_csv_from_dicts, read_csv_as_dicts),
+                                     ("json", write_json_file, read_json_file)):
+            plain = temp_path / f"plain.{kind}"
+            writer(data, plain)
+            raw_mb = plain.stat().st_size / 1e6
+
+            print("="*60)
+            print(f"📦 {kind.upper()} codec throughput: {rows:,} rows, {raw_mb:.1f} MB uncompressed")
+            print("="*60)
+            for codec, extension, level in CODECS:
+                label = codec if level is None else f"{codec}-{level}"
+                bench(label, writer, reader, data, temp_path / f"{label}.{kind}{extension}", level, raw_mb)
+
+if __name__ == "__main__":
+    main()
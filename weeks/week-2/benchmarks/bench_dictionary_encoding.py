@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of interned / dictionary-encoded string columns
+Compares the resident size of an employee export loaded as
+  1. plain dict-of-str rows            read_csv_as_dicts(path)
+  2. rows with shared (interned) values read_csv_as_dicts(path, intern_columns="auto")
+  3. columnar category codes           read_csv_as_columns(path)
+
+Usage: python benchmarks/bench_dictionary_encoding.py [rows]
+"""
+
+import csv
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.columnar import read_csv_as_columns
+
+ROLES = ["Backend Developer", "AI Engineer", "Full Stack Developer", "Data Scientist", "DevOps Engineer"]
+LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Hyderabad", "Pune"]
+
+def write_sample(path: Path, rows: int) -> None:
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["name", "role", "experience", "salary", "location"])
+        for i in range(rows):
+            writer.writerow([f"Employee {i}", ROLES[i % 5], i % 20, 50000 + i % 50000, LOCATIONS[i % 7 % 5]])
+
+def measure(label, loader, *args, **kwargs):
+    """Reports load time and the memory still held by the loaded dataset."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = loader(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {held / 1e6:9.1f} MB  {elapsed:7.2f}s")
+    del data
+    return held
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "employees.csv"
+        write_sample(path, rows)
+
+        print("="*60)
+        print(f"🧠 String column memory benchmark: {rows:,} rows")
+        print("="*60)
+        baseline = measure("dict-of-str (current)", read_csv_as_dicts, path)
+        interned = measure('intern_columns="auto"', read_csv_as_dicts, path, intern_columns="auto")
+        columnar = measure("columnar category codes", read_csv_as_columns, path)
+        print("-"*60)
+        print(f"Interned rows use {interned / baseline:.0%} of the baseline, columnar codes {columnar / baseline:.0%}")
+
+if __name__ == "__main__":
+    main()
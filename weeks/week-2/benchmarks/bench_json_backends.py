@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON backend load/dump throughput
+Times loads, indented dumps (write_json_file layout) and compact dumps (write_jsonl layout)
+for every installed backend on a small, a medium and a large document.
+
+Usage: python benchmarks/bench_json_backends.py [large_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.json_backends import available_json_backends, get_json_backend
+
+ROLES = ["Backend Developer", "AI Engineer", "Data Scientist", "DevOps Engineer"]
+LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Hyderabad", "Pune"]
+
+def make_document(rows: int):
+    return {"employees": [{"name": f"Employee {i}", "role": ROLES[i % 4], "experience": i % 20,
+                           "salary": 50000.5 + i % 50000, "location": LOCATIONS[i % 5],
+                           "skills": ["python", "sql"][: i % 3], "manager": None if i % 7 else i - 1}
+                          for i in range(rows)]}
+
+def throughput(func, size_mb, min_seconds=0.5):
+    """MB/s of func(), repeated until at least min_seconds have passed."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_seconds or calls == 0:
+        func()
+        calls += 1
+    return size_mb * calls / elapsed
+
+def main():
+    large_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    sizes = [("small", 5), ("medium", 5_000), ("large", large_rows)]
+    stdlib = get_json_backend('stdlib')
+
+    print("="*60)
+    print(f"⚡ JSON backends: {', '.join(available_json_backends())}")
+    print("="*60)
+    for size_name, rows in sizes:
+        document = make_document(rows)
+        text = stdlib.dumps(document, indent=2)
+        size_mb = len(text) / 1e6
+        print(f"\n{size_name} ({rows:,} records, {size_mb * 1000:,.1f} KB)")
+        for name in available_json_backends():
+            backend = get_json_backend(name)
+            loads = throughput(lambda: backend.loads(text), size_mb)
+            indented = throughput(lambda: backend.dumps(document, indent=2), size_mb)
+            compact = throughput(lambda: backend.dumps(document, compact=True), size_mb)
+            label = f"{name} ({'identical' if backend.dumps(document, indent=2) == text else 'differs'})"
+            print(f"{label:<26} loads {loads:8.1f} MB/s  dumps {indented:8.1f} MB/s  compact {compact:8.1f} MB/s")
+
+if __name__ == "__main__":
+    main()
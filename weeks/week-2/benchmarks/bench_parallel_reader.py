@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: read_csv_parallel vs read_csv_as_dicts
+Generates a synthetic employee CSV and times both readers for several worker counts.
+
+Usage: python benchmarks/bench_parallel_reader.py [rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.parallel_reader import read_csv_parallel
+
+ROLES = ["Backend Developer", "AI Engineer", "Data Scientist", "DevOps Engineer"]
+LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Hyderabad", "Pune"]
+
+def write_sample(path: Path, rows: int) -> None:
+    """Writes an employee-shaped CSV with `rows` records."""
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["name", "role", "experience", "salary", "location"])
+        for i in range(rows):
+            writer.writerow([f"Employee {i}", ROLES[i % 4], i % 20, 50000 + i % 50000, LOCATIONS[i % 5]])
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "employees.csv"
+        write_sample(path, rows)
+        size_mb = path.stat().st_size / 1e6
+
+        print("="*60)
+        print(f"📊 Parallel CSV reader benchmark: {rows:,} rows, {size_mb:.1f} MB, {os.cpu_count()} CPUs")
+        print("="*60)
+
+        baseline, expected = timed(read_csv_as_dicts, path)
+        print(f"{'read_csv_as_dicts':<26} {baseline:8.3f}s  {rows / baseline:12,.0f} rows/s")
+
+        for workers in (1, 2, 4, 8):
+            elapsed, result = timed(read_csv_parallel, path, workers=workers)
+            assert result == expected, "parallel reader returned different rows"
+            print(f"{f'read_csv_parallel(w={workers})':<26} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/s  x{baseline / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: QuantileSketch accuracy and memory vs exact np.percentile
+Streams generated values in chunks; the exact side keeps every value, the sketch keeps O(k log n).
+Reports the rank error of p50/p90/p99, peak traced memory and time for a few k values.
+
+Usage: python benchmarks/bench_quantiles.py [values]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from analyzers.quantiles import QuantileSketch
+
+QUANTILES = (0.5, 0.9, 0.99)
+CHUNK = 100_000
+
+def chunks(distribution: str, total: int):
+    generator = np.random.default_rng(42)
+    for start in range(0, total, CHUNK):
+        size = min(CHUNK, total - start)
+        if distribution == "normal":
+            yield generator.normal(75_000, 15_000, size)
+        else:
+            yield generator.lognormal(11, 0.8, size)
+
+def traced(func):
+    """(result, seconds, peak MB) of func()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def exact(distribution, total):
+    values = np.concatenate(list(chunks(distribution, total)))
+    return np.sort(values), np.percentile(values, [q * 100 for q in QUANTILES])
+
+def sketched(distribution, total, k):
+    sketch = QuantileSketch(k=k, seed=0)
+    for chunk in chunks(distribution, total):
+        sketch.update(chunk)
+    return sketch
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for distribution in ("normal", "lognormal"):
+        (sorted_values, _), exact_time, exact_peak = traced(lambda: exact(distribution, total))
+        print("="*60)
+        print(f"📐 {distribution} values: {total:,}")
+        print("="*60)
+        print(f"{'np.percentile (exact)':<26} rank error 0.0000  {exact_time:6.2f}s  peak {exact_peak:8.1f} MB")
+        for k in (50, 200, 800):
+            sketch, sketch_time, sketch_peak = traced(lambda: sketched(distribution, total, k))
+            errors = [abs(np.searchsorted(sorted_values, estimate) / total - q)
+                      for q, estimate in zip(QUANTILES, sketch.quantiles_at(QUANTILES))]
+            label = f"sketch k={k} ({sketch.retained} kept)"
+            print(f"{label:<26} rank error {max(errors):.4f}  {sketch_time:6.2f}s  peak {sketch_peak:8.1f} MB"
+                  f"  (bound {sketch.rank_error:.4f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark: write_csv_sharded vs write_csv_from_dicts
+Times a single-writer CSV export against sharded exports with several worker counts.
+
+Usage: python benchmarks/bench_sharded_writer.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import write_csv_from_dicts
+from file_handlers.sharded_writer import write_csv_sharded
+
+ROLES = ["Backend Developer", "AI Engineer", "Data Scientist", "DevOps Engineer"]
+LOCATIONS = ["Mumbai", "Bangalore", "Delhi", "Hyderabad", "Pune"]
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = [{"name": f"Employee {i}", "role": ROLES[i % 4], "experience": i % 20,
+             "salary": 50000 + i % 50000, "location": LOCATIONS[i % 5]} for i in range(rows)]
+
+    print("="*60)
+    print(f"✍️  Sharded CSV writer benchmark: {rows:,} rows, {os.cpu_count()} CPUs")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        write_csv_from_dicts(data, Path(temp_dir) / "single.csv")
+        baseline = time.perf_counter() - start
+        print(f"{'write_csv_from_dicts':<26} {baseline:8.3f}s  {rows / baseline:12,.0f} rows/s")
+
+        for shards in (1, 2, 4, 8):
+            start = time.perf_counter()
+            write_csv_sharded(data, Path(temp_dir) / f"shards-{shards}", shards=shards)
+            elapsed = time.perf_counter() - start
+            print(f"{f'write_csv_sharded(n={shards})':<26} {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/s  x{baseline / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -17,9 +17,9 @@ from pathlib import Path
 src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from src.file_handlers.csv_handler import read_csv_as_dicts, write_csv_from_dicts
+from src.file_handlers.csv_handler import read_csv_as_dicts, iter_csv_chunks, write_csv_from_dicts
 from src.file_handlers.json_handler import read_json_file, write_json_file
-from src.analyzers.csv_analyzer import analyse_csv_data
+from src.analyzers.csv_analyzer import analyse_csv_columns, analyse_csv_chunks
 
 def main():
     """Main demonstration function for Week 2 concepts."""
@@ -54,11 +54,14 @@ def main():
     print("   - Error handling: consistent across modules")
     print("\n" + "="*60)
 
-    # Analyze salary data
+    # Analyze salary and experience data in one pass over the rows
+    report = analyse_csv_columns(employees, ["salary", "experience"])
+    columns = report["columns"] if report else {}
+
     print("\n💰 SALARY ANALYSIS:")
-    salary_stats = analyse_csv_data(employees, "salary")
+    salary_stats = columns.get("salary")
     if salary_stats:
-        print(f"  • Total employees: {salary_stats['row_count']}")
+        print(f"  • Total employees: {report['row_count']}")
         print(f"  • Valid salary records: {salary_stats.get('non_null_count', 'N/A')}")
         print(f"  • Average salary: ${salary_stats.get('mean', 0):,.2f}")
         print(f"  • Minimum salary: ${salary_stats.get('min', 0):,.2f}")
@@ -66,13 +69,26 @@ def main():
     
     # Analyze experience data
     print("\n📈 EXPERIENCE ANALYSIS:")
-    exp_stats = analyse_csv_data(employees, "experience")
+    exp_stats = columns.get("experience")
     if exp_stats:
         print(f"  • Valid experience records: {exp_stats.get('non_null_count', 'N/A')}")
         print(f"  • Average experience: {exp_stats.get('mean', 0):.1f} years")
         print(f"  • Minimum experience: {exp_stats.get('min', 0)} years")
         print(f"  • Maximum experience: {exp_stats.get('max', 0)} years")
     
+    # Streaming analysis - rows are read in batches, so memory stays flat for huge exports
+    print("\n🌊 STREAMING SALARY ANALYSIS (chunked reader):")
+    stream_stats = analyse_csv_chunks(iter_csv_chunks(str(data_path), chunk_size=2), "salary")
+    if stream_stats:
+        print(f"  • Rows streamed: {stream_stats['row_count']}")
+        print(f"  • Average salary: ${stream_stats.get('mean', 0):,.2f}")
+    
+    # Projection + predicate pushdown - only the requested fields of matching rows are built
+    print("\n🎯 PUSHDOWN QUERY (salary > 80,000, name + salary only):")
+    high_earners = read_csv_as_dicts(str(data_path), columns=["name", "salary"], where=[("salary", ">", 80000)])
+    for emp in high_earners or []:
+        print(f"  • {emp['name']}: ${float(emp['salary']):,.2f}")
+    
     print("\n" + "="*50)
     print("🎉 Week 2 Mini-task: CSV Summarizer - COMPLETED!")
     print("✅ Professional data analysis with error handling")
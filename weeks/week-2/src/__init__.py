@@ -17,12 +17,63 @@ __version__ = "1.0.0"
 __author__ = "Abhi"
 
 # Make key functions available at package level
-from .file_handlers.json_handler import read_json_file, write_json_file
-from .file_handlers.csv_handler import read_csv_as_dicts, write_csv_from_dicts
+from .file_handlers.json_backends import available_json_backends, get_json_backend, set_json_backend
+from .file_handlers.json_cache import JSONReadCache, read_json_cached, json_cache_stats, clear_json_cache, thaw
+from .file_handlers.json_writer import JSONWriteBehind, write_json_file_deferred, flush_json_writes
+from .file_handlers.json_handler import read_json_file, write_json_file, iter_jsonl, write_jsonl, iter_json_array
+from .file_handlers.csv_handler import read_csv_as_dicts, iter_csv_rows, iter_csv_chunks, write_csv_from_dicts, CSVStreamWriter
+from .file_handlers.row_types import make_row_type, column_values
+from .file_handlers.columnar import ColumnarData, read_csv_as_columns, read_json_as_columns, records_to_columns
+from .file_handlers.parallel_reader import read_csv_parallel
+from .file_handlers.csv_cache import read_csv_cached, clear_csv_cache
+from .file_handlers.sharded_writer import write_csv_sharded, concat_csv_shards
+from .file_handlers.csv_index import build_csv_index, read_csv_rows
+from .file_handlers.csv_tail import CSVTailReader
+from .file_handlers.multi_file_loader import load_csv_files, iter_csv_files
+from .file_handlers.async_handlers import aread_csv_as_dicts, awrite_csv_from_dicts, aread_json_file, awrite_json_file, aread_jsonl, aread_many
 
 __all__ = [
     'read_json_file',
     'write_json_file', 
+    'iter_jsonl',
+    'write_jsonl',
+    'iter_json_array',
+    'available_json_backends',
+    'get_json_backend',
+    'set_json_backend',
+    'JSONReadCache',
+    'read_json_cached',
+    'json_cache_stats',
+    'clear_json_cache',
+    'thaw',
+    'JSONWriteBehind',
+    'write_json_file_deferred',
+    'flush_json_writes',
     'read_csv_as_dicts',
-    'write_csv_from_dicts'
+    'iter_csv_rows',
+    'iter_csv_chunks',
+    'write_csv_from_dicts',
+    'CSVStreamWriter',
+    'make_row_type',
+    'column_values',
+    'ColumnarData',
+    'read_csv_as_columns',
+    'read_json_as_columns',
+    'records_to_columns',
+    'read_csv_parallel',
+    'read_csv_cached',
+    'clear_csv_cache',
+    'write_csv_sharded',
+    'concat_csv_shards',
+    'load_csv_files',
+    'iter_csv_files',
+    'build_csv_index',
+    'read_csv_rows',
+    'CSVTailReader',
+    'aread_csv_as_dicts',
+    'awrite_csv_from_dicts',
+    'aread_json_file',
+    'aread_jsonl',
+    'awrite_json_file',
+    'aread_many'
 ]
\ No newline at end of file
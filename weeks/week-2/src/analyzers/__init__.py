@@ -3,10 +3,20 @@ Data Analyzers Module
 
 Provides utilities for analyzing and processing data:
 - CSV statistical analysis (avg, min, max, median)
+- Mergeable streaming statistics (Welford mean/variance) for chunked and parallel runs
+- Bounded-memory approximate quantiles (KLL sketch: median, p90, p99)
+- Hash-based group-by aggregation with mergeable per-group partials
 - Data validation and cleaning
 - Report generation
 """
 
-# Will implement CSV analyzer here for Week 2 mini-task
+from .stats import RunningStats
+from .quantiles import QuantileSketch
+from .group_by import GroupByAggregator, group_by
 
-__all__ = []
\ No newline at end of file
+__all__ = [
+    'RunningStats',
+    'QuantileSketch',
+    'GroupByAggregator',
+    'group_by',
+]
\ No newline at end of file
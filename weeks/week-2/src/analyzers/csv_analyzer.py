@@ -1,8 +1,11 @@
 import csv
 import sys
 import os
+from itertools import filterfalse
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Iterable
+
+import numpy as np
 
 # Add the parent directory to the path so we can import our modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,9 +13,68 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.row_types import column_values
+from analyzers.quantiles import QuantileSketch
+
+# Parsed values are handed to a column's quantile sketch in batches of this size
+SKETCH_BATCH = 4096
+# backend='auto' switches to NumPy from this many rows (crossover measured by benchmarks/bench_analyzer_backends.py)
+VECTORIZE_MIN_ROWS = 200
+ANALYSIS_BACKENDS = ('auto', 'python', 'numpy')
+_NULL_CELLS = frozenset((None, '', 'NA'))
+# Builtin sum() adds floats strictly left to right before Python 3.12, exactly like np.cumsum
+_SEQUENTIAL_SUM = sys.version_info < (3, 12)
+
+
+def _column_stats_python(non_null_values: List[Any]) -> Dict[str, Any]:
+    """non_null_count/mean/min/max with a float() per cell (the reference implementation)."""
+    stats = {"non_null_count": len(non_null_values)}
+    if non_null_values:
+        try:
+            numeric_values = [float(value) for value in non_null_values]
+            stats["mean"] = sum(numeric_values) / len(numeric_values)
+            stats["min"] = min(numeric_values)
+            stats["max"] = max(numeric_values)
+        except ValueError:
+            stats["mean"] = stats["min"] = stats["max"] = "N/A (non-numeric data)"
+    else:
+        stats["mean"] = stats["min"] = stats["max"] = "N/A (no non-null values)"
+    return stats
+
+
+def _column_stats_numpy(csv_data: List[Dict[str, Any]], column_name: str) -> Dict[str, Any]:
+    """Same result as _column_stats_python: the column is converted once to float64 and reduced by NumPy."""
+    cells = column_values(csv_data, column_name)
+    try:
+        non_null_values = list(filterfalse(_NULL_CELLS.__contains__, cells))
+    except TypeError:  # unhashable cells (lists/dicts from JSON)
+        return _column_stats_python([value for value in cells if value not in (None, '', 'NA')])
+    if not non_null_values:
+        return _column_stats_python(non_null_values)
+
+    try:
+        numbers = np.array(non_null_values, dtype=np.float64)  # float() rules per element
+    except ValueError:
+        return {"non_null_count": len(non_null_values), "mean": "N/A (non-numeric data)",
+                "min": "N/A (non-numeric data)", "max": "N/A (non-numeric data)"}
+    if numbers.ndim != 1 or np.isnan(numbers).any():
+        # Nested values or NaN cells: Python's min/max semantics differ from NumPy's, use the reference path
+        return _column_stats_python(non_null_values)
+
+    # Sum in the Python backend's order; np.sum's pairwise order would change the last bits of the mean
+    total = float(np.cumsum(numbers)[-1]) if _SEQUENTIAL_SUM else sum(numbers.tolist())
+    return {
+        "non_null_count": len(non_null_values),
+        "mean": total / numbers.size,
+        "min": float(numbers.min()),
+        "max": float(numbers.max()),
+    }
+
+def analyse_csv_data(csv_data: List[Dict[str, Any]], column_name: str, backend: str = 'auto') -> Optional[Dict[str, Any]]:
+    """Reads a CSV file and provides basic analysis like row count and column names.
 
-def analyse_csv_data(csv_data: List[Dict[str, Any]], column_name: str) -> Optional[Dict[str, Any]]:
-    """Reads a CSV file and provides basic analysis like row count and column names."""
+    backend: 'python', 'numpy' (vectorized, identical results) or 'auto' (NumPy from VECTORIZE_MIN_ROWS rows).
+    """
 
     if csv_data is not None:
         if not csv_data:
@@ -28,19 +90,17 @@ def analyse_csv_data(csv_data: List[Dict[str, Any]], column_name: str) -> Option
             "column_names": column_names,
         }
 
+        if backend not in ANALYSIS_BACKENDS:
+            raise ValueError(f"Unsupported backend '{backend}'. Use one of: {', '.join(ANALYSIS_BACKENDS)}")
+        if backend == 'auto':
+            backend = 'numpy' if row_count >= VECTORIZE_MIN_ROWS else 'python'
+
         if column_name in column_names:
-            non_null_values = [row[column_name] for row in csv_data if row[column_name] not in (None, '', 'NA')]
-            analysis["non_null_count"] = len(non_null_values)
-            if non_null_values:
-                try:
-                    numeric_values = [float(value) for value in non_null_values]
-                    analysis["mean"] = sum(numeric_values) / len(numeric_values)
-                    analysis["min"] = min(numeric_values)
-                    analysis["max"] = max(numeric_values)
-                except ValueError:
-                    analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (non-numeric data)"
+            if backend == 'numpy':
+                analysis.update(_column_stats_numpy(csv_data, column_name))
             else:
-                analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (no non-null values)"
+                non_null_values = [value for value in column_values(csv_data, column_name) if value not in (None, '', 'NA')]
+                analysis.update(_column_stats_python(non_null_values))
         else:
             print(f"Column '{column_name}' not found in the CSV file.")
         
@@ -49,6 +109,155 @@ def analyse_csv_data(csv_data: List[Dict[str, Any]], column_name: str) -> Option
     return None
 
 
+def analyse_csv_chunks(chunks: Iterable[List[Dict[str, Any]]], column_name: str) -> Optional[Dict[str, Any]]:
+    """Same analysis as analyse_csv_data, but consumes row batches (e.g. from iter_csv_chunks) with flat memory."""
+
+    row_count = 0
+    column_names = None
+    non_null_count = 0
+    total = 0
+    minimum = maximum = None
+    non_numeric = False
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if column_names is None:
+            column_names = list(chunk[0].keys())
+        row_count += len(chunk)
+
+        if column_name not in column_names:
+            continue
+
+        for row in chunk:
+            value = row[column_name]
+            if value in (None, '', 'NA'):
+                continue
+            non_null_count += 1
+            if non_numeric:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                non_numeric = True
+                continue
+            total += number
+            if minimum is None or number < minimum:
+                minimum = number
+            if maximum is None or number > maximum:
+                maximum = number
+
+    if column_names is None:
+        print("The CSV file is empty.")
+        return None
+
+    analysis = {
+        "row_count": row_count,
+        "column_names": column_names,
+    }
+
+    if column_name in column_names:
+        analysis["non_null_count"] = non_null_count
+        if non_null_count == 0:
+            analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (no non-null values)"
+        elif non_numeric:
+            analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (non-numeric data)"
+        else:
+            analysis["mean"] = total / non_null_count
+            analysis["min"] = minimum
+            analysis["max"] = maximum
+    else:
+        print(f"Column '{column_name}' not found in the CSV file.")
+
+    return analysis
+
+
+def analyse_csv_columns(csv_data: List[Dict[str, Any]], column_names: Optional[List[str]] = None,
+                        quantiles: bool = False) -> Optional[Dict[str, Any]]:
+    """Analyses many columns in a single pass over the rows (every numeric column when none are named).
+
+    Returns row_count, column_names and a "columns" dict holding, per column, the same
+    non_null_count/mean/min/max that analyse_csv_data reports for it. quantiles=True adds
+    approximate median/p90/p99 from a bounded-memory QuantileSketch.
+    """
+
+    if csv_data is None:
+        return None
+    if not csv_data:
+        print("The CSV file is empty.")
+        return None
+
+    all_columns = list(csv_data[0].keys())
+    auto_detect = column_names is None
+    targets = []
+    for column_name in all_columns if auto_detect else column_names:
+        if column_name in all_columns:
+            targets.append(column_name)
+        else:
+            print(f"Column '{column_name}' not found in the CSV file.")
+
+    # Per column: [non_null_count, total, min, max, is_numeric, values waiting for the sketch]
+    states = {column_name: [0, 0, None, None, True, []] for column_name in targets}
+    sketches = {column_name: QuantileSketch() for column_name in targets} if quantiles else None
+    # Columns still being parsed; auto-detection stops tracking a column at its first non-numeric value
+    live = list(states.items())
+
+    for row in csv_data:
+        dropped = False
+        for column_name, state in live:
+            value = row[column_name]
+            if value in (None, '', 'NA'):
+                continue
+            state[0] += 1
+            if not state[4]:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                state[4] = False
+                dropped = auto_detect
+                continue
+            state[1] += number
+            if state[2] is None or number < state[2]:
+                state[2] = number
+            if state[3] is None or number > state[3]:
+                state[3] = number
+            if sketches is not None:
+                state[5].append(number)
+                if len(state[5]) >= SKETCH_BATCH:
+                    sketches[column_name].update_numbers(state[5])
+                    state[5] = []
+        if dropped:
+            live = [(column_name, state) for column_name, state in live if state[4]]
+
+    columns = {}
+    for column_name, (non_null_count, total, minimum, maximum, is_numeric, pending) in states.items():
+        if auto_detect and not (is_numeric and non_null_count):
+            continue
+        stats = {"non_null_count": non_null_count}
+        if non_null_count == 0:
+            stats["mean"] = stats["min"] = stats["max"] = "N/A (no non-null values)"
+        elif not is_numeric:
+            stats["mean"] = stats["min"] = stats["max"] = "N/A (non-numeric data)"
+        else:
+            stats["mean"] = total / non_null_count
+            stats["min"] = minimum
+            stats["max"] = maximum
+        if sketches is not None:
+            if isinstance(stats["mean"], str):
+                stats["median"] = stats["p90"] = stats["p99"] = stats["mean"]
+            else:
+                sketches[column_name].update_numbers(pending)
+                stats["median"], stats["p90"], stats["p99"] = sketches[column_name].quantiles_at((0.5, 0.9, 0.99))
+        columns[column_name] = stats
+
+    return {
+        "row_count": len(csv_data),
+        "column_names": all_columns,
+        "columns": columns,
+    }
+
+
 if __name__ == "__main__":
     print("=== CSV Analyzer Demo ===\n")
     
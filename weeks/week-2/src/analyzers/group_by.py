@@ -0,0 +1,169 @@
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .quantiles import QuantileSketch
+from .stats import RunningStats, numeric_cells
+
+# Aggregations answered by RunningStats, and the quantile ones answered by a QuantileSketch
+STAT_AGGREGATIONS = ('count', 'null_count', 'sum', 'mean', 'min', 'max', 'var', 'std')
+QUANTILE_AGGREGATIONS = {'median': 0.5, 'p90': 0.9, 'p99': 0.99}
+# Raw cells are buffered per group and column, then folded into the accumulators in batches
+GROUP_BATCH = 1024
+
+AggSpec = Dict[str, Union[str, Sequence[str]]]
+
+
+class _ColumnAccumulator:
+    """RunningStats (+ QuantileSketch when a quantile is asked for) for one column of one group."""
+    __slots__ = ('stats', 'sketch', 'pending')
+
+    def __init__(self, with_quantiles: bool):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch() if with_quantiles else None
+        self.pending: List[Any] = []
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        numbers, null_count, non_numeric_count = numeric_cells(self.pending)
+        self.pending = []
+        self.stats.null_count += null_count
+        self.stats.non_numeric_count += non_numeric_count
+        self.stats.update_numbers(numbers)
+        if self.sketch is not None:
+            self.sketch.update_numbers(numbers)
+
+    def merge(self, other: '_ColumnAccumulator') -> None:
+        self.flush()
+        other.flush()
+        self.stats.merge(other.stats)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def value(self, aggregation: str) -> Any:
+        stats = self.stats
+        if aggregation == 'count':
+            return stats.count + stats.non_numeric_count  # non-null cells, like analyse_csv_data's non_null_count
+        if aggregation == 'null_count':
+            return stats.null_count
+        if stats.non_numeric_count:
+            return "N/A (non-numeric data)"
+        if stats.count == 0:
+            return "N/A (no non-null values)"
+        if aggregation in QUANTILE_AGGREGATIONS:
+            return self.sketch.quantile(QUANTILE_AGGREGATIONS[aggregation])
+        return {
+            'sum': stats.total,
+            'mean': stats.mean,
+            'min': stats.min,
+            'max': stats.max,
+            'var': stats.variance,
+            'std': stats.std,
+        }[aggregation]
+
+
+def _normalize_aggs(aggs: Optional[AggSpec]) -> Dict[str, Tuple[str, ...]]:
+    normalized = {}
+    for column, aggregations in (aggs or {}).items():
+        aggregations = (aggregations,) if isinstance(aggregations, str) else tuple(aggregations)
+        for aggregation in aggregations:
+            if aggregation not in STAT_AGGREGATIONS and aggregation not in QUANTILE_AGGREGATIONS:
+                supported = ', '.join(STAT_AGGREGATIONS + tuple(QUANTILE_AGGREGATIONS))
+                raise ValueError(f"Unsupported aggregation '{aggregation}' for column '{column}'. Use one of: {supported}")
+        normalized[column] = aggregations
+    return normalized
+
+
+class GroupByAggregator:
+    """Hash aggregation of row dicts by one or more key columns, with mergeable partial results.
+
+    Each group holds a row count plus, per aggregated column, a RunningStats (and a
+    QuantileSketch for median/p90/p99). Workers can aggregate their own chunk of rows and
+    the parent merges the (picklable) partials:
+
+        partial = GroupByAggregator(["location"], {"salary": ["mean", "max"]}).update(chunk)
+        total.merge(partial)
+        rows = total.result()
+    """
+
+    def __init__(self, keys: Sequence[str], aggs: Optional[AggSpec] = None):
+        if isinstance(keys, str):
+            keys = [keys]
+        if not keys:
+            raise ValueError("group_by needs at least one key column.")
+        self.keys = list(keys)
+        self.aggs = _normalize_aggs(aggs)
+        self._columns = list(self.aggs)
+        self._with_quantiles = {column: any(aggregation in QUANTILE_AGGREGATIONS for aggregation in aggregations)
+                                for column, aggregations in self.aggs.items()}
+        # group key tuple -> [row_count, {column: _ColumnAccumulator}]
+        self._groups: Dict[Tuple[Any, ...], List[Any]] = {}
+
+    def _new_group(self) -> List[Any]:
+        return [0, {column: _ColumnAccumulator(self._with_quantiles[column]) for column in self._columns}]
+
+    def update(self, rows: Iterable[Dict[str, Any]]) -> 'GroupByAggregator':
+        """Adds rows in a single pass: one dict lookup per row to find its group."""
+        key_of = itemgetter(*self.keys)
+        single_key = len(self.keys) == 1
+        groups = self._groups
+        columns = self._columns
+
+        for row in rows:
+            key = key_of(row)
+            if single_key:
+                key = (key,)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = self._new_group()
+            group[0] += 1
+            accumulators = group[1]
+            for column in columns:
+                accumulator = accumulators[column]
+                accumulator.pending.append(row[column])
+                if len(accumulator.pending) >= GROUP_BATCH:
+                    accumulator.flush()
+        return self
+
+    def merge(self, other: 'GroupByAggregator') -> 'GroupByAggregator':
+        """Folds in a partial aggregate built with the same keys and aggs (e.g. by another worker)."""
+        if other.keys != self.keys or other.aggs != self.aggs:
+            raise ValueError("Can only merge aggregators with the same keys and aggs.")
+        for key, (row_count, accumulators) in other._groups.items():
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = self._new_group()
+            group[0] += row_count
+            for column, accumulator in accumulators.items():
+                group[1][column].merge(accumulator)
+        return self
+
+    def result(self) -> List[Dict[str, Any]]:
+        """One dict per group (first-seen order): the key columns, row_count and '<column>_<agg>' values."""
+        results = []
+        for key, (row_count, accumulators) in self._groups.items():
+            result = dict(zip(self.keys, key))
+            result["row_count"] = row_count
+            for column, aggregations in self.aggs.items():
+                accumulator = accumulators[column]
+                accumulator.flush()
+                for aggregation in aggregations:
+                    result[f"{column}_{aggregation}"] = accumulator.value(aggregation)
+            results.append(result)
+        return results
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+
+def group_by(data: Iterable[Dict[str, Any]], keys: Sequence[str], aggs: Optional[AggSpec] = None) -> List[Dict[str, Any]]:
+    """Groups rows by the key column(s) and aggregates columns per group in one hash-aggregation pass.
+
+    aggs maps a column to one or more of: count, null_count, sum, mean, min, max, var, std,
+    median, p90, p99 (quantiles are approximate). Nulls ('', 'NA', None) are skipped like in
+    analyse_csv_data, and count is the number of non-null cells, numeric or not.
+
+        group_by(employees, keys=["location"], aggs={"salary": ["mean", "max"], "experience": "mean"})
+        # [{"location": "Mumbai", "row_count": 2, "salary_mean": 92500.0, ...}, ...]
+    """
+    return GroupByAggregator(keys, aggs).update(data).result()
@@ -0,0 +1,194 @@
+import math
+import random
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .stats import numeric_cells
+
+DEFAULT_K = 200
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+# Capacity shrink factor between levels (the KLL paper's c)
+_SHRINK = 2 / 3
+
+
+def rank_error_for_k(k: int) -> float:
+    """Approximate normalized rank error (99% confidence) of a KLL sketch with parameter k."""
+    return 2.296 / k ** 0.9723
+
+
+def k_for_rank_error(epsilon: float) -> int:
+    """Smallest k whose approximate rank error is at most epsilon (e.g. 0.01 -> about 270)."""
+    return max(8, math.ceil((2.296 / epsilon) ** (1 / 0.9723)))
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch (KLL) with bounded memory.
+
+    Keeps O(k log(n/k)) values instead of all n, and answers any quantile within a rank error of
+    about rank_error_for_k(k) (~1.3% for the default k=200): the reported p99 lies between the
+    true p97.7 and p100. Pass epsilon instead of k to size it for a target error. Sketches
+    built over different chunks or workers merge into one with the same guarantee.
+
+        sketch = QuantileSketch(epsilon=0.01)
+        for chunk in iter_csv_chunks("employees.csv"):
+            sketch.update(row["salary"] for row in chunk)
+        print(sketch.quantiles())  # {'p50': ..., 'p90': ..., 'p99': ...}
+    """
+
+    def __init__(self, k: Optional[int] = None, epsilon: Optional[float] = None, seed: Optional[int] = None):
+        if k is not None and epsilon is not None:
+            raise ValueError("Pass either k or epsilon, not both.")
+        self.k = k_for_rank_error(epsilon) if epsilon is not None else (k or DEFAULT_K)
+        if self.k < 2:
+            raise ValueError("k must be at least 2.")
+        self.count = 0
+        self.null_count = 0
+        self.non_numeric_count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._random = random.Random(seed)
+        self._levels: List[List[float]] = [[]]  # level h holds values of weight 2**h
+        self._retained = 0
+        self._max_retained = self._capacity_total()
+
+    @property
+    def rank_error(self) -> float:
+        return rank_error_for_k(self.k)
+
+    @property
+    def retained(self) -> int:
+        """Number of values currently stored (the sketch's memory footprint)."""
+        return self._retained
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * _SHRINK ** depth))
+
+    def _capacity_total(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _add_level(self) -> None:
+        self._levels.append([])
+        self._max_retained = self._capacity_total()
+
+    def _compress(self) -> None:
+        """Halves the lowest full level: sort, keep every other value (random offset), promote them one level."""
+        for level in range(len(self._levels)):
+            items = self._levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._add_level()
+                items.sort()
+                keep_last = items.pop() if len(items) % 2 else None
+                self._levels[level + 1].extend(items[self._random.randint(0, 1)::2])
+                self._levels[level] = [] if keep_last is None else [keep_last]
+                self._retained = sum(len(items) for items in self._levels)
+                if self._retained < self._max_retained:
+                    return
+
+    def update_numbers(self, numbers: Sequence[float]) -> None:
+        """Adds already-parsed, non-NaN floats as a list or float array (skips the null/type checks of update())."""
+        if len(numbers) == 0:
+            return
+        self.count += len(numbers)
+        if isinstance(numbers, np.ndarray):
+            low, high = float(numbers.min()), float(numbers.max())
+        else:
+            low, high = min(numbers), max(numbers)
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+        if len(numbers) > self.k:
+            self._add_large_batch(numbers)
+        else:
+            self._levels[0].extend(numbers.tolist() if isinstance(numbers, np.ndarray) else numbers)
+            self._retained += len(numbers)
+        while self._retained >= self._max_retained:
+            self._compress()
+
+    def _add_large_batch(self, numbers: Sequence[float]) -> None:
+        """Compacts a big batch with NumPy before it joins the sketch.
+
+        The sorted batch is halved (random offset) until it is no bigger than k, one weight level
+        per halving, exactly like repeated compactions of a single oversized level.
+        """
+        batch = np.sort(np.asarray(numbers, dtype=np.float64))
+        level = 0
+        while batch.size > self.k:
+            if len(self._levels) <= level + 1:
+                self._add_level()
+            if batch.size % 2:
+                self._levels[level].append(float(batch[-1]))
+                batch = batch[:-1]
+            batch = batch[self._random.randint(0, 1)::2]
+            level += 1
+        self._levels[level].extend(batch.tolist())
+        self._retained = sum(len(items) for items in self._levels)
+
+    def update(self, values: Iterable[Any]) -> 'QuantileSketch':
+        """Adds a batch of raw cells or a NumPy / masked array (nulls and non-numeric cells are counted, not used)."""
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+            array = np.ma.asarray(values, dtype=np.float64).ravel()
+            valid = ~np.ma.getmaskarray(array) & ~np.isnan(np.ma.getdata(array))
+            numbers = np.ma.getdata(array)[valid]
+            self.null_count += int(valid.size - numbers.size)
+        else:
+            numbers, null_count, non_numeric_count = numeric_cells(values)
+            self.null_count += null_count
+            self.non_numeric_count += non_numeric_count
+        self.update_numbers(numbers)
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Folds another sketch (e.g. from a different chunk or worker) into this one."""
+        while len(self._levels) < len(other._levels):
+            self._add_level()
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self.count += other.count
+        self.null_count += other.null_count
+        self.non_numeric_count += other.non_numeric_count
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self._retained = sum(len(items) for items in self._levels)
+        while self._retained >= self._max_retained:
+            self._compress()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1); exact min/max at the ends, None when empty."""
+        return self.quantiles_at([q])[0]
+
+    def quantiles_at(self, qs: Sequence[float]) -> List[Optional[float]]:
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            return [None] * len(qs)
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self._levels) for value in items)
+        values = [value for value, _ in weighted]
+        cumulative = list(accumulate(weight for _, weight in weighted))
+        total = cumulative[-1]
+        results = []
+        for q in qs:
+            if q == 0:
+                results.append(self.min)
+            elif q == 1:
+                results.append(self.max)
+            else:
+                results.append(values[min(bisect_left(cumulative, q * total), len(values) - 1)])
+        return results
+
+    def quantiles(self, qs: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """Named quantiles, by default {'p50': ..., 'p90': ..., 'p99': ...}."""
+        return {f"p{q * 100:g}": value for q, value in zip(qs, self.quantiles_at(qs))}
+
+    @property
+    def median(self) -> Optional[float]:
+        return self.quantile(0.5)
+
+    def __repr__(self) -> str:
+        return f"QuantileSketch(k={self.k}, count={self.count}, retained={self._retained})"
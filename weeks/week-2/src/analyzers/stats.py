@@ -0,0 +1,170 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Cells the analyzer treats as missing (same rule as analyse_csv_data)
+NULL_VALUES = (None, '', 'NA')
+
+
+def numeric_cells(values: Iterable[Any]) -> Tuple[List[float], int, int]:
+    """Splits raw cells into (numbers, null_count, non_numeric_count); NaN counts as null."""
+    numbers = []
+    null_count = 0
+    non_numeric_count = 0
+    for value in values:
+        if value in NULL_VALUES:
+            null_count += 1
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            non_numeric_count += 1
+            continue
+        if math.isnan(number):
+            null_count += 1
+        else:
+            numbers.append(number)
+    return numbers, null_count, non_numeric_count
+
+
+class RunningStats:
+    """Mergeable online statistics: count, sum, mean, variance/std (via M2), min, max and null count.
+
+    update() folds in a batch of raw cells (strings, numbers, None) or a NumPy / masked
+    array; merge() combines accumulators from other chunks, shards or processes. Batches are
+    reduced with a two-pass mean/M2 and combined with Chan et al.'s parallel form of
+    Welford's update, so results stay stable for large counts and large offsets.
+
+        stats = RunningStats()
+        for chunk in iter_csv_chunks("employees.csv"):
+            stats.update(row["salary"] for row in chunk)
+        print(stats.mean, stats.std)
+    """
+    __slots__ = ('count', '_total', '_total_error', 'mean', 'm2', 'min', 'max', 'null_count', 'non_numeric_count')
+
+    def __init__(self, values: Optional[Iterable[Any]] = None):
+        self.count = 0
+        self._total = 0.0
+        self._total_error = 0.0  # Neumaier compensation for the batch totals added so far
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.null_count = 0
+        self.non_numeric_count = 0
+        if values is not None:
+            self.update(values)
+
+    def update(self, values: Iterable[Any]) -> 'RunningStats':
+        """Adds a batch of values; nulls ('', 'NA', None, NaN, masked) and non-numeric cells are counted, not used."""
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+            return self._update_array(values)
+
+        numbers, null_count, non_numeric_count = numeric_cells(values)
+        self.null_count += null_count
+        self.non_numeric_count += non_numeric_count
+        return self.update_numbers(numbers)
+
+    def update_numbers(self, numbers: List[float]) -> 'RunningStats':
+        """Adds already-parsed, non-NaN floats (skips the null/type checks of update())."""
+        if numbers:
+            batch_total = math.fsum(numbers)
+            batch_mean = batch_total / len(numbers)
+            batch_m2 = math.fsum((number - batch_mean) ** 2 for number in numbers)
+            self._combine(len(numbers), batch_total, batch_mean, batch_m2, min(numbers), max(numbers))
+        return self
+
+    def _update_array(self, values: np.ndarray) -> 'RunningStats':
+        numbers = np.ma.asarray(values, dtype=np.float64).ravel()
+        valid = ~np.ma.getmaskarray(numbers) & ~np.isnan(np.ma.getdata(numbers))
+        numbers = np.ma.getdata(numbers)[valid]
+        self.null_count += int(valid.size - numbers.size)
+        if numbers.size:
+            batch_total = math.fsum(numbers.tolist())  # exact like update_numbers; numbers.sum() is pairwise
+            batch_mean = batch_total / numbers.size
+            batch_m2 = float(np.square(numbers - batch_mean).sum())
+            self._combine(int(numbers.size), batch_total, batch_mean, batch_m2, float(numbers.min()), float(numbers.max()))
+        return self
+
+    def _combine(self, count: int, total: float, mean: float, m2: float,
+                 minimum: Optional[float], maximum: Optional[float]) -> None:
+        """Chan et al. pairwise combination of (count, mean, M2) plus sum/min/max."""
+        if count == 0:
+            return
+        combined_count = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined_count
+        self.m2 += m2 + delta * delta * self.count * count / combined_count
+        self.count = combined_count
+        partial = self._total + total
+        if abs(self._total) >= abs(total):
+            self._total_error += (self._total - partial) + total
+        else:
+            self._total_error += (total - partial) + self._total
+        self._total = partial
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Folds another accumulator (e.g. from a different chunk or worker) into this one."""
+        self._combine(other.count, other._total, other.mean, other.m2, other.min, other.max)
+        self._total_error += other._total_error
+        self.null_count += other.null_count
+        self.non_numeric_count += other.non_numeric_count
+        return self
+
+    def __add__(self, other: 'RunningStats') -> 'RunningStats':
+        if not isinstance(other, RunningStats):
+            return NotImplemented
+        return RunningStats().merge(self).merge(other)
+
+    @property
+    def total(self) -> float:
+        """Sum of the values; batch totals are combined with compensated (Neumaier) addition."""
+        return self._total + self._total_error
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1); NaN with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def population_variance(self) -> float:
+        """Population variance (ddof=0); NaN when empty."""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "null_count": self.null_count,
+            "non_numeric_count": self.non_numeric_count,
+            "sum": self.total,
+            "mean": self.mean if self.count else None,
+            "variance": self.variance,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def to_analysis(self) -> Dict[str, Any]:
+        """The per-column fields of analyse_csv_data (non_null_count, mean, min, max), including its N/A markers."""
+        analysis = {"non_null_count": self.count + self.non_numeric_count}
+        if analysis["non_null_count"] == 0:
+            analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (no non-null values)"
+        elif self.non_numeric_count:
+            analysis["mean"] = analysis["min"] = analysis["max"] = "N/A (non-numeric data)"
+        else:
+            analysis["mean"] = self.mean
+            analysis["min"] = self.min
+            analysis["max"] = self.max
+        return analysis
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(count={self.count}, mean={self.mean!r}, std={self.std!r}, "
+                f"min={self.min!r}, max={self.max!r}, null_count={self.null_count})")
@@ -3,18 +3,87 @@ File Handlers Module
 
 Provides utilities for handling different file formats:
 - JSON files with error handling and type safety
-- CSV files with dictionary-based access
+- JSON Lines streaming (batched reads, append-mode writes, bad lines skipped)
+- Incremental element-by-element parsing of huge top-level JSON arrays
+- Pluggable JSON backend (orjson/ujson when installed, stdlib fallback)
+- Memoizing read-only JSON cache with byte-budgeted LRU eviction
+- Write-behind JSON writer that coalesces rewrites and replaces files atomically
+- CSV files with dictionary-based access (full, streaming or chunked)
+- Compact __slots__ record / tuple rows with dict-style access
+- Columnar CSV / JSON-records loads into typed NumPy arrays with null masks
+- Parallel CSV parsing over a memory-mapped file
+- Opt-in binary (.npy) sidecar cache for repeatedly-read CSV files
+- Transparent gzip/bz2/xz compression for all readers and writers
+- Sharded multi-process CSV writing with manifest and concatenation
+- Parallel multi-file / glob CSV loading
+- Byte-offset row index for random access into large CSV files
+- Incremental tail reader for append-only CSV logs
+- Asyncio wrappers and a concurrent bulk loader
 
 Renamed from 'readers' to 'file_handlers' to better reflect 
 the bidirectional nature of operations (both reading AND writing).
 """
 
-from .json_handler import read_json_file, write_json_file
-from .csv_handler import read_csv_as_dicts, write_csv_from_dicts
+from .compression import detect_compression, open_file
+from .json_backends import available_json_backends, get_json_backend, set_json_backend
+from .json_cache import JSONReadCache, read_json_cached, json_cache_stats, clear_json_cache, thaw
+from .json_writer import JSONWriteBehind, write_json_file_deferred, flush_json_writes
+from .json_handler import read_json_file, write_json_file, iter_jsonl, write_jsonl, iter_json_array
+from .csv_handler import read_csv_as_dicts, iter_csv_rows, iter_csv_chunks, write_csv_from_dicts, CSVStreamWriter
+from .row_types import make_row_type, column_values
+from .columnar import ColumnarData, read_csv_as_columns, read_json_as_columns, records_to_columns
+from .parallel_reader import read_csv_parallel
+from .csv_cache import read_csv_cached, clear_csv_cache
+from .sharded_writer import write_csv_sharded, concat_csv_shards
+from .csv_index import build_csv_index, read_csv_rows
+from .csv_tail import CSVTailReader
+from .multi_file_loader import load_csv_files, iter_csv_files
+from .async_handlers import aread_csv_as_dicts, awrite_csv_from_dicts, aread_json_file, awrite_json_file, aread_jsonl, aread_many
 
 __all__ = [
+    'detect_compression',
+    'open_file',
     'read_json_file',
     'write_json_file',
+    'iter_jsonl',
+    'write_jsonl',
+    'iter_json_array',
+    'available_json_backends',
+    'get_json_backend',
+    'set_json_backend',
+    'JSONReadCache',
+    'read_json_cached',
+    'json_cache_stats',
+    'clear_json_cache',
+    'thaw',
+    'JSONWriteBehind',
+    'write_json_file_deferred',
+    'flush_json_writes',
     'read_csv_as_dicts', 
-    'write_csv_from_dicts'
+    'iter_csv_rows',
+    'iter_csv_chunks',
+    'write_csv_from_dicts',
+    'CSVStreamWriter',
+    'make_row_type',
+    'column_values',
+    'ColumnarData',
+    'read_csv_as_columns',
+    'read_json_as_columns',
+    'records_to_columns',
+    'read_csv_parallel',
+    'read_csv_cached',
+    'clear_csv_cache',
+    'write_csv_sharded',
+    'concat_csv_shards',
+    'load_csv_files',
+    'iter_csv_files',
+    'build_csv_index',
+    'read_csv_rows',
+    'CSVTailReader',
+    'aread_csv_as_dicts',
+    'awrite_csv_from_dicts',
+    'aread_json_file',
+    'aread_jsonl',
+    'awrite_json_file',
+    'aread_many'
 ]
\ No newline at end of file
@@ -0,0 +1,98 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Union, List, Dict, Any, Optional, Sequence, Callable
+
+from .compression import CODECS
+from .csv_handler import read_csv_as_dicts, write_csv_from_dicts
+from .json_handler import read_json_file, write_json_file, iter_jsonl
+
+# Blocking file calls run on one shared, bounded thread pool so the event loop never stalls
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="file-handlers")
+    return _executor
+
+
+def set_max_workers(max_workers: int) -> None:
+    """Replaces the shared executor with one of the given size (running calls finish on the old one)."""
+    global _executor
+    old_executor, _executor = _executor, ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-handlers")
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+
+
+async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+async def aread_csv_as_dicts(file_path: Union[str, Path], **options) -> Optional[List[Dict[str, Any]]]:
+    """Async read_csv_as_dicts; accepts the same keyword options (columns, where, compression)."""
+    return await _run_blocking(read_csv_as_dicts, file_path, **options)
+
+
+async def awrite_csv_from_dicts(data: List[Dict[str, Any]], file_path: Union[str, Path], **options) -> bool:
+    """Async write_csv_from_dicts."""
+    return await _run_blocking(write_csv_from_dicts, data, file_path, **options)
+
+
+async def aread_json_file(file_path: Union[str, Path], **options) -> dict | list | None:
+    """Async read_json_file."""
+    return await _run_blocking(read_json_file, file_path, **options)
+
+
+async def awrite_json_file(data: Any, file_path: Union[str, Path], **options) -> bool:
+    """Async write_json_file."""
+    return await _run_blocking(write_json_file, data, file_path, **options)
+
+
+def _read_jsonl(file_path: Union[str, Path], **options) -> Optional[List[Any]]:
+    stats = options.pop('stats', None)
+    stats = {} if stats is None else stats
+    records = list(iter_jsonl(file_path, stats=stats, **options))
+    return None if stats["failed"] else records
+
+
+async def aread_jsonl(file_path: Union[str, Path], **options) -> Optional[List[Any]]:
+    """Async JSON Lines read; returns all valid records as a list (bad lines are skipped), or None if the file cannot be read."""
+    return await _run_blocking(_read_jsonl, file_path, **options)
+
+
+def _reader_for(file_path: Union[str, Path]) -> Callable:
+    """Picks the async reader from the extension, looking through a compression suffix (data.json.gz)."""
+    path = Path(file_path)
+    if any(path.suffix.lower() in extensions for extensions, _ in CODECS.values()):
+        path = path.with_suffix('')
+    readers = {'.json': aread_json_file, '.jsonl': aread_jsonl}
+    return readers.get(path.suffix.lower(), aread_csv_as_dicts)
+
+
+async def aread_many(file_paths: Sequence[Union[str, Path]], limit: int = 16) -> List[Any]:
+    """Loads many CSV/JSON files concurrently, at most `limit` at a time.
+
+    Like asyncio.gather, results come back in the order of file_paths; a file that fails to
+    load gives None (the error is printed by the underlying reader).
+    """
+    if limit < 1:
+        raise ValueError("limit must be a positive integer.")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def load(file_path):
+        async with semaphore:
+            return await _reader_for(file_path)(file_path)
+
+    return await asyncio.gather(*(load(file_path) for file_path in file_paths))
+
+
+if __name__ == "__main__":
+    results = asyncio.run(aread_many(["../../data/sample.csv", "../../data/sample.json"]))
+    for name, result in zip(["sample.csv", "sample.json"], results):
+        print(f"{name}: {len(result) if result else 0} records")
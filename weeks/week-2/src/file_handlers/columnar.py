@@ -0,0 +1,192 @@
+import csv
+import json
+from pathlib import Path
+from typing import Union, List, Dict, Optional, Any, Iterable
+
+import numpy as np
+
+from .compression import open_file
+from .csv_handler import _resolve_path
+from .json_handler import read_json_file
+
+# Same null markers the analyzer filters out ('' and 'NA'; None never appears in parsed CSV text)
+NULL_MARKERS = ('', 'NA')
+
+
+class ColumnarData(dict):
+    """Maps column name -> np.ma.MaskedArray (mask=True marks a null cell).
+
+    Numeric columns are int64/float64. String columns are stored as small integer
+    codes into ``categories[column]``; null string cells get code -1.
+    """
+
+    def __init__(self, columns: Dict[str, np.ma.MaskedArray], categories: Optional[Dict[str, np.ndarray]] = None):
+        super().__init__(columns)
+        self.categories = categories or {}
+
+    @property
+    def row_count(self) -> int:
+        return len(next(iter(self.values()))) if self else 0
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.keys())
+
+    def is_categorical(self, column: str) -> bool:
+        return column in self.categories
+
+    def decode(self, column: str) -> np.ma.MaskedArray:
+        """Returns the original string values of a category-coded column."""
+        codes = self[column]
+        return np.ma.MaskedArray(self.categories[column][codes.filled(0)], mask=codes.mask)
+
+
+def _code_dtype(category_count: int) -> np.dtype:
+    """Smallest signed integer dtype that can hold every code plus the -1 null code."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if category_count <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def infer_column(raw_values: List[str]):
+    """Converts raw string cells into a typed masked array, inferring int64 -> float64 -> category.
+
+    Returns (masked_array, categories); categories is None for numeric columns, otherwise a
+    sorted object array (no fixed-width string array, so one long cell does not widen every row).
+    """
+    mask = np.fromiter((value in NULL_MARKERS for value in raw_values), dtype=bool, count=len(raw_values))
+    present = [value for value in raw_values if value not in NULL_MARKERS]
+
+    if not present:
+        return np.ma.MaskedArray(np.zeros(len(raw_values), dtype=np.float64), mask=mask), None
+
+    for dtype in (np.int64, np.float64):
+        try:
+            values = np.zeros(len(raw_values), dtype=dtype)
+            values[~mask] = np.array(present, dtype=dtype)
+            return np.ma.MaskedArray(values, mask=mask), None
+        except (ValueError, OverflowError):
+            continue
+
+    categories = sorted(set(present))
+    positions = {category: code for code, category in enumerate(categories)}
+    codes = np.full(len(raw_values), -1, dtype=_code_dtype(len(categories)))
+    codes[~mask] = np.fromiter(map(positions.__getitem__, present), dtype=codes.dtype, count=len(present))
+    return np.ma.MaskedArray(codes, mask=mask), np.array(categories, dtype=object)
+
+
+def read_csv_as_columns(file_path: Union[str, Path], compression: Optional[str] = 'infer') -> Optional[ColumnarData]:
+    """Reads a CSV file column-wise into typed NumPy arrays with null masks (dtypes inferred once at load)."""
+    try:
+        with open_file(_resolve_path(file_path), mode='r', compression=compression, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return ColumnarData({})
+
+            raw_columns = [[] for _ in header]
+            width = len(header)
+            for row in reader:
+                if len(row) < width:
+                    row = row + [''] * (width - len(row))
+                for raw, value in zip(raw_columns, row):
+                    raw.append(value)
+
+        columns = {}
+        categories = {}
+        for name, raw in zip(header, raw_columns):
+            columns[name], column_categories = infer_column(raw)
+            if column_categories is not None:
+                categories[name] = column_categories
+        return ColumnarData(columns, categories)
+
+    except FileNotFoundError as fnf_error:
+        print(f"Error: The file {file_path} was not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to read {file_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+    return None
+
+
+def _cell_text(value: Any) -> str:
+    """The text a JSON value would have as a CSV cell (None -> '', nested values as compact JSON)."""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'))
+    return str(value)
+
+
+def _infer_json_column(values: List[Any]):
+    """infer_column for parsed JSON values: all-int / int+float columns skip the text round trip.
+
+    Anything else (strings, bools, nested values) is typed from its CSV text, so a JSON load and a
+    CSV load of the same records give the same dtypes, masks and categories.
+    """
+    mask = np.fromiter((value is None or (type(value) is str and value in NULL_MARKERS) for value in values),
+                       dtype=bool, count=len(values))
+    types = {type(value) for value, null in zip(values, mask) if not null}
+    if types and types <= {int, float}:
+        dtype = np.int64 if types == {int} else np.float64
+        try:
+            data = np.array([0 if null else value for value, null in zip(values, mask)], dtype=dtype)
+            return np.ma.MaskedArray(data, mask=mask), None
+        except OverflowError:
+            pass  # ints beyond int64: same fallback as the CSV path
+    return infer_column([_cell_text(value) for value in values])
+
+
+def records_to_columns(records: Iterable[Dict[str, Any]]) -> ColumnarData:
+    """Converts flat records (dicts, e.g. from read_json_file or iter_jsonl) into a ColumnarData in one pass.
+
+    Fields are ordered by first appearance; a record missing a field gets a null cell.
+    """
+    raw_columns: Dict[str, List[Any]] = {}
+    row_count = 0
+    for record in records:
+        if not isinstance(record, dict):
+            raise ValueError(f"Expected a list of JSON objects, found {type(record).__name__} at record {row_count}.")
+        for name in record:
+            if name not in raw_columns:
+                raw_columns[name] = [None] * row_count
+        for name, raw in raw_columns.items():
+            raw.append(record.get(name))
+        row_count += 1
+
+    columns = {}
+    categories = {}
+    for name, raw in raw_columns.items():
+        columns[name], column_categories = _infer_json_column(raw)
+        if column_categories is not None:
+            categories[name] = column_categories
+    return ColumnarData(columns, categories)
+
+
+def read_json_as_columns(file_path: Union[str, Path], compression: Optional[str] = 'infer',
+                         backend: Optional[str] = None) -> Optional[ColumnarData]:
+    """Reads a JSON array of flat records column-wise; the result is interchangeable with read_csv_as_columns."""
+    records = read_json_file(file_path, compression=compression, backend=backend)
+    if records is None:
+        return None
+    if not isinstance(records, list):
+        print(f"Error: The file {file_path} does not contain a list of records.")
+        return None
+    try:
+        return records_to_columns(records)
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+    return None
+
+
+if __name__ == "__main__":
+    columns = read_csv_as_columns("../../data/sample.csv")
+    if columns:
+        for name, values in columns.items():
+            kind = f"category ({len(columns.categories[name])} values)" if columns.is_categorical(name) else str(values.dtype)
+            print(f"{name:<12} {kind:<22} nulls={int(values.mask.sum())}")
+        print(f"\nMean salary: {columns['salary'].mean():,.2f}")
@@ -0,0 +1,74 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import Union, Optional, IO
+
+# Codec name -> (file extensions, magic bytes at the start of the file)
+CODECS = {
+    'gzip': (('.gz', '.gzip'), b'\x1f\x8b'),
+    'bz2': (('.bz2',), b'BZh'),
+    'xz': (('.xz', '.lzma'), b'\xfd7zXZ\x00'),
+}
+# 'BZh' alone is plain ASCII (a CSV header can start with it), so bz2 also needs the
+# block-size digit and the first block magic (or the end-of-stream marker of an empty stream)
+_BZ2_BLOCK_MAGICS = (b'1AY&SY', b'\x17rE8P\x90')
+_MAGIC_BYTES_LENGTH = len(b'BZh9') + len(_BZ2_BLOCK_MAGICS[0])
+
+
+def _is_bz2_header(head: bytes) -> bool:
+    return len(head) == _MAGIC_BYTES_LENGTH and head[3] in b'123456789' and head[4:] in _BZ2_BLOCK_MAGICS
+
+
+def _compression_from_extension(file_path: Union[str, Path]) -> Optional[str]:
+    suffix = Path(file_path).suffix.lower()
+    for codec, (extensions, _) in CODECS.items():
+        if suffix in extensions:
+            return codec
+    return None
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """Returns 'gzip', 'bz2', 'xz' or None, from the file extension first and then the file's magic bytes."""
+    codec = _compression_from_extension(file_path)
+    if codec:
+        return codec
+
+    try:
+        with open(file_path, 'rb') as binary_file:
+            head = binary_file.read(_MAGIC_BYTES_LENGTH)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    for codec, (_, magic) in CODECS.items():
+        if head.startswith(magic) and (codec != 'bz2' or _is_bz2_header(head)):
+            return codec
+    return None
+
+
+def open_file(file_path: Union[str, Path], mode: str = 'r', compression: Optional[str] = 'infer',
+              compression_level: Optional[int] = None, **text_options) -> IO:
+    """Opens a plain or compressed file with a streaming codec.
+
+    compression: 'infer' (extension, then magic bytes), None for a plain file, or 'gzip' / 'bz2' / 'xz'.
+    compression_level: gzip/bz2 compresslevel (1-9) or xz preset (0-9); codec default when None.
+    text_options (newline, encoding, errors) are passed through in text mode.
+    """
+    if compression == 'infer':
+        # Only existing files have magic bytes to sniff; new files go by extension
+        compression = detect_compression(file_path) if 'r' in mode else _compression_from_extension(file_path)
+    if compression is None:
+        return open(file_path, mode, **text_options)
+    if compression not in CODECS:
+        raise ValueError(f"Unsupported compression '{compression}'. Use one of: {', '.join(CODECS)}")
+
+    # Codec openers default to binary; make text mode explicit so text_options apply
+    if 'b' not in mode and 't' not in mode:
+        mode += 't'
+    if compression == 'gzip':
+        level = {} if compression_level is None else {'compresslevel': compression_level}
+        return gzip.open(file_path, mode, **level, **text_options)
+    if compression == 'bz2':
+        level = {} if compression_level is None else {'compresslevel': compression_level}
+        return bz2.open(file_path, mode, **level, **text_options)
+    level = {} if compression_level is None or 'r' in mode else {'preset': compression_level}  # lzma rejects a preset when reading
+    return lzma.open(file_path, mode, **level, **text_options)
@@ -1,9 +1,186 @@
 import csv
+import io
+import operator
+from itertools import islice
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Iterator, Iterable, Sequence, Tuple
 
-def read_csv_as_dicts(file_path: Union[str, Path]) -> Optional[List[Dict[str, Any]]]:
-    """Reads CSV file and returns list of dictionaries (each row as dict)."""
+from .compression import open_file
+from .row_types import ROW_TYPES, make_row_type
+
+# A where-condition is (column, op, value), e.g. ("location", "==", "Pune") or ("salary", ">", 80000)
+Condition = Tuple[str, str, Any]
+
+# intern_columns="auto" stops sharing a column's values once it has more distinct values than this
+DEFAULT_MAX_CARDINALITY = 1000
+
+_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    'in': lambda cell, values: cell in values,
+}
+
+def _resolve_path(file_path: Union[str, Path]) -> Path:
+    """Resolves relative paths against this module's directory (same rule as the readers below)."""
+    if Path(file_path).is_absolute():
+        return Path(file_path)
+    return Path(__file__).parent / file_path
+
+def _compile_conditions(index: Dict[str, int], where: Sequence[Condition]) -> List[Tuple[int, Any, Any, bool]]:
+    """Turns (column, op, value) conditions into (position, compare, value, numeric) checks on raw rows."""
+    checks = []
+    for column, op, value in where:
+        if column not in index:
+            raise ValueError(f"Column '{column}' in where clause not found in the CSV header.")
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'. Use one of: {', '.join(_OPERATORS)}")
+        if op == 'in' and not isinstance(value, str):
+            # ("experience", "in", [3, 5]): numbers compare against the parsed cell, like > and <
+            value = list(value)
+            numbers = [_is_number(item) for item in value]
+            numeric = bool(value) and all(numbers)
+            if any(numbers) and not numeric:
+                raise ValueError(f"The 'in' values for column '{column}' mix numbers and strings.")
+            if numeric:
+                value = frozenset(value)
+        else:
+            numeric = _is_number(value)
+        checks.append((index[column], _OPERATORS[op], value, numeric))
+    return checks
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _row_matches(row: List[str], checks: List[Tuple[int, Any, Any, bool]]) -> bool:
+    """Evaluates compiled checks against a raw csv.reader row; null or non-numeric cells never match numeric checks."""
+    for position, compare, value, numeric in checks:
+        if position >= len(row):
+            return False
+        cell = row[position]
+        if numeric:
+            if cell in ('', 'NA'):
+                return False
+            try:
+                cell = float(cell)
+            except ValueError:
+                return False
+        if not compare(cell, value):
+            return False
+    return True
+
+def _projected_values(csvfile: Iterable[str], columns: Optional[Sequence[str]] = None,
+                      where: Optional[Sequence[Condition]] = None) -> Tuple[List[str], Iterator[List[Any]]]:
+    """Reads the header and returns (fieldnames, iterator of value lists) with projection/predicate pushdown.
+
+    Filtered rows and unselected fields are never copied; short rows are padded with None like csv.DictReader.
+    """
+    reader = csv.reader(csvfile)
+    header = next(reader, None)
+    if header is None:
+        return [], iter(())
+
+    index = {name: position for position, name in enumerate(header)}
+    columns = header if columns is None else list(columns)
+    missing = [column for column in columns if column not in index]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in the CSV header.")
+    positions = [index[column] for column in columns]
+    checks = _compile_conditions(index, where or [])
+    width = max(positions, default=-1) + 1
+    full_rows = positions == list(range(len(header)))
+
+    def values() -> Iterator[List[Any]]:
+        for row in reader:
+            if not row:
+                continue  # csv.DictReader skips blank lines too
+            if checks and not _row_matches(row, checks):
+                continue
+            if full_rows and len(row) == width:
+                yield row
+            elif len(row) >= width:
+                yield [row[position] for position in positions]
+            else:
+                yield [row[position] if position < len(row) else None for position in positions]
+
+    return columns, values()
+
+def _share_values(value_lists: Iterable[List[Any]], fieldnames: Sequence[str], intern_columns: Union[str, Sequence[str]],
+                  max_cardinality: int = DEFAULT_MAX_CARDINALITY) -> Iterator[List[Any]]:
+    """Interns column values in place through a per-column value table, so every row points at
+    one shared str per distinct value instead of its own copy.
+
+    With intern_columns="auto" every column starts out shared and is dropped (its value table
+    freed) as soon as it exceeds max_cardinality distinct values, so ids and salaries are left alone.
+    A single column name may be passed as a plain string.
+    """
+    auto = intern_columns == "auto"
+    if not auto:
+        intern_columns = [intern_columns] if isinstance(intern_columns, str) else list(intern_columns)
+        missing = [column for column in intern_columns if column not in fieldnames]
+        if missing:
+            raise ValueError(f"Intern columns {missing} not found in the selected CSV columns.")
+    tables = {position: {} for position, name in enumerate(fieldnames) if auto or name in intern_columns}
+    for values in value_lists:
+        too_many = []
+        for position, table in tables.items():
+            value = values[position]
+            if value is None:
+                continue
+            values[position] = table.setdefault(value, value)
+            if auto and len(table) > max_cardinality:
+                too_many.append(position)
+        for position in too_many:
+            del tables[position]
+        yield values
+
+def _select_rows(csvfile: Iterable[str], columns: Optional[Sequence[str]] = None,
+                 where: Optional[Sequence[Condition]] = None, row_type: str = 'dict',
+                 intern_columns: Optional[Union[str, Sequence[str]]] = None,
+                 max_cardinality: int = DEFAULT_MAX_CARDINALITY) -> Iterator[Any]:
+    """Parses rows into dicts, or compact records/tuples (see row_types), applying pushdown and interning."""
+    if row_type == 'dict' and columns is None and not where and not intern_columns:
+        yield from csv.DictReader(csvfile)
+        return
+
+    if row_type not in ROW_TYPES:
+        raise ValueError(f"Unsupported row_type '{row_type}'. Use one of: {', '.join(ROW_TYPES)}")
+
+    fieldnames, values = _projected_values(csvfile, columns, where)
+    if intern_columns:
+        values = _share_values(values, fieldnames, intern_columns, max_cardinality)
+
+    if row_type == 'dict':
+        for row_values in values:
+            yield dict(zip(fieldnames, row_values))
+    else:
+        yield from map(make_row_type(tuple(fieldnames), row_type), values)
+
+def read_csv_as_dicts(file_path: Union[str, Path], columns: Optional[Sequence[str]] = None,
+                      where: Optional[Sequence[Condition]] = None,
+                      compression: Optional[str] = 'infer',
+                      intern_columns: Optional[Union[str, Sequence[str]]] = None,
+                      max_cardinality: int = DEFAULT_MAX_CARDINALITY,
+                      row_type: str = 'dict') -> Optional[List[Dict[str, Any]]]:
+    """Reads CSV file and returns list of dictionaries (each row as dict).
+
+    .gz/.bz2/.xz files (detected by extension or magic bytes) are decompressed while streaming.
+
+    Optional pushdown: `columns` keeps only those fields and `where` keeps only rows matching
+    every (column, op, value) condition, e.g. where=[("location", "==", "Pune"), ("salary", ">", 80000)].
+
+    intern_columns=["role", "location"] (or "auto" to detect columns with at most max_cardinality
+    distinct values) stores one shared string per distinct value instead of one per row.
+
+    row_type="record" (__slots__ objects) or "tuple" (tuples sharing one header) cut the per-row
+    dict overhead; both still support row["salary"], row.salary, row.get() and row.keys().
+    They take about a quarter less memory than dicts. row["salary"] is slower than on a dict,
+    so column scans should go through column_values(), as analyse_csv_data does: with it,
+    record rows analyse about as fast as dicts and tuple rows within ~1.3x on 300k rows.
+    """
     try:
         if Path(file_path).is_absolute():
             full_path = Path(file_path)
@@ -11,9 +188,8 @@ def read_csv_as_dicts(file_path: Union[str, Path]) -> Optional[List[Dict[str, An
             script_dir = Path(__file__).parent
             full_path = script_dir / file_path
         #newline='' parameter - This is important for CSV files! Shows you understand CSV nuances
-        with open(full_path, mode='r', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            data = [dict(row) for row in reader]
+        with open_file(full_path, mode='r', compression=compression, newline='') as csvfile:
+            data = list(_select_rows(csvfile, columns, where, row_type, intern_columns, max_cardinality))
         return data
     
     except FileNotFoundError as fnf_error:
@@ -25,8 +201,38 @@ def read_csv_as_dicts(file_path: Union[str, Path]) -> Optional[List[Dict[str, An
     
     return None
 
-def write_csv_from_dicts(data: List[Dict[str, Any]], file_path: Union[str, Path], fieldnames: Optional[List[str]] = None) -> bool:
-    """Writes list of dictionaries to CSV file."""
+def iter_csv_rows(file_path: Union[str, Path], columns: Optional[Sequence[str]] = None,
+                  where: Optional[Sequence[Condition]] = None,
+                  compression: Optional[str] = 'infer', row_type: str = 'dict') -> Iterator[Dict[str, Any]]:
+    """Yields CSV rows one at a time as dictionaries (or row_type records), keeping memory flat for large files."""
+    try:
+        with open_file(_resolve_path(file_path), mode='r', compression=compression, newline='') as csvfile:
+            yield from _select_rows(csvfile, columns, where, row_type)
+    
+    except FileNotFoundError as fnf_error:
+        print(f"Error: The file {file_path} was not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to read {file_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+def iter_csv_chunks(file_path: Union[str, Path], chunk_size: int = 10_000, columns: Optional[Sequence[str]] = None,
+                    where: Optional[Sequence[Condition]] = None,
+                    compression: Optional[str] = 'infer') -> Iterator[List[Dict[str, Any]]]:
+    """Yields CSV rows in batches (lists) of at most chunk_size dictionaries."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    rows = iter_csv_rows(file_path, columns, where, compression)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def write_csv_from_dicts(data: Iterable[Dict[str, Any]], file_path: Union[str, Path], fieldnames: Optional[List[str]] = None,
+                         compression: Optional[str] = 'infer', compression_level: Optional[int] = None) -> bool:
+    """Writes dictionaries (a list or any iterator) to CSV file (compressed when the name ends in .gz/.bz2/.xz)."""
     try:
         if Path(file_path).is_absolute():
             full_path = Path(file_path)
@@ -37,16 +243,18 @@ def write_csv_from_dicts(data: List[Dict[str, Any]], file_path: Union[str, Path]
         # Create parent directories if they don't exist
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not fieldnames and data:
-            fieldnames = list(data[0].keys())
+        rows = iter(data)
+        first_row = next(rows, None)
+        if not fieldnames and first_row is not None:
+            fieldnames = list(first_row.keys())
 
         if not fieldnames:
             raise ValueError("No fieldnames provided and data is empty.")
 
-        with open(full_path, mode='w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        with CSVStreamWriter(full_path, fieldnames, compression=compression, compression_level=compression_level) as writer:
+            if first_row is not None:
+                writer.write_row(first_row)
+                writer.write_rows(rows)
         return True
     
     except PermissionError as perm_error:
@@ -56,6 +264,107 @@ def write_csv_from_dicts(data: List[Dict[str, Any]], file_path: Union[str, Path]
     
     return False
 
+class CSVStreamWriter:
+    """Incremental CSV writer for pipelines: feed it rows, iterators or batches as they are produced.
+
+    Rows are formatted into an in-memory buffer and written out once it reaches buffer_size
+    characters, on flush() and on close(). With append=True new rows go after the existing ones
+    and the header is only written for a new/empty file (fieldnames default to the existing header).
+
+        with CSVStreamWriter("output/results.csv", append=True) as writer:
+            for batch in iter_csv_chunks("input.csv"):
+                writer.write_rows(process(batch))
+    """
+
+    def __init__(self, file_path: Union[str, Path], fieldnames: Optional[Sequence[str]] = None, append: bool = False,
+                 buffer_size: int = 1 << 16, compression: Optional[str] = 'infer', compression_level: Optional[int] = None):
+        self.file_path = _resolve_path(file_path)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._buffer = io.StringIO(newline='')
+        self._writer = None
+        self._needs_header = True
+
+        # Create parent directories if they don't exist
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if append and self.file_path.exists() and self.file_path.stat().st_size > 0:
+            self._needs_header = False
+            if self.fieldnames is None:
+                with open_file(self.file_path, mode='r', compression=compression, newline='') as existing:
+                    self.fieldnames = next(csv.reader(existing), None)
+
+        self._file = open_file(self.file_path, mode='a' if append else 'w', compression=compression,
+                               compression_level=compression_level, newline='')
+
+    def _start(self, first_row: Dict[str, Any]) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(first_row.keys())
+        self._writer = csv.DictWriter(self._buffer, fieldnames=self.fieldnames)
+        if self._needs_header:
+            self._writer.writeheader()
+            self._needs_header = False
+
+    def _drain_if_full(self) -> None:
+        if self._buffer.tell() >= self.buffer_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        self._file.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """Buffers a single row."""
+        if self._writer is None:
+            self._start(row)
+        self._writer.writerow(row)
+        self.rows_written += 1
+        self._drain_if_full()
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> None:
+        """Buffers rows from a list, generator or any other iterable without materializing it."""
+        rows = iter(rows)
+        if self._writer is None:
+            first_row = next(rows, None)
+            if first_row is None:
+                return
+            self.write_row(first_row)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            self._writer.writerows(batch)
+            self.rows_written += len(batch)
+            self._drain_if_full()
+
+    def flush(self) -> None:
+        """Writes buffered rows to the file and flushes it."""
+        if self._needs_header and self.fieldnames:
+            self._start({})
+        self._drain()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the file. Safe to call more than once."""
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
 if __name__ == "__main__":
 
     employees = read_csv_as_dicts("../../data/sample.csv")
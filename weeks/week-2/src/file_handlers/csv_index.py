@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Union, List, Dict, Any, Optional
+
+from .csv_handler import _resolve_path
+
+INDEX_SUFFIX = ".idx"
+DEFAULT_EVERY = 1000
+
+
+def _index_path(source: Path, index_path: Optional[Union[str, Path]]) -> Path:
+    return _resolve_path(index_path) if index_path else source.with_name(source.name + INDEX_SUFFIX)
+
+
+def _scan_offsets(source: Path, every: int) -> Dict[str, Any]:
+    """Records the byte offset of data rows 0, every, 2*every, ... (quote-aware, header excluded)."""
+    offsets = []
+    row_count = 0
+    header_end = None
+    in_quotes = False
+    position = 0
+    record_start = 0
+
+    with open(source, 'rb') as binary_file:
+        for line in binary_file:
+            position += len(line)
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+            if in_quotes:
+                continue  # newline inside a quoted field, the record continues on the next line
+            if header_end is None:
+                header_end = position
+            elif line.strip(b'\r\n'):
+                if row_count % every == 0:
+                    offsets.append(record_start)
+                row_count += 1
+            record_start = position
+
+    return {"every": every, "row_count": row_count, "header_end": header_end or 0, "offsets": offsets}
+
+
+def build_csv_index(file_path: Union[str, Path], every: int = DEFAULT_EVERY,
+                    index_path: Optional[Union[str, Path]] = None) -> Optional[Path]:
+    """Writes a sidecar index (file.csv.idx) with the byte offset of every Nth row. Returns its path."""
+    try:
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        source = _resolve_path(file_path)
+        stat = source.stat()
+        index = _scan_offsets(source, every)
+        index.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+
+        target = _index_path(source, index_path)
+        with open(target, 'w') as index_file:
+            json.dump(index, index_file)
+        return target
+
+    except FileNotFoundError as fnf_error:
+        print(f"Error: The file {file_path} was not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to index {file_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+    return None
+
+
+def load_csv_index(file_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None,
+                   every: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Loads the sidecar index, (re)building it when missing or when the CSV changed since it was built.
+
+    A rebuild uses `every` when given, else the stride of the stale index, else DEFAULT_EVERY.
+    """
+    source = _resolve_path(file_path)
+    target = _index_path(source, index_path)
+    stored_every = None
+    try:
+        with open(target, 'r') as index_file:
+            index = json.load(index_file)
+        stored_every = index.get("every")
+        stat = source.stat()
+        if index.get("size") == stat.st_size and index.get("mtime_ns") == stat.st_mtime_ns:
+            return index
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    if every is None:
+        every = stored_every or DEFAULT_EVERY
+    if build_csv_index(source, every, target) is None:
+        return None
+    with open(target, 'r') as index_file:
+        return json.load(index_file)
+
+
+def read_csv_rows(file_path: Union[str, Path], start: int, stop: int, index_path: Optional[Union[str, Path]] = None,
+                  encoding: str = 'utf-8') -> Optional[List[Dict[str, Any]]]:
+    """Returns data rows [start, stop) (0-based, header excluded) by seeking via the row index.
+
+    At most `every - 1` rows are parsed before `start`, so the cost does not depend on where
+    the range sits in the file.
+    """
+    try:
+        if start < 0 or stop < start:
+            raise ValueError("Row range must satisfy 0 <= start <= stop.")
+        source = _resolve_path(file_path)
+        index = load_csv_index(source, index_path)
+        if index is None:
+            return None
+        stop = min(stop, index["row_count"])
+        if start >= stop:
+            return []
+
+        block, skip = divmod(start, index["every"])
+        with open(source, 'rb') as binary_file:
+            header_text = io.TextIOWrapper(binary_file, encoding=encoding, newline='')
+            fieldnames = next(csv.reader(header_text), [])
+            header_text.detach()
+
+            binary_file.seek(index["offsets"][block])
+            text = io.TextIOWrapper(binary_file, encoding=encoding, newline='')
+            reader = csv.DictReader(text, fieldnames=fieldnames)
+            return [dict(row) for row in islice(reader, skip, skip + stop - start)]
+
+    except FileNotFoundError as fnf_error:
+        print(f"Error: The file {file_path} was not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to read {file_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+    return None
+
+
+if __name__ == "__main__":
+    print(read_csv_rows("../../data/sample.csv", 2, 4))
@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+from typing import Union, List, Dict, Any, Optional, Iterator, Tuple
+
+from .csv_handler import _resolve_path
+
+STATE_SUFFIX = ".tail.json"
+BLOCK_SIZE = 1 << 20
+
+
+def _complete_prefix_length(data: bytes) -> int:
+    """Length of `data` up to the last newline that ends a full record (data must begin at a record start).
+
+    Newlines inside quoted fields and a trailing, partially written line are not counted.
+    """
+    end = 0
+    position = 0
+    in_quotes = False
+    while True:
+        newline = data.find(b'\n', position)
+        if newline == -1:
+            return end
+        if data.count(b'"', position, newline) % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            end = newline + 1
+        position = newline + 1
+
+
+class CSVTailReader:
+    """Incremental reader for append-only CSV logs: each call parses only rows appended since the last one.
+
+    The consumed byte offset and header are kept in a small JSON state file (file.csv.tail.json
+    by default), so a restarted job resumes where it stopped. A partially written last line is
+    left for the next call. If the file shrinks (rotated/truncated) reading restarts from the top.
+
+        tail = CSVTailReader("events.csv")
+        new_rows = tail.read_new_rows()
+    """
+
+    def __init__(self, file_path: Union[str, Path], state_path: Optional[Union[str, Path]] = None,
+                 persist: bool = True, encoding: str = 'utf-8'):
+        self.file_path = _resolve_path(file_path)
+        self.state_path = _resolve_path(state_path) if state_path else self.file_path.with_name(self.file_path.name + STATE_SUFFIX)
+        self.persist = persist
+        self.encoding = encoding
+        self.offset = 0
+        self.fieldnames: Optional[List[str]] = None
+        self._load_state()
+
+    def _load_state(self) -> None:
+        if not self.persist:
+            return
+        try:
+            with open(self.state_path, 'r') as state_file:
+                state = json.load(state_file)
+            self.offset = state["offset"]
+            self.fieldnames = state["fieldnames"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+    def save_state(self) -> None:
+        """Atomically writes the current offset and header to the state file."""
+        staging = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(staging, 'w') as state_file:
+            json.dump({"offset": self.offset, "fieldnames": self.fieldnames}, state_file)
+        os.replace(staging, self.state_path)
+
+    def reset(self) -> None:
+        """Forgets the saved position so the next read starts from the top of the file."""
+        self.offset = 0
+        self.fieldnames = None
+
+    def _parse(self, complete: bytes, fieldnames: Optional[List[str]]):
+        stream = io.StringIO(complete.decode(self.encoding), newline='')
+        if fieldnames is None:
+            fieldnames = next(csv.reader(stream), None)
+        return fieldnames, [dict(row) for row in csv.DictReader(stream, fieldnames=fieldnames)]
+
+    def _iter_blocks(self, block_size: int) -> Iterator[Tuple[List[Dict[str, Any]], int, Optional[List[str]]]]:
+        """Yields (rows, end offset, header) per block of complete records; the reader's position is not moved."""
+        if self.file_path.stat().st_size < self.offset:
+            print(f"Note: {self.file_path} shrank (rotated or truncated); reading it from the start.")
+            self.reset()
+
+        offset = self.offset
+        fieldnames = self.fieldnames
+        with open(self.file_path, 'rb') as binary_file:
+            binary_file.seek(offset)
+            pending = b''
+            while True:
+                block = binary_file.read(block_size)
+                if not block:
+                    break
+                pending += block
+                complete_length = _complete_prefix_length(pending)
+                if complete_length == 0:
+                    continue
+                fieldnames, rows = self._parse(pending[:complete_length], fieldnames)
+                pending = pending[complete_length:]
+                offset += complete_length
+                yield rows, offset, fieldnames
+
+    def _commit(self, offset: int, fieldnames: Optional[List[str]]) -> None:
+        self.offset = offset
+        self.fieldnames = fieldnames
+        if self.persist:
+            self.save_state()
+
+    def iter_new_rows(self, block_size: int = BLOCK_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yields rows appended since the last call, one block of the file at a time.
+
+        A block's position is committed (and saved) only once all its rows have been taken, so
+        rows a failed or interrupted consumer never got are delivered again on the next call.
+        """
+        for rows, offset, fieldnames in self._iter_blocks(block_size):
+            yield from rows
+            self._commit(offset, fieldnames)
+
+    def read_new_rows(self, block_size: int = BLOCK_SIZE) -> Optional[List[Dict[str, Any]]]:
+        """Returns the rows appended since the last call (an empty list if there are none).
+
+        The state is saved once, after every block was read; on an error nothing is committed.
+        """
+        try:
+            new_rows = []
+            committed = None
+            for rows, offset, fieldnames in self._iter_blocks(block_size):
+                new_rows.extend(rows)
+                committed = (offset, fieldnames)
+            if committed is not None:
+                self._commit(*committed)
+            return new_rows
+
+        except FileNotFoundError as fnf_error:
+            print(f"Error: The file {self.file_path} was not found. Error details: {fnf_error}")
+        except PermissionError as perm_error:
+            print(f"Error: Permission denied to read {self.file_path}. Error details: {perm_error}")
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+
+        return None
+
+    def follow(self, poll_interval: float = 1.0, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Polls the file and yields new rows as they are appended, until `timeout` seconds pass (forever if None)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            yield from self.read_new_rows() or []
+            time.sleep(poll_interval)
@@ -0,0 +1,158 @@
+import json
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is always available
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional accelerator
+    ujson = None
+
+# backend='auto' picks the first installed library in this order
+BACKEND_PREFERENCE = ('orjson', 'ujson', 'stdlib')
+_default_backend = 'auto'
+# repr() writes floats outside [1e-4, 1e16) in exponent form (1e-05, 1e+20), which the
+# accelerated encoders spell differently (0.00001, 1e20); such documents go to stdlib
+_PLAIN_FLOAT_RANGE = (1e-4, 1e16)
+
+
+class JSONBackend:
+    """loads/dumps for one JSON library; this base class is the stdlib implementation.
+
+    Accelerated subclasses fall back to stdlib for anything they cannot reproduce exactly:
+    formatting options they lack, values they reject (big ints, custom types), text that
+    stdlib would escape, floats whose spelling may differ (exponent forms, NaN and
+    Infinity) and non-JSON types they would encode but stdlib rejects (UUID, Enum).
+    Written files are therefore byte-identical to stdlib json output, and the same values
+    raise TypeError whichever library is installed.
+    """
+    name = 'stdlib'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False, compact: bool = False) -> str:
+        """Serializes like json.dumps; compact=True uses (',', ':') separators."""
+        separators = (',', ':') if compact else None
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, separators=separators)
+
+
+def _stdlib_escaped(encoded: bytes) -> bool:
+    """True if stdlib (ensure_ascii=True) would have written the same characters unescaped."""
+    return encoded.isascii() and b'\x7f' not in encoded
+
+
+_PLAIN_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def _needs_stdlib(obj: Any) -> bool:
+    """True if the accelerated output could differ from stdlib: a float with another spelling
+    (NaN/Infinity, which orjson writes as null, or one repr() writes with an exponent), or a
+    value that is not a plain JSON type (orjson encodes UUID and Enum; stdlib raises TypeError).
+
+    Exact type checks: anything else, subclasses included, is left to stdlib.
+    """
+    low, high = _PLAIN_FLOAT_RANGE
+    plain_types = _PLAIN_TYPES
+    stack = [[obj]]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        for item in (value.values() if kind is dict else value):
+            item_type = type(item)
+            if item_type is float:
+                if item and not low <= abs(item) < high:  # also true for NaN and Infinity
+                    return True
+            elif item_type is dict or item_type is list or item_type is tuple:
+                stack.append(item)
+            elif item_type not in plain_types:
+                return True
+    return False
+
+
+class OrjsonBackend(JSONBackend):
+    name = 'orjson'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)  # NaN/Infinity, >64-bit ints, or a real error reported by stdlib
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False, compact: bool = False) -> str:
+        # orjson only writes compact one-line JSON or indent=2 with ", " / ": " separators
+        if not ((indent is None and compact) or (indent == 2 and not compact)):
+            return super().dumps(obj, indent, sort_keys, compact)
+        option = orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, indent, sort_keys, compact)
+        if not _stdlib_escaped(encoded) or _needs_stdlib(obj):
+            return super().dumps(obj, indent, sort_keys, compact)
+        return encoded.decode('ascii')
+
+
+class UjsonBackend(JSONBackend):
+    name = 'ujson'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError:
+            return super().loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False, compact: bool = False) -> str:
+        # ujson's indented layout differs from stdlib, so only compact output is accelerated
+        if not (indent is None and compact):
+            return super().dumps(obj, indent, sort_keys, compact)
+        try:
+            encoded = ujson.dumps(obj, sort_keys=sort_keys, ensure_ascii=True, escape_forward_slashes=False)
+        except (TypeError, ValueError, OverflowError):
+            return super().dumps(obj, indent, sort_keys, compact)
+        if '\x7f' in encoded or 'NaN' in encoded or 'Inf' in encoded or _needs_stdlib(obj):
+            return super().dumps(obj, indent, sort_keys, compact)
+        return encoded
+
+
+_BACKENDS: Dict[str, JSONBackend] = {'stdlib': JSONBackend()}
+if orjson is not None:
+    _BACKENDS['orjson'] = OrjsonBackend()
+if ujson is not None:
+    _BACKENDS['ujson'] = UjsonBackend()
+
+
+def available_json_backends() -> List[str]:
+    """Names of the installed backends, fastest first."""
+    return [name for name in BACKEND_PREFERENCE if name in _BACKENDS]
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """Returns the backend for `name` ('auto', 'orjson', 'ujson', 'stdlib'), or the global default if None."""
+    name = name or _default_backend
+    if name == 'auto':
+        return _BACKENDS[available_json_backends()[0]]
+    if name not in BACKEND_PREFERENCE:
+        raise ValueError(f"Unsupported JSON backend '{name}'. Use 'auto' or one of: {', '.join(BACKEND_PREFERENCE)}")
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not installed (pip install {name}).")
+    return _BACKENDS[name]
+
+
+def set_json_backend(name: str = 'auto') -> None:
+    """Sets the backend used by the JSON readers and writers when no backend is passed per call."""
+    global _default_backend
+    get_json_backend(name)  # validate before switching
+    _default_backend = name
+
+
+if __name__ == "__main__":
+    print(f"Installed JSON backends: {', '.join(available_json_backends())}")
+    print(f"'auto' resolves to: {get_json_backend('auto').name}")
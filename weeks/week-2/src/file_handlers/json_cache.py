@@ -0,0 +1,183 @@
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .json_handler import _resolve_path, read_json_file
+
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is read-only (it is shared by the JSON cache); use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Read-only dict returned by the JSON cache; compares equal to, and serializes like, a plain dict."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read-only list returned by the JSON cache; compares equal to, and serializes like, a plain list."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Tuple[Any, int]:
+    """Returns a read-only deep copy of a JSON value and its approximate size in bytes."""
+    if isinstance(value, dict):
+        items = [(key, freeze(item)) for key, item in value.items()]
+        size = sys.getsizeof(value) + sum(sys.getsizeof(key) + item_size for key, (_, item_size) in items)
+        return FrozenDict((key, item) for key, (item, _) in items), size
+    if isinstance(value, list):
+        items = [freeze(item) for item in value]
+        return FrozenList(item for item, _ in items), sys.getsizeof(value) + sum(item_size for _, item_size in items)
+    return value, sys.getsizeof(value)
+
+
+def thaw(value: Any) -> Any:
+    """Returns a mutable deep copy (plain dicts and lists) of a cached value."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+class JSONReadCache:
+    """In-memory LRU cache in front of read_json_file, bounded by an approximate byte budget.
+
+    Entries are keyed by (resolved path, mtime_ns, size), so an edited file is re-read on the
+    next call. A hit costs one stat() and a dict lookup. Cached values are read-only
+    (FrozenDict/FrozenList) so callers cannot corrupt what others see; thaw() gives a copy.
+
+        cache = JSONReadCache(max_bytes=16 << 20)
+        config = cache.read("config.json")
+        print(cache.stats())
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, backend: Optional[str] = None):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative.")
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Path, Tuple[int, int, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, file_path: Union[str, Path], compression: Optional[str] = 'infer') -> Any:
+        """Returns the parsed (read-only) content of a JSON file, from memory when the file is unchanged."""
+        path = _resolve_path(file_path).resolve()
+        try:
+            stat = path.stat()
+        except FileNotFoundError as file_not_found_error:
+            print(f"Error: The file {file_path} was not found. Error details: {file_not_found_error}")
+            return None
+        except PermissionError as permission_error:
+            print(f"Error: Permission denied to read {file_path}. Error details: {permission_error}")
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        data = read_json_file(path, compression=compression, backend=self.backend)
+        if data is None:
+            return None
+        value, size = freeze(data)
+
+        with self._lock:
+            self._discard(path)
+            if size <= self.max_bytes:
+                self._entries[path] = (stat.st_mtime_ns, stat.st_size, value, size)
+                self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+                    self.evictions += 1
+        return value
+
+    def _discard(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.current_bytes -= entry[3]
+
+    def invalidate(self, file_path: Union[str, Path]) -> None:
+        """Drops one file from the cache (the next read goes to disk)."""
+        with self._lock:
+            self._discard(_resolve_path(file_path).resolve())
+
+    def clear(self) -> None:
+        """Drops every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring: hits, misses, evictions, hit_rate, entries, bytes and max_bytes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_default_cache = JSONReadCache()
+
+
+def read_json_cached(file_path: Union[str, Path], compression: Optional[str] = 'infer') -> Any:
+    """read_json_file through the shared process-wide cache; the result is read-only (see thaw())."""
+    return _default_cache.read(file_path, compression)
+
+
+def json_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters of the shared cache."""
+    return _default_cache.stats()
+
+
+def clear_json_cache(file_path: Optional[Union[str, Path]] = None) -> None:
+    """Drops one file, or everything, from the shared cache."""
+    if file_path is None:
+        _default_cache.clear()
+    else:
+        _default_cache.invalidate(file_path)
+
+
+if __name__ == "__main__":
+    for _ in range(3):
+        sample = read_json_cached("../../data/sample.json")
+    print(f"Loaded {type(sample).__name__}; cache stats: {json_cache_stats()}")
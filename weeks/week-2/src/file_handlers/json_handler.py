@@ -1,9 +1,33 @@
 import json
+import re
+from itertools import islice
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Union, Optional, Iterable, Iterator, Dict
 
-def read_json_file(file_path: Union[str, Path]) -> dict | list | None:
-    """Reads a JSON file and returns its content as a Python object (dict, list, etc.)."""
+from .compression import open_file
+from .json_backends import get_json_backend
+
+# Bad JSONL lines are reported individually up to this many, then only counted
+MAX_REPORTED_BAD_LINES = 10
+# Initial read size for iter_json_array; doubled while a single element is larger than the window
+ARRAY_READ_SIZE = 1 << 16
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_CLOSERS = '}]"'
+_DELIMITERS = ',] \t\n\r'
+
+def _resolve_path(file_path: Union[str, Path]) -> Path:
+    """Resolves relative paths against this module's directory (same rule as the functions below)."""
+    if Path(file_path).is_absolute():
+        return Path(file_path)
+    return Path(__file__).parent / file_path
+
+def read_json_file(file_path: Union[str, Path], compression: Optional[str] = 'infer',
+                   backend: Optional[str] = None) -> dict | list | None:
+    """Reads a JSON file and returns its content as a Python object (dict, list, etc.).
+
+    Compressed .gz/.bz2/.xz files are detected by extension or magic bytes.
+    backend: 'auto', 'orjson', 'ujson' or 'stdlib'; None uses the global set_json_backend choice.
+    """
     try:
         # Handle both absolute and relative paths correctly
         if Path(file_path).is_absolute():
@@ -13,8 +37,9 @@ def read_json_file(file_path: Union[str, Path]) -> dict | list | None:
             script_dir = Path(__file__).parent
             full_path = script_dir / file_path
         
-        with open(full_path, 'r') as file:
-            data = json.load(file)
+        json_backend = get_json_backend(backend)
+        with open_file(full_path, 'rb', compression=compression) as file:
+            data = json_backend.loads(file.read())
         return data
     
     except FileNotFoundError as file_not_found_error:
@@ -27,8 +52,14 @@ def read_json_file(file_path: Union[str, Path]) -> dict | list | None:
         print(f"An unexpected error occurred: {e}")
     return None
 
-def write_json_file(data: Any, file_path: Union[str, Path]) -> bool:
-    """function to write a Python object (dict, list, etc.) to a JSON file."""
+def write_json_file(data: Any, file_path: Union[str, Path], compression: Optional[str] = 'infer',
+                    compression_level: Optional[int] = None, indent: Optional[int] = 2, sort_keys: bool = False,
+                    backend: Optional[str] = None) -> bool:
+    """function to write a Python object (dict, list, etc.) to a JSON file (compressed for .gz/.bz2/.xz names).
+
+    indent and sort_keys are honoured by every backend (an accelerated one falls back to stdlib
+    for layouts it cannot reproduce).
+    """
     try:
         if Path(file_path).is_absolute():
             full_path = Path(file_path)
@@ -39,8 +70,167 @@ def write_json_file(data: Any, file_path: Union[str, Path]) -> bool:
         # Create parent directories if they don't exist
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(full_path, 'w') as file:
-            json.dump(data, file, indent=2)
+        text = get_json_backend(backend).dumps(data, indent=indent, sort_keys=sort_keys)
+        with open_file(full_path, 'w', compression=compression, compression_level=compression_level) as file:
+            file.write(text)
+        return True
+    except PermissionError as permission_error:
+        print(f"Error: Permission denied to write to {file_path}. Error details: {permission_error}")
+    except Exception as e:
+        print(f"An error occurred while writing to the file: {e}")
+
+    return False
+
+def iter_jsonl(file_path: Union[str, Path], batch_size: Optional[int] = None, compression: Optional[str] = 'infer',
+               stats: Optional[Dict[str, int]] = None, backend: Optional[str] = None) -> Iterator[Any]:
+    """Streams a JSON Lines file: yields one record per line, or lists of up to batch_size records.
+
+    Lines that are not valid JSON are skipped and counted instead of aborting the read; blank
+    lines are ignored. A passed-in stats dict receives "records", "bad_lines" and "failed"
+(True when the file could not be read; the error is printed and nothing more is yielded).
+    backend selects the JSON library as in read_json_file.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    records = 0
+    bad_lines = 0
+    failed = False
+    try:
+        loads = get_json_backend(backend).loads
+        with open_file(_resolve_path(file_path), 'r', compression=compression) as file:
+            def parsed():
+                nonlocal records, bad_lines
+                for line_number, line in enumerate(file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = loads(line)
+                    except json.JSONDecodeError as json_decode_error:
+                        bad_lines += 1
+                        if bad_lines <= MAX_REPORTED_BAD_LINES:
+                            print(f"Error: Line {line_number} of {file_path} is not valid JSON. Error details: {json_decode_error}")
+                        continue
+                    records += 1
+                    yield record
+
+            if batch_size is None:
+                yield from parsed()
+            else:
+                records_iter = parsed()
+                while batch := list(islice(records_iter, batch_size)):
+                    yield batch
+
+    except FileNotFoundError as file_not_found_error:
+        failed = True
+        print(f"Error: The file {file_path} was not found. Error details: {file_not_found_error}")
+    except PermissionError as permission_error:
+        failed = True
+        print(f"Error: Permission denied to read {file_path}. Error details: {permission_error}")
+    except Exception as e:
+        failed = True
+        print(f"An unexpected error occurred: {e}")
+    finally:
+        if bad_lines:
+            print(f"Skipped {bad_lines} invalid line(s) in {file_path}.")
+        if stats is not None:
+            stats.update({"records": records, "bad_lines": bad_lines, "failed": failed})
+
+def iter_json_array(file_path: Union[str, Path], read_size: int = ARRAY_READ_SIZE,
+                    compression: Optional[str] = 'infer') -> Iterator[Any]:
+    """Yields the elements of a top-level JSON array ([{...}, {...}, ...]) one at a time.
+
+    The file is read in buffered windows and each element is decoded with
+    json.JSONDecoder.raw_decode, so memory is bounded by the largest element, not the file.
+    Always uses stdlib json (the accelerated backends have no incremental decoder).
+    """
+    decoder = json.JSONDecoder()
+    try:
+        with open_file(_resolve_path(file_path), 'r', compression=compression) as file:
+            buffer = ''
+            position = 0
+            at_eof = False
+            chunk_size = read_size
+
+            def fill() -> bool:
+                """Drops consumed text and reads more; returns False at end of file."""
+                nonlocal buffer, position, at_eof
+                chunk = file.read(chunk_size)
+                buffer = buffer[position:] + chunk
+                position = 0
+                at_eof = not chunk
+                return bool(chunk)
+
+            def next_char() -> str:
+                """Skips whitespace and returns the next significant character ('' at end of file)."""
+                nonlocal position
+                while True:
+                    position = _WHITESPACE.match(buffer, position).end()
+                    if position < len(buffer):
+                        return buffer[position]
+                    if not fill():
+                        return ''
+
+            if next_char() != '[':
+                raise ValueError("The file does not contain a top-level JSON array.")
+            position += 1
+            if next_char() == ']':
+                return
+
+            while True:
+                next_char()
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                    # Objects, arrays and strings end on their own closing character. A scalar cut by
+                    # the window ("12.", "1e") still decodes, so it only counts once a delimiter follows.
+                    complete = at_eof or buffer[end - 1] in _CLOSERS or (end < len(buffer) and buffer[end] in _DELIMITERS)
+                except json.JSONDecodeError:
+                    if at_eof:
+                        raise
+                    complete = False
+                if not complete:
+                    if not fill():
+                        continue  # at EOF now; the retry decides between complete and malformed
+                    chunk_size = max(chunk_size, len(buffer))  # big element: grow the window geometrically
+                    continue
+
+                chunk_size = read_size
+                position = end
+                yield element
+
+                separator = next_char()
+                if separator == ']':
+                    return
+                if not separator:
+                    raise ValueError("The array is not terminated with ']'.")
+                if separator != ',':
+                    raise ValueError(f"Expecting ',' or ']' between array elements, found {separator!r}.")
+                position += 1
+
+    except FileNotFoundError as file_not_found_error:
+        print(f"Error: The file {file_path} was not found. Error details: {file_not_found_error}")
+    except ValueError as array_error:  # includes json.JSONDecodeError
+        print(f"Error: The file {file_path} is not a valid JSON array. Error details: {array_error}")
+    except PermissionError as permission_error:
+        print(f"Error: Permission denied to read {file_path}. Error details: {permission_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+def write_jsonl(records: Iterable[Any], file_path: Union[str, Path], append: bool = False,
+                batch_size: int = 1000, compression: Optional[str] = 'infer',
+                compression_level: Optional[int] = None, backend: Optional[str] = None) -> bool:
+    """Writes records (a list, generator or successive batches' items) as JSON Lines, one compact object per line."""
+    try:
+        full_path = _resolve_path(file_path)
+        # Create parent directories if they don't exist
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        dumps = get_json_backend(backend).dumps
+        records = iter(records)
+        with open_file(full_path, 'a' if append else 'w', compression=compression,
+                       compression_level=compression_level) as file:
+            while batch := list(islice(records, batch_size)):
+                file.write(''.join(dumps(record, compact=True) + '\n' for record in batch))
         return True
     except PermissionError as permission_error:
         print(f"Error: Permission denied to write to {file_path}. Error details: {permission_error}")
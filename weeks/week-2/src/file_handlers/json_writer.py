@@ -0,0 +1,190 @@
+import atexit
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .compression import open_file
+from .json_backends import get_json_backend
+from .json_handler import _resolve_path
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Consecutive failed flushes of one path before its content is dropped (a new write() starts over)
+MAX_WRITE_ATTEMPTS = 5
+
+
+class JSONWriteBehind:
+    """Background writer for JSON files that are rewritten often (status, progress, heartbeat files).
+
+    write() only records the latest content for a path and returns; a daemon thread writes
+    every `interval` seconds, so ten writes to the same file between flushes cost one
+    serialization and one disk write. Files are replaced atomically (temp file + os.replace),
+    so readers never see a half-written document. Data is serialized at flush time: hand
+    over a value you will not mutate afterwards. Call flush() or close() before shutdown.
+    A file that fails with an I/O error stays queued and is retried by the next flushes, up
+    to MAX_WRITE_ATTEMPTS times in a row.
+
+        with JSONWriteBehind(interval=0.5) as writer:
+            writer.write({"state": "running"}, "status.json")
+    """
+
+    def __init__(self, interval: float = DEFAULT_FLUSH_INTERVAL, indent: Optional[int] = 2,
+                 sort_keys: bool = False, backend: Optional[str] = None):
+        if interval <= 0:
+            raise ValueError("interval must be a positive number of seconds.")
+        self.interval = interval
+        self.indent = indent
+        self.sort_keys = sort_keys
+        self.backend = backend
+        self.writes_requested = 0
+        self.writes_coalesced = 0  # superseded by a later write to the same path before reaching disk
+        self.files_written = 0
+        self.errors = 0
+        self._pending: Dict[Path, Any] = {}
+        self._failures: Dict[Path, int] = {}
+        self._known_dirs = set()
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()  # one batch on disk at a time, keeps per-path order
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="json-write-behind", daemon=True)
+        self._thread.start()
+
+    def write(self, data: Any, file_path: Union[str, Path]) -> None:
+        """Queues data as the new content of file_path (replacing any queued content for it)."""
+        path = _resolve_path(file_path)
+        with self._condition:
+            if self._closed:
+                raise ValueError("write to a closed JSONWriteBehind.")
+            if path in self._pending:
+                self.writes_coalesced += 1
+            self._pending[path] = data
+            self._failures.pop(path, None)
+            self.writes_requested += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed:
+                    self._condition.wait(self.interval)
+                if self._closed:
+                    return  # close() writes the remainder itself
+            self._write_pending()
+
+    def _write_pending(self) -> bool:
+        with self._write_lock:
+            with self._condition:
+                batch, self._pending = self._pending, {}
+            return all([self._write_atomic(path, data) for path, data in batch.items()])
+
+    def _write_atomic(self, path: Path, data: Any) -> bool:
+        # The temp name keeps the real suffix so compression is inferred the same way (status.json.gz);
+        # pid and writer id keep two writers (in one process or several) off each other's temp file
+        staging = path.with_name(f".tmp-{os.getpid()}-{id(self):x}-{path.name}")
+        try:
+            if path.parent not in self._known_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(path.parent)
+            text = get_json_backend(self.backend).dumps(data, indent=self.indent, sort_keys=self.sort_keys)
+            with open_file(staging, 'w') as file:
+                file.write(text)
+            os.replace(staging, path)
+            with self._condition:
+                self.files_written += 1
+                self._failures.pop(path, None)
+            return True
+        except PermissionError as permission_error:
+            print(f"Error: Permission denied to write to {path}. Error details: {permission_error}")
+            retry = True
+        except OSError as os_error:
+            print(f"An error occurred while writing to the file: {os_error}")
+            retry = True
+        except Exception as e:
+            print(f"An error occurred while writing to the file: {e}")
+            retry = False  # the data itself cannot be serialized; retrying would fail the same way
+        try:
+            staging.unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._known_dirs.discard(path.parent)  # the directory may have been removed; recreate it next time
+        with self._condition:
+            self.errors += 1
+            if retry and path not in self._pending:
+                # I/O errors may be transient: keep the content for the next flush unless newer content was queued
+                attempts = self._failures.get(path, 0) + 1
+                if attempts < MAX_WRITE_ATTEMPTS:
+                    self._failures[path] = attempts
+                    self._pending[path] = data
+                else:
+                    self._failures.pop(path, None)
+                    print(f"Error: Giving up on {path} after {attempts} failed attempts.")
+        return False
+
+    def flush(self) -> bool:
+        """Synchronously writes everything queued so far; returns False if any file failed."""
+        return self._write_pending()
+
+    def close(self) -> bool:
+        """Stops the background thread and writes what is still queued."""
+        with self._condition:
+            if self._closed:
+                return True
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        return self._write_pending()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring: writes_requested, writes_coalesced, files_written, errors and pending."""
+        with self._condition:
+            return {
+                "writes_requested": self.writes_requested,
+                "writes_coalesced": self.writes_coalesced,
+                "files_written": self.files_written,
+                "errors": self.errors,
+                "pending": len(self._pending),
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+_default_writer: Optional[JSONWriteBehind] = None
+_default_writer_lock = threading.Lock()
+_flush_at_exit_registered = False
+
+
+def write_json_file_deferred(data: Any, file_path: Union[str, Path]) -> None:
+    """Write-behind variant of write_json_file through a shared writer (same indent=2 layout).
+
+    Pending writes are flushed at interpreter exit (the writer's thread is a daemon).
+    """
+    global _default_writer, _flush_at_exit_registered
+    with _default_writer_lock:
+        if _default_writer is None or _default_writer.closed:
+            _default_writer = JSONWriteBehind()
+            if not _flush_at_exit_registered:
+                atexit.register(flush_json_writes)
+                _flush_at_exit_registered = True
+    _default_writer.write(data, file_path)
+
+
+def flush_json_writes() -> bool:
+    """Synchronously flushes the shared writer (call at shutdown)."""
+    with _default_writer_lock:
+        writer = _default_writer
+    return writer.flush() if writer is not None else True
+
+
+if __name__ == "__main__":
+    with JSONWriteBehind(interval=0.2) as writer:
+        for step in range(100):
+            writer.write({"step": step, "state": "running"}, "../../data/output/status.json")
+    print(f"Write-behind stats: {writer.stats()}")
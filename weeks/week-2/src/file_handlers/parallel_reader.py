@@ -0,0 +1,112 @@
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Union, List, Dict, Any, Optional, Tuple
+
+from .csv_handler import _resolve_path
+
+# Below this many bytes per worker the process start-up costs more than it saves
+MIN_CHUNK_BYTES = 1 << 20
+# Quote counting is done on slices of this size so memory stays bounded on huge files
+_SCAN_BLOCK_BYTES = 16 << 20
+
+
+def _count_quotes(mm: mmap.mmap, start: int, end: int) -> int:
+    """Counts '"' bytes in mm[start:end] one bounded block at a time."""
+    count = 0
+    for block_start in range(start, end, _SCAN_BLOCK_BYTES):
+        count += mm[block_start:min(block_start + _SCAN_BLOCK_BYTES, end)].count(b'"')
+    return count
+
+
+def _next_record_start(mm: mmap.mmap, pos: int, in_quotes: bool) -> int:
+    """Returns the offset just past the first newline at or after pos that is not inside a quoted field."""
+    while True:
+        newline = mm.find(b'\n', pos)
+        if newline == -1:
+            return len(mm)
+        if _count_quotes(mm, pos, newline) % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            return newline + 1
+        pos = newline + 1
+
+
+def find_record_boundaries(mm: mmap.mmap, start: int, parts: int) -> List[Tuple[int, int]]:
+    """Splits mm[start:] into at most `parts` byte ranges that each begin at a record start.
+
+    Quote parity is tracked from `start`, so newlines inside quoted fields never become split points.
+    """
+    size = len(mm)
+    boundaries = [start]
+    in_quotes = False
+    scanned = start
+    for part in range(1, parts):
+        target = start + (size - start) * part // parts
+        if target <= boundaries[-1]:
+            continue
+        # Parity of the quotes we skip over tells us whether `target` sits inside a quoted field
+        if _count_quotes(mm, scanned, target) % 2:
+            in_quotes = not in_quotes
+        boundary = _next_record_start(mm, target, in_quotes)
+        if boundary >= size:
+            break
+        boundaries.append(boundary)
+        scanned = boundary
+        in_quotes = False
+    boundaries.append(size)
+    return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if b > a]
+
+
+def _parse_range(full_path: str, start: int, end: int, fieldnames: List[str], encoding: str) -> List[Dict[str, Any]]:
+    """Worker: parses one byte range of the file into row dictionaries."""
+    with open(full_path, 'rb') as binary_file, mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode(encoding)
+    reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+    return [dict(row) for row in reader]
+
+
+def read_csv_parallel(file_path: Union[str, Path], workers: Optional[int] = None,
+                      encoding: str = 'utf-8', min_chunk_bytes: int = MIN_CHUNK_BYTES) -> Optional[List[Dict[str, Any]]]:
+    """Reads a CSV file by parsing newline-aligned chunks of a memory-mapped file in a process pool.
+
+    Rows come back in file order and match read_csv_as_dicts. Small files are parsed in-process.
+    """
+    try:
+        full_path = _resolve_path(file_path)
+        workers = workers or os.cpu_count() or 1
+
+        with open(full_path, 'rb') as binary_file:
+            if os.fstat(binary_file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_end = _next_record_start(mm, 0, False)
+                fieldnames = next(csv.reader(io.StringIO(mm[:header_end].decode(encoding), newline='')), [])
+                parts = max(1, min(workers, (len(mm) - header_end) // max(1, min_chunk_bytes)))
+                ranges = find_record_boundaries(mm, header_end, parts)
+
+        if len(ranges) <= 1:
+            return [row for start, end in ranges for row in _parse_range(str(full_path), start, end, fieldnames, encoding)]
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            futures = [executor.submit(_parse_range, str(full_path), start, end, fieldnames, encoding) for start, end in ranges]
+            return [row for future in futures for row in future.result()]
+
+    except FileNotFoundError as fnf_error:
+        print(f"Error: The file {file_path} was not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to read {file_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+    return None
+
+
+if __name__ == "__main__":
+    employees = read_csv_parallel("../../data/sample.csv", workers=4)
+    if employees:
+        for employee in employees:
+            print(f"{employee['name']} works as {employee['role']}")
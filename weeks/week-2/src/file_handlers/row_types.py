@@ -0,0 +1,157 @@
+import keyword
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Tuple, Sequence, Iterator
+
+ROW_TYPES = ('dict', 'record', 'tuple')
+
+
+def _attribute_names(fieldnames: Sequence[str]) -> List[str]:
+    """Python attribute names for CSV headers ('first name' -> 'first_name', '2024' -> '_2024').
+
+    Keywords and names that would hide the row API ('class', 'keys', 'get', 'count', '_fields',
+    ...) get a trailing '_' ('keys' -> 'keys_', 'class' -> 'class_'); row["keys"] still reads the column.
+    """
+    names = []
+    for position, field in enumerate(fieldnames):
+        name = ''.join(char if char.isalnum() or char == '_' else '_' for char in field) or f"_{position}"
+        if name[0].isdigit():
+            name = f"_{name}"
+        while name in names or name in _RESERVED_NAMES or keyword.iskeyword(name):
+            name += '_'
+        names.append(name)
+    return names
+
+
+class _MappingAccess:
+    """Dict-style read access shared by both compact row types (row["salary"], keys(), get(), ...)."""
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _positions: Dict[str, int] = {}
+
+    def keys(self) -> List[str]:
+        return list(self._fields)
+
+    def values(self) -> List[Any]:
+        return [self[field] for field in self._fields]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(field, self[field]) for field in self._fields]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._positions else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def _mapping_equal(self, other: object) -> Any:
+        """Dict semantics: equal to a dict or another compact row with the same columns and values."""
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        if isinstance(other, _MappingAccess):
+            return self.items() == other.items()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+
+class RecordRow(_MappingAccess):
+    """Mutable row stored in __slots__ (no per-row __dict__)."""
+    __slots__ = ()
+    _attributes: Tuple[str, ...] = ()
+
+    def __init__(self, values: Sequence[Any]):
+        for attribute, value in zip(self._attributes, values):
+            setattr(self, attribute, value)
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._attributes[self._positions[key]])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, self._attributes[self._positions[key]], value)
+
+    def __eq__(self, other: object) -> bool:
+        return self._mapping_equal(other)
+
+    __hash__ = None
+
+
+class TupleRow(_MappingAccess, tuple):
+    """Immutable row that is a real tuple; a string key looks the value up by column name.
+
+    Like a tuple it iterates (and unpacks) values and equals a plain tuple of the same values;
+    `in`, keys() and get() follow the dict API, and like a record it equals the matching dict.
+    """
+    __slots__ = ()
+
+    def __new__(cls, values: Sequence[Any]):
+        return tuple.__new__(cls, values)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._positions[key])
+        return tuple.__getitem__(self, key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return tuple.__iter__(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, tuple) and not isinstance(other, TupleRow):
+            return tuple.__eq__(self, other)
+        return self._mapping_equal(other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = tuple.__hash__
+
+
+# Attributes of the row classes themselves; a column attribute must not shadow any of them
+_RESERVED_NAMES = frozenset(dir(RecordRow)) | frozenset(dir(TupleRow)) | {'_fields', '_positions', '_attributes'}
+
+
+@lru_cache(maxsize=128)
+def make_row_type(fieldnames: Tuple[str, ...], kind: str = 'record') -> type:
+    """Builds (and caches) a compact row class for one header: kind='record' (__slots__) or 'tuple'.
+
+    Both support row["salary"], row.salary, row.get(), row.keys() and row.to_dict().
+    """
+    fieldnames = tuple(fieldnames)
+    attributes = _attribute_names(fieldnames)
+    namespace = {
+        '__slots__': tuple(attributes) if kind == 'record' else (),
+        '_fields': fieldnames,
+        '_positions': {field: position for position, field in enumerate(fieldnames)},
+    }
+    if kind == 'record':
+        namespace['_attributes'] = tuple(attributes)
+        return type('Record', (RecordRow,), namespace)
+    if kind == 'tuple':
+        for position, attribute in enumerate(attributes):
+            namespace[attribute] = property(itemgetter(position))
+        return type('Row', (TupleRow,), namespace)
+    raise ValueError(f"Unsupported row_type '{kind}'. Use one of: {', '.join(ROW_TYPES)}")
+
+
+def column_values(rows: Sequence[Any], column: str) -> List[Any]:
+    """All values of one column, as a list, for dict rows or compact rows from one header.
+
+    Compact rows are read through their slot (records) or tuple position (tuples) instead of
+    row["column"], which for them is a Python-level lookup; this is the loop the analyzers run.
+    """
+    row_class = type(rows[0]) if rows else dict
+    if issubclass(row_class, _MappingAccess) and set(map(type, rows)) == {row_class}:
+        position = row_class._positions[column]
+        if issubclass(row_class, RecordRow):
+            return list(map(attrgetter(row_class._attributes[position]), rows))
+        return list(map(tuple.__getitem__, rows, repeat(position)))
+    return list(map(itemgetter(column), rows))
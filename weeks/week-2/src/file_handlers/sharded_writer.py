@@ -0,0 +1,147 @@
+import csv
+import io
+import multiprocessing
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Union, List, Dict, Any, Optional, Iterable, Sequence, Tuple
+
+from .csv_handler import CSVStreamWriter, _resolve_path
+from .json_handler import write_json_file
+
+MANIFEST_NAME = "_manifest.json"
+
+# Rows of a forked worker, set by the pool initializer in the child only (never in the parent)
+_WORKER_ROWS: Sequence[Dict[str, Any]] = ()
+
+
+def _init_worker_rows(rows: Sequence[Dict[str, Any]]) -> None:
+    global _WORKER_ROWS
+    _WORKER_ROWS = rows
+
+
+def _write_shard(path: Path, fieldnames: List[str], start: int, end: int,
+                 rows: Optional[Sequence[Dict[str, Any]]] = None) -> Tuple[int, int]:
+    """Worker: formats rows[start:end] into one part file. Returns (row_count, byte_size)."""
+    if rows is None:
+        rows = _WORKER_ROWS[start:end]
+    with CSVStreamWriter(path, fieldnames, compression=None) as writer:
+        writer.write_rows(rows)
+    return len(rows), path.stat().st_size
+
+
+def _header_bytes(fieldnames: List[str]) -> bytes:
+    """The exact header line CSVStreamWriter writes for these fieldnames."""
+    buffer = io.StringIO(newline='')
+    csv.DictWriter(buffer, fieldnames=fieldnames).writeheader()
+    return buffer.getvalue().encode()
+
+
+def concat_csv_shards(shard_paths: Sequence[Union[str, Path]], output_path: Union[str, Path],
+                      remove_shards: bool = False) -> bool:
+    """Concatenates part files into one CSV, keeping only the first file's header (byte-level copy, no re-parsing)."""
+    try:
+        shard_paths = [_resolve_path(path) for path in shard_paths]
+        full_path = _resolve_path(output_path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        header = None
+        with open(full_path, 'wb') as output:
+            for shard_path in shard_paths:
+                with open(shard_path, 'r', newline='') as text_shard:
+                    shard_header = next(csv.reader(text_shard), [])
+                header_line = _header_bytes(shard_header)
+                with open(shard_path, 'rb') as shard:
+                    if shard.read(len(header_line)) != header_line:
+                        raise ValueError(f"Shard {shard_path} does not start with a standard header line.")
+                    if header is None:
+                        header = shard_header
+                        output.write(header_line)
+                    elif shard_header != header:
+                        raise ValueError(f"Shard {shard_path} has a different header: {shard_header} vs {header}")
+                    shutil.copyfileobj(shard, output, 1 << 20)
+
+        if remove_shards:
+            for shard_path in shard_paths:
+                shard_path.unlink()
+        return True
+
+    except FileNotFoundError as fnf_error:
+        print(f"Error: Shard file not found. Error details: {fnf_error}")
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to write to {output_path}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An error occurred while concatenating shards: {e}")
+
+    return False
+
+
+def write_csv_sharded(data: Iterable[Dict[str, Any]], output_dir: Union[str, Path], shards: Optional[int] = None,
+                      fieldnames: Optional[List[str]] = None, write_manifest: bool = True,
+                      concat_to: Optional[Union[str, Path]] = None) -> Optional[List[Path]]:
+    """Writes rows as part-00000.csv ... part-NNNNN.csv, formatting each shard in its own process.
+
+    Shards are contiguous slices, so reading them in name order gives back the original row
+    order. With write_manifest, _manifest.json records each part's rows and size. With
+    concat_to, the parts are merged into that single file (one header) and removed
+    instead, so no manifest is written. Part files and the manifest left in output_dir by
+    an earlier run are removed first.
+    Returns the written file paths, or None on error.
+    """
+    try:
+        rows = data if isinstance(data, Sequence) else list(data)
+        if not fieldnames and rows:
+            fieldnames = list(rows[0].keys())
+        if not fieldnames:
+            raise ValueError("No fieldnames provided and data is empty.")
+
+        shards = max(1, min(shards or os.cpu_count() or 1, len(rows)))
+        directory = _resolve_path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in [*directory.glob("part-*.csv"), directory / MANIFEST_NAME]:
+            stale.unlink(missing_ok=True)
+
+        bounds = [len(rows) * shard // shards for shard in range(shards + 1)]
+        paths = [directory / f"part-{shard:05d}.csv" for shard in range(shards)]
+
+        if shards == 1:
+            results = [_write_shard(paths[0], fieldnames, 0, len(rows), rows)]
+        elif sys.platform.startswith('linux'):
+            # Forked workers receive the rows through the initializer without pickling, so only slice
+            # bounds cross the process boundary. Fork is only used on Linux: macOS defaults to spawn
+            # because forking there is unsafe.
+            with ProcessPoolExecutor(max_workers=shards, mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_worker_rows, initargs=(rows,)) as executor:
+                futures = [executor.submit(_write_shard, paths[shard], fieldnames, bounds[shard], bounds[shard + 1])
+                           for shard in range(shards)]
+                results = [future.result() for future in futures]
+        else:
+            with ProcessPoolExecutor(max_workers=shards) as executor:
+                futures = [executor.submit(_write_shard, paths[shard], fieldnames, 0, 0, rows[bounds[shard]:bounds[shard + 1]])
+                           for shard in range(shards)]
+                results = [future.result() for future in futures]
+
+        if write_manifest and concat_to is None:
+            manifest = {
+                "fieldnames": fieldnames,
+                "total_rows": sum(row_count for row_count, _ in results),
+                "shards": [{"file": path.name, "rows": row_count, "bytes": size}
+                           for path, (row_count, size) in zip(paths, results)],
+            }
+            if not write_json_file(manifest, directory / MANIFEST_NAME):
+                raise IOError("Could not write shard manifest.")
+
+        if concat_to is not None:
+            if not concat_csv_shards(paths, concat_to, remove_shards=True):
+                return None
+            return [_resolve_path(concat_to)]
+        return paths
+
+    except PermissionError as perm_error:
+        print(f"Error: Permission denied to write to {output_dir}. Error details: {perm_error}")
+    except Exception as e:
+        print(f"An error occurred while writing shards: {e}")
+
+    return None
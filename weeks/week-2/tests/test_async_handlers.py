@@ -0,0 +1,84 @@
+"""
+Unit Tests for Async File Handlers - Week 2
+Tests the asyncio wrappers and the concurrent bulk loader
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.async_handlers import (aread_csv_as_dicts, awrite_csv_from_dicts, aread_json_file,
+                                          awrite_json_file, aread_jsonl, aread_many)
+
+class TestAsyncHandlers(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async CSV/JSON operations"""
+    
+    def setUp(self):
+        """Set up test data and a temporary directory"""
+        self.rows = [{"name": "Alice", "salary": "75000"}, {"name": "Bob", "salary": "80000"}]
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    async def test_async_round_trips(self):
+        """Test async CSV and JSON writes followed by async reads"""
+        self.assertTrue(await awrite_csv_from_dicts(self.rows, self.temp_path / "a.csv"))
+        self.assertTrue(await awrite_json_file({"rows": self.rows}, self.temp_path / "a.json"))
+        
+        self.assertEqual(await aread_csv_as_dicts(self.temp_path / "a.csv", columns=["name"]),
+                         [{"name": "Alice"}, {"name": "Bob"}], "Reader options should pass through")
+        self.assertEqual(await aread_json_file(self.temp_path / "a.json"), {"rows": self.rows})
+    
+    async def test_read_many_jsonl(self):
+        """Test that .jsonl files are streamed as JSON Lines by the bulk loader"""
+        path = self.temp_path / "events.jsonl"
+        path.write_text('{"id": 1}\n{"id": 2}\n')
+        
+        self.assertEqual(await aread_many([path]), [[{"id": 1}, {"id": 2}]])
+        self.assertEqual(await aread_jsonl(path), [{"id": 1}, {"id": 2}])
+    
+    async def test_failed_jsonl_gives_none(self):
+        """Test that a missing .jsonl gives None like the other readers, while an empty one gives []"""
+        empty = self.temp_path / "empty.jsonl"
+        empty.write_text("")
+        missing = self.temp_path / "missing.jsonl"
+        
+        self.assertEqual(await aread_many([empty, missing]), [[], None])
+        self.assertIsNone(await aread_jsonl(missing))
+    
+    async def test_read_many_keeps_order(self):
+        """Test that the bulk loader returns results in input order and None for failures"""
+        paths = []
+        for i in range(20):
+            path = self.temp_path / (f"f{i}.csv" if i % 2 else f"f{i}.json.gz")
+            if i % 2:
+                await awrite_csv_from_dicts([{"file": str(i)}], path)
+            else:
+                await awrite_json_file({"file": i}, path)
+            paths.append(path)
+        paths.append(self.temp_path / "missing.csv")
+        
+        results = await aread_many(paths, limit=4)
+        
+        self.assertEqual(len(results), 21)
+        self.assertEqual(results[0], {"file": 0}, "Compressed JSON should use the JSON reader")
+        self.assertEqual(results[1], [{"file": "1"}])
+        self.assertIsNone(results[-1], "Missing file should give None")
+    
+    async def test_invalid_limit(self):
+        """Test that a non-positive concurrency limit is rejected"""
+        with self.assertRaises(ValueError):
+            await aread_many([], limit=0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
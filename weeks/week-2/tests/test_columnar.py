@@ -0,0 +1,142 @@
+"""
+Unit Tests for Columnar CSV Loading - Week 2
+Tests dtype inference, null masks and category coding of read_csv_as_columns and read_json_as_columns
+"""
+
+import unittest
+import tempfile
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.columnar import read_csv_as_columns, read_json_as_columns, records_to_columns, infer_column
+
+class TestColumnarReader(unittest.TestCase):
+    """Test cases for the columnar CSV reader"""
+    
+    def setUp(self):
+        """Create a small employee CSV with some missing values"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "employees.csv"
+        self.csv_file.write_text(
+            "name,experience,salary,location\n"
+            "Alice,3,75000.5,Pune\n"
+            "Bob,,80000,Mumbai\n"
+            "Charlie,10,NA,Pune\n"
+        )
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_dtype_inference(self):
+        """Test that int, float and string columns get the right dtypes"""
+        columns = read_csv_as_columns(self.csv_file)
+        
+        self.assertEqual(columns["experience"].dtype, np.int64, "Whole numbers should load as int64")
+        self.assertEqual(columns["salary"].dtype, np.float64, "Decimals should load as float64")
+        self.assertTrue(columns.is_categorical("location"), "Strings should be category coded")
+        self.assertEqual(columns.row_count, 3, "Should load all rows")
+    
+    def test_null_masks(self):
+        """Test that '' and 'NA' cells are masked and ignored by reductions"""
+        columns = read_csv_as_columns(self.csv_file)
+        
+        self.assertEqual(list(columns["experience"].mask), [False, True, False])
+        self.assertEqual(list(columns["salary"].mask), [False, False, True])
+        self.assertEqual(columns["experience"].mean(), 6.5, "Mean should skip the null cell")
+    
+    def test_category_decoding(self):
+        """Test that category codes decode back to the original strings"""
+        columns = read_csv_as_columns(self.csv_file)
+        
+        self.assertEqual(list(columns.categories["location"]), ["Mumbai", "Pune"])
+        self.assertEqual(list(columns.decode("location")), ["Pune", "Mumbai", "Pune"])
+    
+    def test_long_cell_does_not_widen_column(self):
+        """Test that one very long string cell does not size every row's storage"""
+        raw = ["short"] * 10000 + ["x" * 5000, ""]
+        codes, categories = infer_column(raw)
+        
+        self.assertEqual(categories.dtype, object, "Categories should not be a fixed-width string array")
+        self.assertLess(codes.data.nbytes, 100000, "Codes should stay a small integer array")
+        self.assertEqual(list(categories), ["short", "x" * 5000])
+        self.assertEqual(codes.data[-2], 1)
+        self.assertTrue(codes.mask[-1])
+    
+    def test_all_null_column(self):
+        """Test that a column with no values loads as fully-masked float64"""
+        values, categories = infer_column(["", "NA"])
+        
+        self.assertIsNone(categories)
+        self.assertEqual(values.dtype, np.float64)
+        self.assertTrue(values.mask.all())
+    
+    def test_read_nonexistent_file(self):
+        """Test reading a file that doesn't exist"""
+        self.assertIsNone(read_csv_as_columns(Path(self.temp_dir) / "missing.csv"))
+
+class TestJSONColumns(unittest.TestCase):
+    """Test cases for loading JSON records into columns"""
+    
+    def setUp(self):
+        """Create the same employees as JSON records and as CSV"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.json_file = Path(self.temp_dir) / "employees.json"
+        self.json_file.write_text(json.dumps([
+            {"name": "Alice", "experience": 3, "salary": 75000.5, "location": "Pune"},
+            {"name": "Bob", "experience": None, "salary": 80000, "location": "Mumbai"},
+            {"name": "Charlie", "experience": 10, "salary": "NA", "location": "Pune"},
+        ]))
+        self.csv_file = Path(self.temp_dir) / "employees.csv"
+        self.csv_file.write_text(
+            "name,experience,salary,location\n"
+            "Alice,3,75000.5,Pune\n"
+            "Bob,,80000,Mumbai\n"
+            "Charlie,10,NA,Pune\n"
+        )
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_interchangeable_with_csv_load(self):
+        """Test that JSON and CSV loads of the same records give identical columns"""
+        from_json = read_json_as_columns(self.json_file)
+        from_csv = read_csv_as_columns(self.csv_file)
+        
+        self.assertEqual(from_json.column_names, from_csv.column_names)
+        for name in from_csv.column_names:
+            self.assertEqual(from_json[name].dtype, from_csv[name].dtype, f"dtype of {name}")
+            self.assertEqual(list(from_json[name].mask), list(from_csv[name].mask), f"mask of {name}")
+            self.assertTrue(np.array_equal(from_json[name].filled(0), from_csv[name].filled(0)), f"values of {name}")
+        self.assertEqual(list(from_json.categories["location"]), list(from_csv.categories["location"]))
+    
+    def test_missing_fields_and_mixed_values(self):
+        """Test that absent fields are null and non-numeric values are category coded"""
+        columns = records_to_columns([{"id": 1, "active": True}, {"id": 2, "tags": ["a"]}])
+        
+        self.assertEqual(columns.column_names, ["id", "active", "tags"], "Fields keep first-appearance order")
+        self.assertEqual(columns["id"].dtype, np.int64)
+        self.assertEqual(list(columns["active"].mask), [False, True])
+        self.assertEqual(list(columns.decode("active").compressed()), ["True"])
+        self.assertEqual(list(columns.decode("tags").compressed()), ['["a"]'])
+    
+    def test_non_record_json(self):
+        """Test that a JSON file that is not a list of objects returns None"""
+        self.json_file.write_text('{"name": "Alice"}')
+        self.assertIsNone(read_json_as_columns(self.json_file))
+        self.json_file.write_text('[1, 2]')
+        self.assertIsNone(read_json_as_columns(self.json_file))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
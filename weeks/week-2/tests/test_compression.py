@@ -0,0 +1,90 @@
+"""
+Unit Tests for Compressed File Handling - Week 2
+Tests codec detection and compressed round-trips through the CSV and JSON handlers
+"""
+
+import unittest
+import tempfile
+import gzip
+import bz2
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.compression import detect_compression, open_file
+from file_handlers.csv_handler import read_csv_as_dicts, iter_csv_rows, write_csv_from_dicts
+from file_handlers.json_handler import read_json_file, write_json_file
+
+class TestCompression(unittest.TestCase):
+    """Test cases for transparent compressed I/O"""
+    
+    def setUp(self):
+        """Set up test data and a temporary directory"""
+        self.rows = [
+            {"name": "Alice", "salary": "75000"},
+            {"name": "Bob", "salary": "80000"}
+        ]
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_csv_round_trip_per_codec(self):
+        """Test that every codec round-trips through write_csv_from_dicts/read_csv_as_dicts"""
+        for extension, codec in ((".gz", "gzip"), (".bz2", "bz2"), (".xz", "xz")):
+            csv_file = self.temp_path / f"employees.csv{extension}"
+            self.assertTrue(write_csv_from_dicts(self.rows, csv_file, compression_level=1))
+            
+            self.assertEqual(detect_compression(csv_file), codec)
+            self.assertEqual(read_csv_as_dicts(csv_file), self.rows, f"{codec} round-trip should preserve rows")
+            self.assertEqual(len(list(iter_csv_rows(csv_file))), 2, f"{codec} should stream too")
+    
+    def test_detection_by_magic_bytes(self):
+        """Test that a gzip file without a .gz extension is still detected"""
+        disguised = self.temp_path / "export.csv"
+        with gzip.open(disguised, 'wt', newline='') as handle:
+            handle.write("name,salary\nAlice,75000\n")
+        
+        self.assertEqual(detect_compression(disguised), "gzip")
+        self.assertEqual(read_csv_as_dicts(disguised), [{"name": "Alice", "salary": "75000"}])
+    
+    def test_bz2_needs_more_than_its_ascii_prefix(self):
+        """Test that a plain CSV starting with 'BZh' is not taken for bz2, but real bz2 streams are"""
+        for header in ("BZh,salary\nAlice,75000\n", "BZh9,salary\nAlice,75000\n"):
+            plain = self.temp_path / "bzh.csv"
+            plain.write_text(header)
+            
+            self.assertIsNone(detect_compression(plain), header)
+            self.assertEqual(read_csv_as_dicts(plain)[0]["salary"], "75000")
+        
+        for content in (b"name\nAlice\n", b""):
+            disguised = self.temp_path / "export.dat"
+            disguised.write_bytes(bz2.compress(content))
+            self.assertEqual(detect_compression(disguised), "bz2", f"bz2 stream of {content!r}")
+    
+    def test_json_round_trip_compressed(self):
+        """Test compressed JSON writing and reading"""
+        json_file = self.temp_path / "company.json.xz"
+        self.assertTrue(write_json_file({"employees": self.rows}, json_file))
+        
+        self.assertEqual(read_json_file(json_file), {"employees": self.rows})
+    
+    def test_plain_files_are_untouched(self):
+        """Test that plain files open normally and unknown codecs are rejected"""
+        plain = self.temp_path / "plain.csv"
+        write_csv_from_dicts(self.rows, plain)
+        
+        self.assertIsNone(detect_compression(plain))
+        self.assertTrue(plain.read_text().startswith("name,salary"), "Plain file should not be compressed")
+        with self.assertRaises(ValueError):
+            open_file(plain, 'r', compression="zip")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
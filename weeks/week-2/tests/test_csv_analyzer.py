@@ -12,7 +12,7 @@ current_dir = Path(__file__).parent
 src_path = current_dir.parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from analyzers.csv_analyzer import analyse_csv_data
+from analyzers.csv_analyzer import analyse_csv_data, analyse_csv_chunks, analyse_csv_columns
 
 class TestCSVAnalyzer(unittest.TestCase):
     """Test cases for CSV data analysis functions"""
@@ -153,6 +153,66 @@ class TestCSVAnalyzer(unittest.TestCase):
         # Should only count the valid numeric values (85, 90, 95)
         self.assertEqual(result["non_null_count"], 3, "Should filter out null patterns correctly")
         self.assertEqual(result["mean"], 90.0, "Mean should be calculated from clean data")
+    
+    def test_chunked_analysis_matches_full_analysis(self):
+        """Test that analysing row batches gives the same result as analysing the full list"""
+        for data in (self.employee_data, self.messy_data, self.text_data):
+            for column in ("salary", "department", "missing"):
+                chunks = [data[i:i + 2] for i in range(0, len(data), 2)]
+                self.assertEqual(analyse_csv_chunks(chunks, column), analyse_csv_data(data, column),
+                                 f"Chunked analysis of '{column}' should match full analysis")
+    
+    def test_chunked_analysis_with_no_chunks(self):
+        """Test chunked analysis with an empty stream"""
+        self.assertIsNone(analyse_csv_chunks([], "salary"), "Should return None for empty stream")
+    
+    def test_multi_column_matches_single_column_analysis(self):
+        """Test that one pass over several columns matches one analyse_csv_data call per column"""
+        for data in (self.employee_data, self.messy_data, self.text_data):
+            columns = list(data[0].keys())
+            report = analyse_csv_columns(data, columns)
+            
+            self.assertEqual(report["row_count"], len(data))
+            self.assertEqual(report["column_names"], columns)
+            for column in columns:
+                expected = analyse_csv_data(data, column)
+                expected_stats = {key: expected[key] for key in ("non_null_count", "mean", "min", "max")}
+                self.assertEqual(report["columns"][column], expected_stats, f"Stats for '{column}' should match")
+    
+    def test_multi_column_auto_detects_numeric_columns(self):
+        """Test that without column names only numeric columns are reported"""
+        self.assertEqual(list(analyse_csv_columns(self.employee_data)["columns"]), ["age", "salary", "experience"])
+        self.assertEqual(list(analyse_csv_columns(self.messy_data)["columns"]), ["salary", "experience"])
+        self.assertEqual(analyse_csv_columns(self.text_data)["columns"], {}, "Text columns are skipped")
+    
+    def test_multi_column_missing_columns_and_empty_data(self):
+        """Test that unknown columns are skipped and empty input returns None"""
+        report = analyse_csv_columns(self.employee_data, ["salary", "missing"])
+        self.assertEqual(list(report["columns"]), ["salary"])
+        self.assertIsNone(analyse_csv_columns([]))
+        self.assertIsNone(analyse_csv_columns(None))
+    
+    def test_numpy_backend_matches_python_backend(self):
+        """Test that the vectorized backend returns exactly the same result dict"""
+        import random
+        generator = random.Random(11)
+        large_data = [{"salary": generator.choice(["", "NA", None, str(generator.randint(1, 10**6)), f"{generator.random() * 1e5:.3f}"]),
+                       "bonus": generator.choice([None, generator.random() * 1000, generator.randint(0, 50)]),
+                       "score": generator.choice(["1e3", "1.5", "-0.5"])} for _ in range(500)]
+        for data in (self.employee_data, self.messy_data, self.text_data, large_data):
+            for column in list(data[0].keys()) + ["missing"]:
+                self.assertEqual(analyse_csv_data(data, column, backend="numpy"), analyse_csv_data(data, column, backend="python"),
+                                 f"Backends should agree on '{column}'")
+        self.assertEqual(analyse_csv_data(large_data, "salary"), analyse_csv_data(large_data, "salary", backend="python"))
+        
+        nan_data = [{"score": value} for value in ["1", "nan", "3"]]
+        self.assertEqual(repr(analyse_csv_data(nan_data, "score", backend="numpy")),
+                         repr(analyse_csv_data(nan_data, "score", backend="python")), "NaN cells follow the Python semantics")
+    
+    def test_unknown_backend(self):
+        """Test that an unsupported backend name is rejected"""
+        with self.assertRaises(ValueError):
+            analyse_csv_data(self.employee_data, "salary", backend="gpu")
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Unit Tests for the CSV Sidecar Cache - Week 2
+Tests cache hits, invalidation on source change and cache clearing
+"""
+
+import unittest
+import tempfile
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_cache import read_csv_cached, clear_csv_cache, _sidecar_dir
+
+class TestCSVCache(unittest.TestCase):
+    """Test cases for read_csv_cached"""
+    
+    def setUp(self):
+        """Create a small CSV file in a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "employees.csv"
+        self.csv_file.write_text("name,salary,location\nAlice,75000,Pune\nBob,,Mumbai\n")
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_second_read_is_memory_mapped(self):
+        """Test that the first read writes a sidecar and the second loads it via mmap"""
+        first = read_csv_cached(self.csv_file)
+        self.assertTrue(_sidecar_dir(self.csv_file).exists(), "First read should create the sidecar")
+        
+        second = read_csv_cached(self.csv_file)
+        self.assertIsInstance(second["salary"].data, np.memmap, "Cached read should be memory-mapped")
+        self.assertEqual(list(second["salary"].mask), list(first["salary"].mask), "Null mask should round-trip")
+        self.assertEqual(list(second.decode("location")), ["Pune", "Mumbai"], "Categories should round-trip")
+    
+    def test_damaged_sidecar_is_rebuilt(self):
+        """Test that missing, truncated or corrupt sidecar files are treated as a cache miss"""
+        read_csv_cached(self.csv_file)
+        sidecar = _sidecar_dir(self.csv_file)
+        damages = [
+            lambda: (sidecar / "col1.values.npy").unlink(),
+            lambda: (sidecar / "col1.values.npy").write_bytes(b"\x93NUMPY truncated"),
+            lambda: (sidecar / "col2.categories.json").write_text('["Pune", '),
+        ]
+        for damage in damages:
+            damage()
+            data = read_csv_cached(self.csv_file)
+            self.assertIsNotNone(data, "A damaged sidecar should be ignored, not reported as an error")
+            self.assertEqual(list(data.decode("location")), ["Pune", "Mumbai"])
+            self.assertIsInstance(read_csv_cached(self.csv_file)["salary"].data, np.memmap, "Sidecar should be rebuilt")
+    
+    def test_cache_invalidated_when_source_changes(self):
+        """Test that editing the CSV makes the next read re-parse it"""
+        read_csv_cached(self.csv_file)
+        self.csv_file.write_text("name,salary,location\nAlice,75000,Pune\nBob,80000,Mumbai\nCara,90000,Delhi\n")
+        os.utime(self.csv_file, ns=(0, 1))  # force a different mtime even on coarse filesystems
+        
+        refreshed = read_csv_cached(self.csv_file)
+        self.assertEqual(refreshed.row_count, 3, "Should see the new rows")
+        self.assertEqual(refreshed["salary"].sum(), 245000)
+    
+    def test_custom_cache_dir_and_clear(self):
+        """Test that sidecars can live elsewhere and be removed"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        read_csv_cached(self.csv_file, cache_dir=cache_dir)
+        
+        self.assertEqual(len(list(cache_dir.iterdir())), 1, "Sidecar should be written to cache_dir")
+        self.assertTrue(clear_csv_cache(self.csv_file, cache_dir=cache_dir))
+        self.assertFalse(clear_csv_cache(self.csv_file, cache_dir=cache_dir), "Nothing left to clear")
+    
+    def test_read_nonexistent_file(self):
+        """Test reading a file that doesn't exist"""
+        self.assertIsNone(read_csv_cached(Path(self.temp_dir) / "missing.csv"))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
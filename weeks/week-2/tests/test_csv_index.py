@@ -0,0 +1,82 @@
+"""
+Unit Tests for the CSV Row Index - Week 2
+Tests index building (including quoted newlines), random access reads and staleness
+"""
+
+import unittest
+import tempfile
+import csv
+import os
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.csv_index import build_csv_index, load_csv_index, read_csv_rows
+
+class TestCSVIndex(unittest.TestCase):
+    """Test cases for byte-offset random access into CSV files"""
+    
+    def setUp(self):
+        """Write a CSV with multi-line quoted fields"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "log.csv"
+        with open(self.csv_file, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["id", "message"])
+            for i in range(250):
+                writer.writerow([i, f'multi\nline "{i}"' if i % 7 == 0 else f"event {i}"])
+        self.all_rows = read_csv_as_dicts(self.csv_file)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_index_records_every_nth_row(self):
+        """Test that the index holds one offset per block of rows"""
+        index_file = build_csv_index(self.csv_file, every=100)
+        index = load_csv_index(self.csv_file, index_file)
+        
+        self.assertEqual(index_file.name, "log.csv.idx")
+        self.assertEqual(index["row_count"], 250)
+        self.assertEqual(len(index["offsets"]), 3, "Rows 0, 100 and 200 should be indexed")
+    
+    def test_random_access_matches_full_read(self):
+        """Test that ranges read through the index match slices of the full file"""
+        build_csv_index(self.csv_file, every=16)
+        for start, stop in ((0, 5), (15, 17), (98, 133), (240, 400)):
+            self.assertEqual(read_csv_rows(self.csv_file, start, stop), self.all_rows[start:stop],
+                             f"Rows {start}:{stop} should match")
+    
+    def test_index_built_and_refreshed_automatically(self):
+        """Test that a missing index is built and a stale one is rebuilt"""
+        self.assertEqual(read_csv_rows(self.csv_file, 249, 250)[0]["id"], "249")
+        
+        with open(self.csv_file, 'a', newline='') as csvfile:
+            csv.writer(csvfile).writerow([250, "appended"])
+        os.utime(self.csv_file, ns=(0, 1))
+        
+        self.assertEqual(read_csv_rows(self.csv_file, 250, 251), [{"id": "250", "message": "appended"}])
+    
+    def test_stale_index_keeps_its_stride(self):
+        """Test that rebuilding a stale index reuses its stored stride unless one is passed"""
+        build_csv_index(self.csv_file, every=16)
+        with open(self.csv_file, 'a', newline='') as csvfile:
+            csv.writer(csvfile).writerow([250, "appended"])
+        os.utime(self.csv_file, ns=(0, 1))
+        
+        self.assertEqual(load_csv_index(self.csv_file)["every"], 16, "A stale index should keep every=16")
+        os.utime(self.csv_file, ns=(0, 2))
+        self.assertEqual(load_csv_index(self.csv_file, every=50)["every"], 50, "An explicit stride wins")
+    
+    def test_invalid_range(self):
+        """Test that an inverted range is reported as an error"""
+        self.assertIsNone(read_csv_rows(self.csv_file, 10, 5))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
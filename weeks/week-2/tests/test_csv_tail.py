@@ -0,0 +1,104 @@
+"""
+Unit Tests for the Incremental CSV Tail Reader - Week 2
+Tests incremental reads, partial lines, persisted state and truncation
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_tail import CSVTailReader
+
+class TestCSVTailReader(unittest.TestCase):
+    """Test cases for append-only CSV ingestion"""
+    
+    def setUp(self):
+        """Create a log file with a header and two rows"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / "events.csv"
+        self.log_file.write_text("id,event\n1,login\n2,logout\n")
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def append(self, text):
+        with open(self.log_file, 'a') as log:
+            log.write(text)
+    
+    def test_only_new_rows_are_returned(self):
+        """Test that each call parses only rows appended since the previous call"""
+        tail = CSVTailReader(self.log_file)
+        self.assertEqual([row["id"] for row in tail.read_new_rows()], ["1", "2"])
+        self.assertEqual(tail.read_new_rows(), [], "Nothing new should give an empty list")
+        
+        self.append("3,purchase\n")
+        self.assertEqual(tail.read_new_rows(), [{"id": "3", "event": "purchase"}])
+    
+    def test_partial_line_waits_for_completion(self):
+        """Test that a half-written row (or an open quoted field) is not consumed early"""
+        tail = CSVTailReader(self.log_file, persist=False)
+        tail.read_new_rows()
+        
+        self.append('3,"multi\nline')
+        self.assertEqual(tail.read_new_rows(), [], "Incomplete record should be left for later")
+        
+        self.append(' note"\n')
+        self.assertEqual(tail.read_new_rows(), [{"id": "3", "event": "multi\nline note"}])
+    
+    def test_state_survives_restart(self):
+        """Test that a new reader resumes from the saved offset and header"""
+        CSVTailReader(self.log_file).read_new_rows()
+        self.append("3,purchase\n")
+        
+        resumed = CSVTailReader(self.log_file)
+        self.assertEqual(resumed.read_new_rows(), [{"id": "3", "event": "purchase"}])
+    
+    def test_failed_read_commits_nothing(self):
+        """Test that an undecodable later block leaves the saved position at the earlier rows"""
+        self.append("".join(f"{index},event\n" for index in range(3, 2000)))
+        with open(self.log_file, 'ab') as log:
+            log.write(b"2000,bad \xff byte\n")
+        
+        self.assertIsNone(CSVTailReader(self.log_file).read_new_rows(block_size=1024))
+        
+        self.log_file.write_bytes(self.log_file.read_bytes().replace(b"\xff", b"x"))
+        rows = CSVTailReader(self.log_file).read_new_rows(block_size=1024)
+        self.assertEqual(len(rows), 2000, "Rows from blocks before the failure must not be lost")
+        self.assertEqual(rows[-1], {"id": "2000", "event": "bad x byte"})
+    
+    def test_iterator_commits_only_delivered_blocks(self):
+        """Test that rows not taken from iter_new_rows() are returned again by the next read"""
+        self.append("".join(f"{index},event\n" for index in range(3, 2000)))
+        tail = CSVTailReader(self.log_file)
+        rows = tail.iter_new_rows(block_size=1024)
+        taken = [next(rows) for _ in range(5)]
+        rows.close()
+        
+        resumed = CSVTailReader(self.log_file).read_new_rows()
+        self.assertEqual(resumed[:5], taken, "The first block was never fully delivered")
+        self.assertEqual(len(resumed), 1999)
+    
+    def test_truncated_file_is_reread(self):
+        """Test that a rotated (smaller) file is read again from the top"""
+        tail = CSVTailReader(self.log_file, persist=False)
+        tail.read_new_rows()
+        self.log_file.write_text("id,event\n9,restart\n")
+        
+        self.assertEqual(tail.read_new_rows(), [{"id": "9", "event": "restart"}])
+    
+    def test_follow_with_timeout(self):
+        """Test that follow() yields existing rows and stops after the timeout"""
+        tail = CSVTailReader(self.log_file, persist=False)
+        rows = list(tail.follow(poll_interval=0.01, timeout=0.05))
+        self.assertEqual(len(rows), 2)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -15,8 +15,8 @@ current_dir = Path(__file__).parent
 src_path = current_dir.parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from file_handlers.csv_handler import read_csv_as_dicts, write_csv_from_dicts
-from file_handlers.json_handler import read_json_file, write_json_file
+from file_handlers.csv_handler import read_csv_as_dicts, iter_csv_rows, iter_csv_chunks, write_csv_from_dicts, CSVStreamWriter
+from file_handlers.json_handler import read_json_file, write_json_file, iter_jsonl, write_jsonl, iter_json_array
 
 class TestCSVHandler(unittest.TestCase):
     """Test cases for CSV file operations"""
@@ -78,6 +78,125 @@ class TestCSVHandler(unittest.TestCase):
         read_data = read_csv_as_dicts(csv_file)
         self.assertIsNotNone(read_data, "Should read with pathlib.Path")
         self.assertEqual(len(read_data), 3, "Should have correct number of records")
+    
+    def test_iter_csv_rows_matches_full_read(self):
+        """Test that the streaming reader yields the same rows as read_csv_as_dicts"""
+        csv_file = self.temp_path / "stream.csv"
+        write_csv_from_dicts(self.test_data, csv_file)
+        
+        rows = iter_csv_rows(csv_file)
+        self.assertEqual(next(rows)["name"], "Alice", "First row should be available immediately")
+        self.assertEqual([row["name"] for row in rows], ["Bob", "Charlie"], "Remaining rows should follow in order")
+    
+    def test_iter_csv_chunks_batches(self):
+        """Test that the chunked reader yields batches of at most chunk_size rows"""
+        csv_file = self.temp_path / "chunks.csv"
+        write_csv_from_dicts(self.test_data, csv_file)
+        
+        chunks = list(iter_csv_chunks(csv_file, chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1], "Should split 3 rows into 2 + 1")
+        self.assertEqual(chunks[1][0]["salary"], "90000", "Last chunk should hold the last row")
+    
+    def test_iter_csv_rows_nonexistent_file(self):
+        """Test that streaming a missing file yields nothing instead of raising"""
+        rows = list(iter_csv_rows(self.temp_path / "missing.csv"))
+        self.assertEqual(rows, [], "Should yield no rows for nonexistent file")
+    
+    def test_read_with_column_projection(self):
+        """Test that only the requested columns are returned"""
+        csv_file = self.temp_path / "projection.csv"
+        write_csv_from_dicts(self.test_data, csv_file)
+        
+        read_data = read_csv_as_dicts(csv_file, columns=["salary", "name"])
+        self.assertEqual(read_data[0], {"salary": "75000", "name": "Alice"}, "Should keep only projected fields")
+    
+    def test_read_with_where_conditions(self):
+        """Test numeric and string predicates, including filtering on a non-projected column"""
+        csv_file = self.temp_path / "predicate.csv"
+        write_csv_from_dicts(self.test_data + [{"name": "Dave", "age": "NA", "salary": ""}], csv_file)
+        
+        high_earners = read_csv_as_dicts(csv_file, columns=["name"], where=[("salary", ">", 75000)])
+        self.assertEqual(high_earners, [{"name": "Bob"}, {"name": "Charlie"}], "Null salary should not match")
+        
+        named = list(iter_csv_rows(csv_file, where=[("name", "in", ("Alice", "Dave")), ("age", "<", 30)]))
+        self.assertEqual([row["name"] for row in named], ["Alice"], "All conditions should be ANDed")
+        
+        by_age = read_csv_as_dicts(csv_file, columns=["name"], where=[("age", "in", [25, 35.0])])
+        self.assertEqual(by_age, [{"name": "Alice"}, {"name": "Charlie"}], "Numeric 'in' should compare parsed cells")
+        self.assertIsNone(read_csv_as_dicts(csv_file, where=[("age", "in", [25, "NA"])]), "Mixed 'in' values are rejected")
+    
+    def test_read_with_unknown_column(self):
+        """Test that projecting or filtering on a missing column reports an error"""
+        csv_file = self.temp_path / "unknown.csv"
+        write_csv_from_dicts(self.test_data, csv_file)
+        
+        self.assertIsNone(read_csv_as_dicts(csv_file, columns=["bonus"]), "Unknown column should return None")
+        self.assertIsNone(read_csv_as_dicts(csv_file, where=[("bonus", ">", 1)]), "Unknown where column should return None")
+    
+    def test_intern_columns_share_values(self):
+        """Test that interned columns reuse one string object per distinct value"""
+        csv_file = self.temp_path / "interned.csv"
+        rows = [{"id": str(i), "location": ["Pune", "Mumbai"][i % 2]} for i in range(6)]
+        write_csv_from_dicts(rows, csv_file)
+        
+        explicit = read_csv_as_dicts(csv_file, intern_columns=["location"])
+        self.assertEqual(explicit, rows, "Interning should not change values")
+        self.assertIs(explicit[0]["location"], explicit[2]["location"], "Equal values should be one object")
+        
+        auto = read_csv_as_dicts(csv_file, intern_columns="auto", max_cardinality=2)
+        self.assertIs(auto[1]["location"], auto[5]["location"], "Low-cardinality column should be shared")
+        self.assertEqual(auto, rows)
+        
+        single = read_csv_as_dicts(csv_file, intern_columns="location")
+        self.assertIs(single[0]["location"], single[4]["location"], "A plain column name should work like a list")
+        self.assertIsNone(read_csv_as_dicts(csv_file, intern_columns=["bonus"]), "Unknown intern column should return None")
+    
+    def test_write_csv_from_generator(self):
+        """Test that write_csv_from_dicts accepts an iterator, not just a list"""
+        csv_file = self.temp_path / "generated.csv"
+        result = write_csv_from_dicts((row for row in self.test_data), csv_file)
+        
+        self.assertTrue(result, "Generator input should be written")
+        self.assertEqual(read_csv_as_dicts(csv_file), self.test_data)
+
+class TestCSVStreamWriter(unittest.TestCase):
+    """Test cases for the incremental CSV writer"""
+    
+    def setUp(self):
+        """Set up a temporary output file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "out" / "stream.csv"
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_batches_and_buffer_flush(self):
+        """Test writing successive batches with a tiny buffer and explicit flush"""
+        with CSVStreamWriter(self.csv_file, buffer_size=16) as writer:
+            writer.write_rows([{"id": "1", "score": "85"}, {"id": "2", "score": "90"}])
+            writer.write_rows({"id": str(i), "score": "70"} for i in range(3, 6))
+            writer.flush()
+            self.assertEqual(len(read_csv_as_dicts(self.csv_file)), 5, "flush() should persist every row")
+        
+        self.assertTrue(writer.closed, "Context manager should close the file")
+        self.assertEqual(writer.rows_written, 5)
+    
+    def test_append_mode_keeps_single_header(self):
+        """Test that appending reuses the existing header and column order"""
+        with CSVStreamWriter(self.csv_file) as writer:
+            writer.write_row({"name": "Alice", "role": "Engineer"})
+        with CSVStreamWriter(self.csv_file, append=True) as writer:
+            writer.write_row({"role": "Designer", "name": "Bob"})
+        
+        self.assertEqual(self.csv_file.read_text().count("name,role"), 1, "Header should be written once")
+        self.assertEqual(read_csv_as_dicts(self.csv_file)[1], {"name": "Bob", "role": "Designer"})
+    
+    def test_header_only_when_no_rows(self):
+        """Test that closing without rows still writes the header when fieldnames are known"""
+        CSVStreamWriter(self.csv_file, fieldnames=["name", "salary"]).close()
+        self.assertEqual(self.csv_file.read_text().strip(), "name,salary")
 
 class TestJSONHandler(unittest.TestCase):
     """Test cases for JSON file operations"""
@@ -161,5 +280,107 @@ class TestJSONHandler(unittest.TestCase):
         self.assertTrue(read_data["boolean"], "Boolean should be preserved")
         self.assertIsNone(read_data["null"], "None should be preserved")
 
+class TestJSONLines(unittest.TestCase):
+    """Test cases for JSON Lines streaming"""
+    
+    def setUp(self):
+        """Set up records and a temporary directory"""
+        self.records = [{"name": "Alice", "salary": 75000}, {"name": "Bob", "salary": None}, [1, 2], "text"]
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_write_and_iter_round_trip(self):
+        """Test writing records from a generator and streaming them back"""
+        jsonl_file = self.temp_path / "events.jsonl"
+        self.assertTrue(write_jsonl((record for record in self.records), jsonl_file, batch_size=3))
+        
+        self.assertEqual(list(iter_jsonl(jsonl_file)), self.records)
+        self.assertEqual(len(jsonl_file.read_text().splitlines()), 4, "One record per line")
+    
+    def test_append_and_batches(self):
+        """Test append mode and batched reading"""
+        jsonl_file = self.temp_path / "events.jsonl.gz"
+        write_jsonl(self.records[:2], jsonl_file)
+        write_jsonl(self.records[2:], jsonl_file, append=True)
+        
+        batches = list(iter_jsonl(jsonl_file, batch_size=3))
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertEqual(batches[1], ["text"])
+        with self.assertRaises(ValueError, msg="batch_size=0 is a caller error, like chunk_size in iter_csv_chunks"):
+            list(iter_jsonl(jsonl_file, batch_size=0))
+    
+    def test_bad_lines_are_skipped_and_counted(self):
+        """Test that invalid lines do not abort the read"""
+        jsonl_file = self.temp_path / "mixed.jsonl"
+        jsonl_file.write_text('{"id": 1}\n{broken\n\n{"id": 2}\nnot json\n')
+        
+        stats = {}
+        records = list(iter_jsonl(jsonl_file, stats=stats))
+        self.assertEqual(records, [{"id": 1}, {"id": 2}])
+        self.assertEqual(stats, {"records": 2, "bad_lines": 2, "failed": False})
+    
+    def test_iter_nonexistent_jsonl(self):
+        """Test that streaming a missing file yields nothing"""
+        stats = {}
+        self.assertEqual(list(iter_jsonl(self.temp_path / "missing.jsonl", stats=stats)), [])
+        self.assertTrue(stats["failed"], "stats should tell a missing file from an empty one")
+
+class TestJSONArrayStreaming(unittest.TestCase):
+    """Test cases for incremental parsing of top-level JSON arrays"""
+    
+    def setUp(self):
+        """Set up a mixed array and a temporary directory"""
+        self.elements = [{"name": "Alice", "tags": ["a", "]", ","]}, 12345, -3.5e10, None, "x" * 500, []]
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_elements_match_json_load(self):
+        """Test that every read size yields the same elements as json.load"""
+        json_file = self.temp_path / "array.json"
+        write_json_file(self.elements, json_file)
+        
+        for read_size in (1, 3, 16, 1 << 16):
+            self.assertEqual(list(iter_json_array(json_file, read_size=read_size)), self.elements,
+                             f"read_size={read_size} should not split elements or numbers")
+    
+    def test_numbers_cut_by_default_window(self):
+        """Test a large top-level float array whose numbers straddle the default 64 KiB window"""
+        json_file = self.temp_path / "floats.json"
+        floats = [index * 1234.5 + 0.125 for index in range(60000)] + [1e20, 1.5e-07, -2.5E+300]
+        json_file.write_text(json.dumps(floats))
+        
+        self.assertEqual(list(iter_json_array(json_file)), floats,
+                         "A number cut right after '.', 'e' or digits must be re-read, not truncated")
+    
+    def test_compressed_and_empty_arrays(self):
+        """Test gzip input and an empty array"""
+        json_file = self.temp_path / "array.json.gz"
+        write_json_file(self.elements, json_file)
+        self.assertEqual(list(iter_json_array(json_file)), self.elements)
+        
+        empty_file = self.temp_path / "empty.json"
+        empty_file.write_text("  [ ]\n")
+        self.assertEqual(list(iter_json_array(empty_file)), [])
+    
+    def test_malformed_arrays_stop_cleanly(self):
+        """Test that elements before an error are yielded and the generator then ends"""
+        json_file = self.temp_path / "broken.json"
+        json_file.write_text('[{"id": 1}, {"id": 2} {"id": 3}]')
+        self.assertEqual(list(iter_json_array(json_file)), [{"id": 1}, {"id": 2}])
+        
+        json_file.write_text('{"not": "an array"}')
+        self.assertEqual(list(iter_json_array(json_file)), [])
+        self.assertEqual(list(iter_json_array(self.temp_path / "missing.json")), [])
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
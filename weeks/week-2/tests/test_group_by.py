@@ -0,0 +1,107 @@
+"""
+Unit Tests for Group-By Aggregation - Week 2
+Tests hash aggregation per key against analyse_csv_data on pre-split groups
+"""
+
+import unittest
+import pickle
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from analyzers.group_by import GroupByAggregator, group_by
+from analyzers.csv_analyzer import analyse_csv_data
+
+class TestGroupBy(unittest.TestCase):
+    """Test cases for group_by and GroupByAggregator"""
+    
+    def setUp(self):
+        """Set up employee rows with nulls and repeated locations/roles"""
+        rng = random.Random(7)
+        locations = ["Mumbai", "Pune", "Delhi"]
+        roles = ["Engineer", "Manager"]
+        self.rows = []
+        for index in range(3000):
+            salary = "" if index % 50 == 0 else str(rng.randint(40000, 150000))
+            self.rows.append({
+                "id": str(index),
+                "location": locations[index % 3],
+                "role": roles[index % 2],
+                "salary": salary,
+                "experience": str(index % 20),
+            })
+    
+    def test_matches_analyse_csv_data_per_group(self):
+        """Test that each group's mean/min/max equal analyse_csv_data on the pre-split rows"""
+        results = group_by(self.rows, keys=["location"], aggs={"salary": ["count", "null_count", "mean", "min", "max"]})
+        
+        self.assertEqual([result["location"] for result in results], ["Mumbai", "Pune", "Delhi"], "Groups keep first-seen order")
+        for result in results:
+            group_rows = [row for row in self.rows if row["location"] == result["location"]]
+            expected = analyse_csv_data(group_rows, "salary")
+            self.assertEqual(result["row_count"], len(group_rows))
+            self.assertEqual(result["salary_count"], expected["non_null_count"])
+            self.assertEqual(result["salary_null_count"], len(group_rows) - expected["non_null_count"])
+            self.assertAlmostEqual(result["salary_mean"], expected["mean"], places=6)
+            self.assertEqual((result["salary_min"], result["salary_max"]), (expected["min"], expected["max"]))
+    
+    def test_multiple_keys_and_aggregations(self):
+        """Test grouping on two keys with sum, std and median"""
+        results = group_by(self.rows, keys=["location", "role"], aggs={"salary": ["sum", "std", "median"], "experience": "max"})
+        
+        self.assertEqual(len(results), 6, "3 locations x 2 roles")
+        for result in results:
+            group_rows = [row for row in self.rows
+                          if (row["location"], row["role"]) == (result["location"], result["role"])]
+            salaries = [float(row["salary"]) for row in group_rows if row["salary"]]
+            self.assertAlmostEqual(result["salary_sum"], sum(salaries), places=4)
+            self.assertAlmostEqual(result["salary_std"], statistics.stdev(salaries), places=4)
+            self.assertAlmostEqual(result["salary_median"], statistics.median(salaries), delta=2000,
+                                   msg="Median is approximate (KLL sketch)")
+            self.assertEqual(result["experience_max"], max(float(row["experience"]) for row in group_rows))
+    
+    def test_merged_partials_equal_single_pass(self):
+        """Test that partials from separate chunks (pickled, as from workers) merge to the full result"""
+        aggs = {"salary": ["count", "sum", "mean", "min", "max", "var"]}
+        full = group_by(self.rows, keys=["role"], aggs=aggs)
+        
+        total = GroupByAggregator(["role"], aggs)
+        for start in range(0, len(self.rows), 700):
+            partial = GroupByAggregator(["role"], aggs).update(self.rows[start:start + 700])
+            total.merge(pickle.loads(pickle.dumps(partial)))
+        merged = total.result()
+        
+        self.assertEqual([result["role"] for result in merged], [result["role"] for result in full])
+        for merged_result, full_result in zip(merged, full):
+            self.assertEqual(merged_result["row_count"], full_result["row_count"])
+            self.assertEqual(merged_result["salary_count"], full_result["salary_count"])
+            self.assertAlmostEqual(merged_result["salary_mean"], full_result["salary_mean"], places=6)
+            self.assertAlmostEqual(merged_result["salary_var"], full_result["salary_var"], delta=1e-3)
+            self.assertEqual(merged_result["salary_max"], full_result["salary_max"])
+    
+    def test_na_markers_and_errors(self):
+        """Test the N/A markers for non-numeric and all-null groups, and unsupported aggregations"""
+        rows = [
+            {"team": "a", "score": "high"},
+            {"team": "a", "score": "3"},
+            {"team": "b", "score": ""},
+        ]
+        results = {result["team"]: result for result in group_by(rows, "team", {"score": ["count", "mean", "null_count"]})}
+        
+        self.assertEqual(results["a"]["score_count"], 2, "count includes non-numeric cells, like non_null_count")
+        self.assertEqual(results["a"]["score_mean"], "N/A (non-numeric data)")
+        self.assertEqual(results["b"]["score_mean"], "N/A (no non-null values)")
+        self.assertEqual(results["b"]["score_null_count"], 1)
+        with self.assertRaises(ValueError, msg="Unknown aggregation names are rejected"):
+            group_by(rows, ["team"], {"score": "mode"})
+        with self.assertRaises(ValueError, msg="Partials with different keys cannot merge"):
+            GroupByAggregator(["team"]).merge(GroupByAggregator(["score"]))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
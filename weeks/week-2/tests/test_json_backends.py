@@ -0,0 +1,100 @@
+"""
+Unit Tests for Pluggable JSON Backends - Week 2
+Tests backend selection and that accelerated backends keep stdlib's output and parsing
+"""
+
+import unittest
+import tempfile
+import json
+import datetime
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.json_backends import available_json_backends, get_json_backend, set_json_backend
+from file_handlers.json_handler import read_json_file, write_json_file, iter_jsonl, write_jsonl
+
+class TestJSONBackends(unittest.TestCase):
+    """Test cases for backend selection and stdlib compatibility"""
+    
+    def setUp(self):
+        """Set up sample documents and a temporary directory"""
+        self.document = {"zeta": [1, 2.5, None, True, {}], "alpha": {"name": "Alice", "tags": []}, "big": 2 ** 70}
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Restore the global backend and clean up temporary files"""
+        import shutil
+        set_json_backend('auto')
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_selection(self):
+        """Test that stdlib is always available and unknown names are rejected"""
+        self.assertEqual(available_json_backends()[-1], 'stdlib')
+        self.assertEqual(get_json_backend('auto').name, available_json_backends()[0])
+        
+        set_json_backend('stdlib')
+        self.assertEqual(get_json_backend().name, 'stdlib', "The global choice applies when no backend is passed")
+        with self.assertRaises(ValueError):
+            set_json_backend('simdjson')
+        self.assertEqual(get_json_backend().name, 'stdlib', "A rejected name must not change the default")
+    
+    def test_dumps_match_stdlib(self):
+        """Test byte-identical output for every installed backend and layout"""
+        documents = [self.document, ["café", "\x7f", "</script>"], [0.5, -0.0, 12345.678], "plain",
+                     {"score": float("nan"), "none": None}, [1.5e-07, 1e20, float("-inf"), 0.0001, 1e-05]]
+        for name in available_json_backends():
+            backend = get_json_backend(name)
+            for document in documents:
+                for options in ({"indent": 2}, {"indent": 2, "sort_keys": True}, {"indent": 4}, {"compact": True}, {}):
+                    expected = get_json_backend('stdlib').dumps(document, **options)
+                    self.assertEqual(backend.dumps(document, **options), expected, f"{name} with {options}")
+    
+    def test_unsupported_values_raise_like_stdlib(self):
+        """Test that values stdlib cannot serialize (dates, UUID, Enum) raise TypeError with every backend"""
+        import enum
+        import uuid
+        Color = enum.Enum("Color", "RED")
+        values = [datetime.date(2024, 10, 9), uuid.UUID(int=1), Color.RED]
+        for name in available_json_backends():
+            for value in values:
+                for options in ({"indent": 2}, {"compact": True}):
+                    with self.assertRaises(TypeError, msg=f"{name} with {value!r}"):
+                        get_json_backend(name).dumps({"value": [value]}, **options)
+            self.assertFalse(write_json_file({"id": uuid.UUID(int=1)}, self.temp_path / f"{name}.json", backend=name),
+                             "write_json_file should fail the same way with every backend")
+    
+    def test_loads_fall_back_to_stdlib(self):
+        """Test documents outside the accelerated parsers' range and invalid input"""
+        for name in available_json_backends():
+            backend = get_json_backend(name)
+            self.assertEqual(backend.loads('{"n": 1180591620717411303424}'), {"n": 2 ** 70})
+            self.assertTrue(backend.loads(b'[NaN]')[0] != backend.loads(b'[NaN]')[0], "NaN is accepted like stdlib")
+            with self.assertRaises(json.JSONDecodeError):
+                backend.loads('{"broken": ')
+    
+    def test_file_round_trip_per_backend(self):
+        """Test that file writers produce the same bytes whatever the backend"""
+        for name in available_json_backends():
+            json_file = self.temp_path / f"{name}.json"
+            jsonl_file = self.temp_path / f"{name}.jsonl"
+            self.assertTrue(write_json_file(self.document, json_file, sort_keys=True, backend=name))
+            self.assertTrue(write_jsonl([self.document, [1, 2]], jsonl_file, backend=name))
+            
+            self.assertEqual(json_file.read_text(), json.dumps(self.document, indent=2, sort_keys=True))
+            self.assertEqual(read_json_file(json_file, backend=name), self.document)
+            self.assertEqual(list(iter_jsonl(jsonl_file, backend=name)), [self.document, [1, 2]])
+    
+    def test_unknown_backend_per_call(self):
+        """Test that a bad backend name is reported and the read returns None"""
+        json_file = self.temp_path / "data.json"
+        write_json_file(self.document, json_file)
+        self.assertIsNone(read_json_file(json_file, backend="simdjson"))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
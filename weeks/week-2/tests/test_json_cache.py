@@ -0,0 +1,115 @@
+"""
+Unit Tests for the JSON Read Cache - Week 2
+Tests hits, invalidation on file change, LRU eviction and read-only views
+"""
+
+import unittest
+import tempfile
+import copy
+import json
+import os
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.json_cache import JSONReadCache, freeze, thaw
+from file_handlers.json_handler import write_json_file
+
+class TestJSONReadCache(unittest.TestCase):
+    """Test cases for the memoizing JSON reader"""
+    
+    def setUp(self):
+        """Set up a config file and a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.config = {"service": "api", "limits": {"rps": 100}, "regions": ["in", "us"]}
+        self.config_file = self.temp_path / "config.json"
+        write_json_file(self.config, self.config_file)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_hits_return_same_object(self):
+        """Test that repeated reads are served from memory"""
+        cache = JSONReadCache()
+        first = cache.read(self.config_file)
+        second = cache.read(self.config_file)
+        
+        self.assertEqual(first, self.config)
+        self.assertIs(first, second, "A hit should return the cached object")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertGreater(stats["bytes"], 0)
+    
+    def test_changed_file_is_reread(self):
+        """Test that a new mtime/size invalidates the entry"""
+        cache = JSONReadCache()
+        cache.read(self.config_file)
+        write_json_file({"service": "worker"}, self.config_file)
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        self.assertEqual(cache.read(self.config_file), {"service": "worker"})
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(cache.stats()["entries"], 1, "The stale entry is replaced, not kept")
+    
+    def test_lru_eviction_under_budget(self):
+        """Test that the least recently used file is evicted when the budget is exceeded"""
+        paths = []
+        for index in range(3):
+            path = self.temp_path / f"lookup{index}.json"
+            write_json_file({"values": list(range(50))}, path)
+            paths.append(path)
+        entry_size = freeze({"values": list(range(50))})[1]
+        cache = JSONReadCache(max_bytes=entry_size * 2)
+        
+        cache.read(paths[0])
+        cache.read(paths[1])
+        cache.read(paths[0])  # paths[1] is now least recently used
+        cache.read(paths[2])
+        
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+        cache.read(paths[0])
+        self.assertEqual(cache.stats()["hits"], 2, "paths[0] should have survived eviction")
+    
+    def test_values_are_read_only(self):
+        """Test that cached values cannot be mutated but can be thawed"""
+        cache = JSONReadCache()
+        config = cache.read(self.config_file)
+        
+        with self.assertRaises(TypeError):
+            config["service"] = "changed"
+        with self.assertRaises(TypeError):
+            config["regions"].append("eu")
+        with self.assertRaises(TypeError):
+            config["limits"].update(rps=1)
+        
+        editable = thaw(config)
+        editable["regions"].append("eu")
+        self.assertEqual(cache.read(self.config_file), self.config, "Edits to a thawed copy must not leak")
+        self.assertEqual(copy.deepcopy(config), self.config)
+        self.assertEqual(json.loads(json.dumps(config)), self.config)
+    
+    def test_missing_and_invalid_files(self):
+        """Test that failed reads return None and are not cached"""
+        cache = JSONReadCache()
+        self.assertIsNone(cache.read(self.temp_path / "missing.json"))
+        
+        broken_file = self.temp_path / "broken.json"
+        broken_file.write_text('{"broken": ')
+        self.assertIsNone(cache.read(broken_file))
+        self.assertEqual(cache.stats()["entries"], 0)
+        
+        from unittest import mock
+        with mock.patch.object(Path, "stat", side_effect=PermissionError("denied")):
+            self.assertIsNone(cache.read(self.config_file), "Permission errors are reported like other readers")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
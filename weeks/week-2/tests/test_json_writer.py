@@ -0,0 +1,153 @@
+"""
+Unit Tests for the Write-Behind JSON Writer - Week 2
+Tests coalescing, explicit and interval flushes, and atomic replacement
+"""
+
+import unittest
+import tempfile
+import json
+import time
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.json_writer import JSONWriteBehind, MAX_WRITE_ATTEMPTS
+from file_handlers.json_handler import read_json_file
+
+class TestJSONWriteBehind(unittest.TestCase):
+    """Test cases for the coalescing background writer"""
+    
+    def setUp(self):
+        """Set up a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_repeated_writes_coalesce(self):
+        """Test that only the latest content per path reaches disk"""
+        status_file = self.temp_path / "nested" / "status.json"
+        with JSONWriteBehind(interval=60) as writer:
+            for step in range(50):
+                writer.write({"step": step}, status_file)
+            self.assertFalse(status_file.exists(), "Nothing is written before a flush")
+            self.assertTrue(writer.flush())
+        
+        self.assertEqual(read_json_file(status_file), {"step": 49})
+        stats = writer.stats()
+        self.assertEqual((stats["writes_requested"], stats["writes_coalesced"], stats["files_written"]), (50, 49, 1))
+    
+    def test_layout_matches_write_json_file(self):
+        """Test that the file has the same indent=2 layout as write_json_file"""
+        status_file = self.temp_path / "status.json"
+        data = {"state": "running", "workers": [1, 2]}
+        with JSONWriteBehind(interval=60) as writer:
+            writer.write(data, status_file)
+        
+        self.assertEqual(status_file.read_text(), json.dumps(data, indent=2))
+        self.assertEqual([path.name for path in self.temp_path.iterdir()], ["status.json"], "No temp files left behind")
+    
+    def test_background_interval_flush(self):
+        """Test that the background thread writes without an explicit flush"""
+        status_file = self.temp_path / "heartbeat.json.gz"
+        writer = JSONWriteBehind(interval=0.05)
+        writer.write({"alive": True}, status_file)
+        
+        deadline = time.monotonic() + 5
+        while not status_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(read_json_file(status_file), {"alive": True}, "Compression follows the real file name")
+        writer.close()
+    
+    def test_close_and_errors(self):
+        """Test that writes after close raise and failures are counted"""
+        blocker = self.temp_path / "file"
+        blocker.write_text("not a directory")
+        writer = JSONWriteBehind(interval=60)
+        writer.write({"a": 1}, blocker / "status.json")
+        
+        self.assertFalse(writer.close(), "A failed file makes close() return False")
+        self.assertEqual(writer.stats()["errors"], 1)
+        with self.assertRaises(ValueError):
+            writer.write({"a": 2}, self.temp_path / "late.json")
+    
+    def test_failed_write_is_retried(self):
+        """Test that content which hit an I/O error stays queued until a later flush succeeds"""
+        blocker = self.temp_path / "logs"
+        blocker.write_text("not a directory yet")
+        with JSONWriteBehind(interval=60) as writer:
+            writer.write({"step": 1}, blocker / "status.json")
+            self.assertFalse(writer.flush())
+            self.assertEqual(writer.stats()["pending"], 1, "The failed content should be kept")
+            
+            blocker.unlink()
+            self.assertTrue(writer.flush())
+        
+        self.assertEqual(read_json_file(blocker / "status.json"), {"step": 1})
+    
+    def test_removed_directory_is_recreated(self):
+        """Test that a directory deleted after the first write is created again on retry"""
+        import shutil
+        status_file = self.temp_path / "run" / "status.json"
+        with JSONWriteBehind(interval=60) as writer:
+            writer.write({"step": 1}, status_file)
+            self.assertTrue(writer.flush())
+            shutil.rmtree(status_file.parent)
+            
+            writer.write({"step": 2}, status_file)
+            writer.flush()
+            self.assertTrue(writer.flush(), "The retry should recreate the directory")
+        
+        self.assertEqual(read_json_file(status_file), {"step": 2})
+    
+    def test_permanent_failure_is_dropped(self):
+        """Test that a path failing on every flush is given up after MAX_WRITE_ATTEMPTS"""
+        blocker = self.temp_path / "file"
+        blocker.write_text("not a directory")
+        with JSONWriteBehind(interval=60) as writer:
+            writer.write({"a": 1}, blocker / "status.json")
+            for _ in range(MAX_WRITE_ATTEMPTS):
+                writer.flush()
+            
+            self.assertEqual(writer.stats()["errors"], MAX_WRITE_ATTEMPTS)
+            self.assertEqual(writer.stats()["pending"], 0, "The content should no longer be retried")
+    
+    def test_writers_use_separate_temp_files(self):
+        """Test that two writers in one process flushing the same path at once both succeed"""
+        from concurrent.futures import ThreadPoolExecutor
+        status_file = self.temp_path / "shared.json"
+        writers = [JSONWriteBehind(interval=60), JSONWriteBehind(interval=60)]
+        
+        def hammer(writer):
+            results = []
+            for step in range(200):
+                writer.write({"step": step, "payload": "x" * 2000}, status_file)
+                results.append(writer.flush())
+            return all(results)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertTrue(all(executor.map(hammer, writers)), "No writer should lose its temp file")
+        for writer in writers:
+            writer.close()
+        self.assertEqual(read_json_file(status_file)["step"], 199)
+    
+    def test_deferred_writes_flushed_at_exit(self):
+        """Test that the shared writer's pending data reaches disk when the interpreter exits"""
+        import subprocess
+        status_file = self.temp_path / "deferred.json"
+        script = ("import sys; sys.path.insert(0, sys.argv[1]); "
+                  "from file_handlers.json_writer import write_json_file_deferred; "
+                  "write_json_file_deferred({'done': True}, sys.argv[2])")
+        subprocess.run([sys.executable, "-c", script, str(src_path), str(status_file)], check=True)
+        
+        self.assertEqual(read_json_file(status_file), {"done": True})
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
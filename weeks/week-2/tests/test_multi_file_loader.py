@@ -0,0 +1,61 @@
+"""
+Unit Tests for the Multi-File CSV Loader - Week 2
+Tests glob expansion, merging, source tagging and load statistics
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import write_csv_from_dicts
+from file_handlers.multi_file_loader import load_csv_files, iter_csv_files, resolve_file_list
+
+class TestMultiFileLoader(unittest.TestCase):
+    """Test cases for loading a directory of daily CSV drops"""
+    
+    def setUp(self):
+        """Write three daily CSV files"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        for day in (1, 2, 3):
+            rows = [{"day": str(day), "salary": str(day * 1000 + i)} for i in range(day)]
+            write_csv_from_dicts(rows, self.temp_path / f"drop-0{day}.csv")
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_glob_expansion_is_sorted(self):
+        """Test that a glob pattern expands to sorted matching files"""
+        files = resolve_file_list(str(self.temp_path / "drop-*.csv"))
+        self.assertEqual([path.name for path in files], ["drop-01.csv", "drop-02.csv", "drop-03.csv"])
+    
+    def test_merged_load_with_source_tags(self):
+        """Test merging in path order with a source column, using a process pool"""
+        stats = {}
+        rows = load_csv_files(str(self.temp_path / "drop-*.csv"), workers=2, source_column="source_file", stats=stats)
+        
+        self.assertEqual([row["day"] for row in rows], ["1", "2", "2", "3", "3", "3"], "Merge should follow file order")
+        self.assertEqual(rows[-1]["source_file"], "drop-03.csv")
+        self.assertEqual(stats["rows"], 6)
+        self.assertEqual(stats["files"], 3)
+        self.assertGreater(stats["rows_per_sec"], 0)
+    
+    def test_completion_order_and_failures(self):
+        """Test the streaming variant with an explicit list containing a missing file"""
+        stats = {}
+        paths = [self.temp_path / "drop-02.csv", self.temp_path / "missing.csv"]
+        loaded = dict(iter_csv_files(paths, workers=1, stats=stats, columns=["salary"]))
+        
+        self.assertEqual(loaded[paths[0]], [{"salary": "2000"}, {"salary": "2001"}], "Reader options should apply")
+        self.assertEqual(stats["failed"], [paths[1]], "Missing file should be reported as failed")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,68 @@
+"""
+Unit Tests for the Parallel CSV Reader - Week 2
+Tests chunk splitting (including quoted newlines) and ordering of read_csv_parallel
+"""
+
+import unittest
+import tempfile
+import mmap
+import csv
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.parallel_reader import read_csv_parallel, find_record_boundaries
+
+class TestParallelReader(unittest.TestCase):
+    """Test cases for the mmap-based parallel CSV reader"""
+    
+    def setUp(self):
+        """Write a CSV whose quoted fields contain newlines, commas and escaped quotes"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "notes.csv"
+        with open(self.csv_file, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["id", "note", "salary"])
+            for i in range(200):
+                note = f'line one\nline "two", {i}' if i % 3 == 0 else f"plain {i}"
+                writer.writerow([i, note, 50000 + i])
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_boundaries_start_at_records(self):
+        """Test that every split point lands on a record start, never inside quotes"""
+        with open(self.csv_file, 'rb') as binary_file, mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = find_record_boundaries(mm, 0, 7)
+            self.assertGreater(len(ranges), 1, "Should split the file into several ranges")
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], len(mm))
+            for start, end in ranges:
+                self.assertEqual(mm[:start].count(b'"') % 2, 0, "Split must not be inside a quoted field")
+    
+    def test_parallel_matches_sequential_reader(self):
+        """Test that parallel parsing returns the same rows, in order, as read_csv_as_dicts"""
+        expected = read_csv_as_dicts(self.csv_file)
+        result = read_csv_parallel(self.csv_file, workers=3, min_chunk_bytes=1)
+        
+        self.assertEqual(result, expected, "Parallel reader should match the sequential reader")
+    
+    def test_small_file_parsed_in_process(self):
+        """Test that files smaller than one chunk still parse correctly"""
+        result = read_csv_parallel(self.csv_file, workers=4)
+        self.assertEqual(len(result), 200, "Should read all records")
+        self.assertEqual(result[3]["note"], 'line one\nline "two", 3', "Quoted newline should survive")
+    
+    def test_read_nonexistent_file(self):
+        """Test reading a file that doesn't exist"""
+        self.assertIsNone(read_csv_parallel(Path(self.temp_dir) / "missing.csv"))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
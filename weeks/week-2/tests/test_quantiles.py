@@ -0,0 +1,91 @@
+"""
+Unit Tests for the Streaming Quantile Sketch - Week 2
+Tests rank accuracy against exact percentiles, merging and bounded memory
+"""
+
+import unittest
+import pickle
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from analyzers.quantiles import QuantileSketch, k_for_rank_error, rank_error_for_k
+from analyzers.csv_analyzer import analyse_csv_columns
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test cases for QuantileSketch"""
+    
+    def setUp(self):
+        """Set up a skewed sample and its sorted copy"""
+        generator = np.random.default_rng(7)
+        self.values = generator.lognormal(mean=11, sigma=0.6, size=50_000)
+        self.sorted_values = np.sort(self.values)
+    
+    def rank_error(self, estimate, q):
+        """Distance between the estimate's true rank and the requested rank, as a fraction of n"""
+        return abs(np.searchsorted(self.sorted_values, estimate) / len(self.sorted_values) - q)
+    
+    def test_quantiles_within_rank_error(self):
+        """Test p50/p90/p99 against np.percentile's ranks"""
+        sketch = QuantileSketch(seed=1).update(self.values)
+        
+        for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            estimate = sketch.quantiles()[name]
+            self.assertLessEqual(self.rank_error(estimate, q), sketch.rank_error, f"{name} outside the error bound")
+        self.assertEqual(sketch.quantile(0), self.sorted_values[0], "The minimum is exact")
+        self.assertEqual(sketch.quantile(1), self.sorted_values[-1], "The maximum is exact")
+    
+    def test_merged_sketches_keep_the_bound(self):
+        """Test that per-chunk sketches merged together stay accurate"""
+        merged = QuantileSketch(seed=0)
+        for index, chunk in enumerate(np.array_split(self.values, 8)):
+            merged.merge(QuantileSketch(seed=index).update(chunk))
+        
+        self.assertEqual(merged.count, len(self.values))
+        self.assertLessEqual(self.rank_error(merged.median, 0.5), merged.rank_error)
+        self.assertLessEqual(self.rank_error(merged.quantile(0.99), 0.99), merged.rank_error)
+    
+    def test_memory_is_bounded(self):
+        """Test that the sketch keeps far fewer values than it has seen"""
+        sketch = QuantileSketch(k=100, seed=3)
+        for chunk in np.array_split(self.values, 50):
+            sketch.update(chunk)
+        self.assertLess(sketch.retained, 500, "Retained values should not grow with n")
+    
+    def test_raw_cells_and_small_inputs(self):
+        """Test CSV-style cells with nulls, exact answers for tiny inputs and pickling"""
+        cells = ["30", "", "10", "NA", None, "20", "abc"]
+        sketch = QuantileSketch().update(cells)
+        
+        self.assertEqual((sketch.count, sketch.null_count, sketch.non_numeric_count), (3, 3, 1))
+        self.assertEqual(sketch.median, 20.0)
+        self.assertIsNone(QuantileSketch().median, "An empty sketch has no median")
+        self.assertEqual(pickle.loads(pickle.dumps(sketch)).quantiles(), sketch.quantiles())
+    
+    def test_epsilon_sizing(self):
+        """Test that epsilon picks a k whose error bound meets it"""
+        k = k_for_rank_error(0.01)
+        self.assertLessEqual(rank_error_for_k(k), 0.01)
+        self.assertEqual(QuantileSketch(epsilon=0.01).k, k)
+        with self.assertRaises(ValueError):
+            QuantileSketch(k=100, epsilon=0.01)
+    
+    def test_analyzer_reports_quantiles(self):
+        """Test median/p90/p99 in the multi-column analysis"""
+        rows = [{"salary": str(value), "name": f"E{value}"} for value in random.Random(5).sample(range(1, 1001), 1000)]
+        report = analyse_csv_columns(rows, ["salary", "name"], quantiles=True)["columns"]
+        
+        self.assertAlmostEqual(report["salary"]["median"], 500, delta=20)
+        self.assertAlmostEqual(report["salary"]["p99"], 990, delta=20)
+        self.assertEqual(report["name"]["median"], "N/A (non-numeric data)")
+        self.assertNotIn("median", analyse_csv_columns(rows)["columns"]["salary"], "Quantiles are opt-in")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,115 @@
+"""
+Unit Tests for Compact Row Types - Week 2
+Tests record/tuple rows returned by read_csv_as_dicts(row_type=...)
+"""
+
+import unittest
+import tempfile
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts, iter_csv_rows, write_csv_from_dicts
+from file_handlers.row_types import make_row_type, column_values
+from analyzers.csv_analyzer import analyse_csv_data
+
+class TestRowTypes(unittest.TestCase):
+    """Test cases for record and tuple rows"""
+    
+    def setUp(self):
+        """Write a small employee CSV"""
+        self.rows = [
+            {"name": "Alice", "first role": "Engineer", "salary": "75000"},
+            {"name": "Bob", "first role": "Designer", "salary": "80000"}
+        ]
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = Path(self.temp_dir) / "employees.csv"
+        write_csv_from_dicts(self.rows, self.csv_file)
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_record_rows(self):
+        """Test key access, attribute access and mutation on __slots__ records"""
+        records = read_csv_as_dicts(self.csv_file, row_type="record")
+        
+        self.assertEqual(records[0]["salary"], "75000")
+        self.assertEqual(records[0].salary, "75000")
+        self.assertEqual(records[1].first_role, "Designer", "Invalid identifiers should be sanitized")
+        self.assertFalse(hasattr(records[0], "__dict__"), "Records should not carry a per-row dict")
+        
+        records[0]["salary"] = "76000"
+        self.assertEqual(records[0].salary, "76000")
+        self.assertEqual(records[1], self.rows[1], "Records should compare equal to dicts")
+    
+    def test_tuple_rows(self):
+        """Test tuple rows with a shared header"""
+        rows = list(iter_csv_rows(self.csv_file, row_type="tuple"))
+        
+        self.assertIsInstance(rows[0], tuple)
+        self.assertEqual(rows[0], ("Alice", "Engineer", "75000"))
+        self.assertEqual(rows[0]["name"], "Alice")
+        self.assertEqual(rows[0][2], "75000", "Integer indexing should still work")
+        self.assertEqual(rows[1].to_dict(), self.rows[1])
+        self.assertIs(type(rows[0]), type(rows[1]), "Rows should share one class per header")
+    
+    def test_projection_and_interning_with_records(self):
+        """Test that row types combine with columns= and intern_columns="""
+        records = read_csv_as_dicts(self.csv_file, columns=["salary"], row_type="tuple", intern_columns=["salary"])
+        self.assertEqual([row.keys() for row in records], [["salary"], ["salary"]])
+    
+    def test_analyzer_accepts_records(self):
+        """Test that the analyzer works unchanged on compact rows"""
+        records = read_csv_as_dicts(self.csv_file, row_type="record")
+        self.assertEqual(analyse_csv_data(records, "salary"), analyse_csv_data(self.rows, "salary"))
+    
+    def test_columns_named_like_row_methods(self):
+        """Test that columns called keys/get/_fields do not hide the mapping API"""
+        rows = [{"keys": "k", "get": "g", "_fields": "f", "price": "10"}, {"keys": "k2", "get": "g2", "_fields": "f2", "price": "20"}]
+        write_csv_from_dicts(rows, self.csv_file)
+        
+        for row_type in ("record", "tuple"):
+            records = read_csv_as_dicts(self.csv_file, row_type=row_type)
+            self.assertEqual(records[0].keys(), ["keys", "get", "_fields", "price"], f"{row_type}: keys() still works")
+            self.assertEqual(records[0].get("keys"), "k")
+            self.assertEqual((records[0]["_fields"], records[0].keys_, records[0].get_), ("f", "k", "g"))
+            self.assertEqual(analyse_csv_data(records, "price")["mean"], 15.0)
+    
+    def test_equality_is_consistent_across_row_types(self):
+        """Test that records and tuples both equal the matching dict (and tuples a plain tuple)"""
+        records = read_csv_as_dicts(self.csv_file, row_type="record")
+        tuples = read_csv_as_dicts(self.csv_file, row_type="tuple")
+        
+        for rows in (records, tuples):
+            self.assertEqual(rows, self.rows, "Compact rows should compare equal to dicts")
+            self.assertFalse(rows[0] != self.rows[0])
+            self.assertNotEqual(rows[0], self.rows[1])
+        self.assertEqual(records[0], tuples[0], "A record and a tuple with the same columns are equal")
+        self.assertEqual(tuples[0], ("Alice", "Engineer", "75000"))
+        self.assertEqual(len({tuples[0], tuples[1]}), 2, "Tuple rows stay hashable")
+    
+    def test_keyword_headers_and_column_values(self):
+        """Test that keyword headers get a usable attribute and column_values reads every row type"""
+        write_csv_from_dicts([{"class": "A", "salary": "1"}, {"class": "B", "salary": "2"}], self.csv_file)
+        
+        for row_type in ("dict", "record", "tuple"):
+            rows = read_csv_as_dicts(self.csv_file, row_type=row_type)
+            self.assertEqual(column_values(rows, "class"), ["A", "B"], row_type)
+            if row_type != "dict":
+                self.assertEqual(rows[1].class_, "B", "Keywords get a trailing '_'")
+        self.assertEqual(column_values([], "class"), [])
+    
+    def test_unknown_row_type(self):
+        """Test that an unknown row_type is reported"""
+        self.assertIsNone(read_csv_as_dicts(self.csv_file, row_type="frozenset"))
+        with self.assertRaises(ValueError):
+            make_row_type(("a",), "frozenset")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
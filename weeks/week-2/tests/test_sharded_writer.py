@@ -0,0 +1,92 @@
+"""
+Unit Tests for the Sharded CSV Writer - Week 2
+Tests part files, manifest and shard concatenation
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from file_handlers.csv_handler import read_csv_as_dicts
+from file_handlers.json_handler import read_json_file
+from file_handlers.sharded_writer import write_csv_sharded, concat_csv_shards, MANIFEST_NAME
+
+class TestShardedWriter(unittest.TestCase):
+    """Test cases for write_csv_sharded"""
+    
+    def setUp(self):
+        """Set up test rows and a temporary output directory"""
+        self.rows = [{"id": str(i), "note": f"row, {i}", "salary": str(50000 + i)} for i in range(103)]
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir) / "shards"
+    
+    def tearDown(self):
+        """Clean up temporary files after tests"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_parts_preserve_order(self):
+        """Test that reading the parts in name order gives back every row in order"""
+        paths = write_csv_sharded(self.rows, self.output_dir, shards=4)
+        
+        self.assertEqual([path.name for path in paths], [f"part-0000{i}.csv" for i in range(4)])
+        combined = [row for path in paths for row in read_csv_as_dicts(path)]
+        self.assertEqual(combined, self.rows, "Shards should be contiguous slices")
+    
+    def test_manifest_records_shards(self):
+        """Test that the manifest lists every part with its row count"""
+        write_csv_sharded(iter(self.rows), self.output_dir, shards=3)
+        manifest = read_json_file(self.output_dir / MANIFEST_NAME)
+        
+        self.assertEqual(manifest["total_rows"], 103)
+        self.assertEqual([shard["rows"] for shard in manifest["shards"]], [34, 34, 35])
+        self.assertEqual(manifest["fieldnames"], ["id", "note", "salary"])
+    
+    def test_rewrite_removes_stale_parts(self):
+        """Test that a rerun with fewer shards leaves only the new parts and manifest"""
+        write_csv_sharded(self.rows, self.output_dir, shards=4)
+        write_csv_sharded(self.rows[:10], self.output_dir, shards=2)
+        
+        self.assertEqual(sorted(path.name for path in self.output_dir.glob("part-*.csv")), ["part-00000.csv", "part-00001.csv"])
+        self.assertEqual(read_json_file(self.output_dir / MANIFEST_NAME)["total_rows"], 10)
+    
+    def test_concurrent_calls_keep_their_rows(self):
+        """Test that two threads sharding different data at once do not see each other's rows"""
+        from concurrent.futures import ThreadPoolExecutor
+        other_rows = [{"id": f"other-{i}", "note": "x", "salary": "1"} for i in range(57)]
+        jobs = [(self.rows, Path(self.temp_dir) / "first"), (other_rows, Path(self.temp_dir) / "second")]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda job: write_csv_sharded(job[0], job[1], shards=3), jobs))
+        
+        for (rows, _), paths in zip(jobs, results):
+            self.assertEqual([row for path in paths for row in read_csv_as_dicts(path)], rows)
+    
+    def test_concat_to_single_file(self):
+        """Test merging the parts into one file with a single header"""
+        merged = Path(self.temp_dir) / "merged.csv"
+        result = write_csv_sharded(self.rows, self.output_dir, shards=3, concat_to=merged)
+        
+        self.assertEqual(result, [merged])
+        self.assertEqual(merged.read_text().count("id,note,salary"), 1, "Header should appear once")
+        self.assertEqual(read_csv_as_dicts(merged), self.rows)
+        self.assertEqual(list(self.output_dir.glob("part-*.csv")), [], "Parts should be removed")
+    
+    def test_concat_rejects_mismatched_headers(self):
+        """Test that shards with different headers are not merged"""
+        first = write_csv_sharded(self.rows[:2], Path(self.temp_dir) / "a", shards=1)
+        second = write_csv_sharded([{"other": "x"}], Path(self.temp_dir) / "b", shards=1)
+        
+        self.assertFalse(concat_csv_shards(first + second, Path(self.temp_dir) / "bad.csv"))
+    
+    def test_empty_data_without_fieldnames(self):
+        """Test that empty input without fieldnames is reported as an error"""
+        self.assertIsNone(write_csv_sharded([], self.output_dir))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Streaming Statistics - Week 2
+Tests the mergeable Welford accumulator against exact computations
+"""
+
+import unittest
+import pickle
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+current_dir = Path(__file__).parent
+src_path = current_dir.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from analyzers.stats import RunningStats
+from analyzers.csv_analyzer import analyse_csv_data
+
+class TestRunningStats(unittest.TestCase):
+    """Test cases for RunningStats"""
+    
+    def setUp(self):
+        """Set up raw salary cells with nulls"""
+        self.cells = ["75000", "", "80000", "NA", None, "90000", "85000.5", "62000"]
+        self.numbers = [75000.0, 80000.0, 90000.0, 85000.5, 62000.0]
+    
+    def test_matches_exact_statistics(self):
+        """Test count, mean, variance, min, max and null count against the statistics module"""
+        stats = RunningStats(self.cells)
+        
+        self.assertEqual(stats.count, 5)
+        self.assertEqual(stats.null_count, 3, "'', 'NA' and None are nulls")
+        self.assertAlmostEqual(stats.mean, statistics.fmean(self.numbers))
+        self.assertAlmostEqual(stats.variance, statistics.variance(self.numbers), places=4)
+        self.assertAlmostEqual(stats.population_variance, statistics.pvariance(self.numbers), places=4)
+        self.assertAlmostEqual(stats.std, statistics.stdev(self.numbers), places=6)
+        self.assertEqual((stats.min, stats.max), (62000.0, 90000.0))
+    
+    def test_merge_equals_single_pass(self):
+        """Test that merging per-chunk accumulators equals one accumulator over all values"""
+        whole = RunningStats(self.cells)
+        parts = [RunningStats(self.cells[i:i + 3]) for i in range(0, len(self.cells), 3)]
+        merged = RunningStats()
+        for part in parts:
+            merged.merge(part)
+        
+        self.assertEqual((merged.count, merged.null_count, merged.min, merged.max),
+                         (whole.count, whole.null_count, whole.min, whole.max))
+        self.assertAlmostEqual(merged.mean, whole.mean)
+        self.assertAlmostEqual(merged.variance, whole.variance, places=4)
+        self.assertAlmostEqual((parts[0] + parts[1] + parts[2]).mean, whole.mean, msg="+ should merge too")
+    
+    def test_numerical_stability_with_large_offset(self):
+        """Test that a huge common offset does not destroy the variance"""
+        values = [1e9 + offset for offset in (4.0, 7.0, 13.0, 16.0)] * 1000
+        stats = RunningStats()
+        for i in range(0, len(values), 7):
+            stats.update(values[i:i + 7])
+        
+        self.assertAlmostEqual(stats.variance, 90000 / 3999, places=6)
+    
+    def test_total_is_compensated_across_batches(self):
+        """Test that small batches added to a large total are not rounded away"""
+        stats = RunningStats([1e16])
+        for _ in range(10):
+            stats.update([1.0])
+        merged = RunningStats([1e16]).merge(RunningStats([1.0] * 10))
+        
+        self.assertEqual(stats.total, 1e16 + 10, "Plain float addition would stay at 1e16")
+        self.assertEqual(merged.to_dict()["sum"], 1e16 + 10)
+    
+    def test_numpy_and_masked_arrays(self):
+        """Test the vectorized path for float arrays with NaN and masked cells"""
+        array = np.ma.MaskedArray([75000.0, np.nan, 80000.0, 1.0], mask=[False, False, False, True])
+        stats = RunningStats(array)
+        
+        self.assertEqual((stats.count, stats.null_count), (2, 2))
+        self.assertEqual(stats.mean, 77500.0)
+        
+        values = [1e16, 1.0, -1e16, 1.0]
+        self.assertEqual(RunningStats(np.array(values)).total, RunningStats(values).total,
+                         "Arrays should be summed exactly like lists")
+        self.assertEqual(RunningStats(np.array(values)).total, 2.0)
+    
+    def test_analysis_output_and_pickling(self):
+        """Test analyse_csv_data-compatible output and that accumulators survive a process boundary"""
+        rows = [{"salary": cell} for cell in self.cells]
+        expected = analyse_csv_data(rows, "salary")
+        analysis = RunningStats(self.cells).to_analysis()
+        
+        self.assertEqual(analysis["non_null_count"], expected["non_null_count"])
+        self.assertEqual((analysis["min"], analysis["max"]), (expected["min"], expected["max"]))
+        self.assertAlmostEqual(analysis["mean"], expected["mean"])
+        self.assertEqual(RunningStats(["x", "1"]).to_analysis()["mean"], "N/A (non-numeric data)")
+        self.assertEqual(RunningStats(["", None]).to_analysis()["mean"], "N/A (no non-null values)")
+        
+        restored = pickle.loads(pickle.dumps(RunningStats(self.cells)))
+        self.assertEqual(restored.to_dict(), RunningStats(self.cells).to_dict())
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)